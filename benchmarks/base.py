@@ -0,0 +1,133 @@
+import gc
+import inspect
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+BenchmarkCallable = Callable[[], Union[None, Awaitable[None]]]
+BenchmarkFactory = Callable[[], Union[BenchmarkCallable, Awaitable[BenchmarkCallable]]]
+
+MIN_ROUND_TIME = 0.05
+
+
+@dataclass
+class BenchmarkDefinition:
+    name: str
+    group: str
+    factory: BenchmarkFactory
+    description: str
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    group: str
+    description: str
+    rounds: int
+    iterations: int
+    min: float
+    max: float
+    mean: float
+    median: float
+    stddev: float
+    ops: float
+
+    def to_json(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+_registry: Dict[str, BenchmarkDefinition] = {}
+
+
+def benchmark(
+    group: str, name: Optional[str] = None
+) -> Callable[[BenchmarkFactory], BenchmarkFactory]:
+    """Register benchmark factory.
+
+    Factory (sync or async) prepares all the data needed by the benchmark and returns the (sync or
+    async) callable to be measured. Only the returned callable is timed, setup cost is excluded.
+    """
+
+    def _wrapper(factory: BenchmarkFactory) -> BenchmarkFactory:
+        benchmark_name = f"{group}.{name or factory.__name__}"
+        if benchmark_name in _registry:
+            raise ValueError(f"Benchmark `{benchmark_name}` is already registered!")
+
+        _registry[benchmark_name] = BenchmarkDefinition(
+            name=benchmark_name,
+            group=group,
+            factory=factory,
+            description=inspect.getdoc(factory) or "",
+        )
+        return factory
+
+    return _wrapper
+
+
+def get_benchmarks(filters: Optional[List[str]] = None) -> List[BenchmarkDefinition]:
+    return [
+        definition
+        for name, definition in sorted(_registry.items())
+        if not filters or any(f in name for f in filters)
+    ]
+
+
+async def run_benchmark(
+    definition: BenchmarkDefinition, rounds: int = 10, min_round_time: float = MIN_ROUND_TIME
+) -> BenchmarkResult:
+    """Measure given benchmark.
+
+    Number of iterations per round is calibrated, so a single round takes at least
+    `min_round_time` seconds. Reported times are per single iteration, in seconds.
+    """
+
+    func = definition.factory()
+    if inspect.isawaitable(func):
+        func = await func
+
+    is_async = inspect.iscoroutinefunction(func)
+
+    async def _measure(iterations: int) -> float:
+        start = time.perf_counter()
+        if is_async:
+            for _ in range(iterations):
+                await func()  # type: ignore[misc]
+        else:
+            for _ in range(iterations):
+                func()
+        return time.perf_counter() - start
+
+    #   Warmup and calibration
+    iterations = 1
+    while True:
+        elapsed = await _measure(iterations)
+        if min_round_time <= elapsed or 1_000_000 <= iterations:
+            break
+        iterations *= 2 if elapsed * 2 >= min_round_time else 10
+
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            timings.append(await _measure(iterations) / iterations)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    mean = statistics.mean(timings)
+    return BenchmarkResult(
+        name=definition.name,
+        group=definition.group,
+        description=definition.description,
+        rounds=rounds,
+        iterations=iterations,
+        min=min(timings),
+        max=max(timings),
+        mean=mean,
+        median=statistics.median(timings),
+        stddev=statistics.stdev(timings) if 1 < len(timings) else 0.0,
+        ops=1 / mean if mean else 0.0,
+    )
@@ -0,0 +1,121 @@
+import asyncio
+from datetime import timedelta
+
+from benchmarks.base import benchmark
+from benchmarks.data import BUFFER_ITEM_COUNT
+from golem.utils.asyncio.buffer import ExpirableBuffer, SimpleBuffer
+
+
+@benchmark("buffer")
+def simple_buffer_put_get():
+    """Put and get one by one 1000 items in `SimpleBuffer`."""
+    items = list(range(BUFFER_ITEM_COUNT))
+
+    async def _run() -> None:
+        buffer: SimpleBuffer[int] = SimpleBuffer()
+        for item in items:
+            await buffer.put(item)
+        for _ in items:
+            await buffer.get()
+
+    return _run
+
+
+@benchmark("buffer")
+def simple_buffer_remove():
+    """Remove 1000 items from the middle of `SimpleBuffer`."""
+    items = [object() for _ in range(BUFFER_ITEM_COUNT)]
+    removal_order = items[len(items) // 2 :] + items[: len(items) // 2]
+
+    async def _run() -> None:
+        buffer: SimpleBuffer[object] = SimpleBuffer(items)
+        for item in removal_order:
+            await buffer.remove(item)
+
+    return _run
+
+
+@benchmark("buffer")
+def simple_buffer_remove_10k():
+    """Remove 10k items from the middle of `SimpleBuffer`."""
+    items = [object() for _ in range(10 * BUFFER_ITEM_COUNT)]
+    removal_order = items[len(items) // 2 :] + items[: len(items) // 2]
+
+    async def _run() -> None:
+        buffer: SimpleBuffer[object] = SimpleBuffer(items)
+        for item in removal_order:
+            await buffer.remove(item)
+
+    return _run
+
+
+@benchmark("buffer")
+def expirable_buffer_put_get():
+    """Put and get one by one 1000 items in `ExpirableBuffer` with long expiration."""
+    items = [object() for _ in range(BUFFER_ITEM_COUNT)]
+
+    async def _run() -> None:
+        buffer: ExpirableBuffer[object] = ExpirableBuffer(
+            SimpleBuffer(), lambda _: timedelta(minutes=5)
+        )
+        for item in items:
+            await buffer.put(item)
+        for _ in items:
+            await buffer.get()
+
+    return _run
+
+
+@benchmark("buffer")
+def expirable_buffer_put_remove():
+    """Put 1000 items in `ExpirableBuffer` and remove them in reversed order."""
+    items = [object() for _ in range(BUFFER_ITEM_COUNT)]
+
+    async def _run() -> None:
+        buffer: ExpirableBuffer[object] = ExpirableBuffer(
+            SimpleBuffer(), lambda _: timedelta(minutes=5)
+        )
+        for item in items:
+            await buffer.put(item)
+        for item in reversed(items):
+            await buffer.remove(item)
+
+    return _run
+
+
+@benchmark("buffer")
+def expirable_buffer_put_all_10k():
+    """Replace 10k items in `ExpirableBuffer` three times, like in subsequent scoring rounds."""
+    items = [object() for _ in range(10 * BUFFER_ITEM_COUNT)]
+
+    async def _run() -> None:
+        buffer: ExpirableBuffer[object] = ExpirableBuffer(
+            SimpleBuffer(), lambda _: timedelta(minutes=5)
+        )
+        for _ in range(3):
+            await buffer.put_all(items)
+        await buffer.get_all()
+
+    return _run
+
+
+@benchmark("buffer")
+def expirable_buffer_expire_10k():
+    """Put one by one 10k items in `ExpirableBuffer` and wait until all of them expire."""
+    items = [object() for _ in range(10 * BUFFER_ITEM_COUNT)]
+
+    async def _run() -> None:
+        all_expired = asyncio.Event()
+
+        def _on_expired(_: object) -> None:
+            if not buffer.size():
+                all_expired.set()
+
+        buffer: ExpirableBuffer[object] = ExpirableBuffer(
+            SimpleBuffer(), lambda _: timedelta(), _on_expired
+        )
+        for item in items:
+            await buffer.put(item)
+        await all_expired.wait()
+
+    return _run
@@ -0,0 +1,56 @@
+import asyncio
+
+from benchmarks.base import benchmark
+from benchmarks.data import EVENT_COUNT
+from golem.event_bus import Event
+from golem.event_bus.in_memory import InMemoryEventBus
+
+SUBSCRIBER_COUNT = 20
+
+
+class BenchmarkEvent(Event):
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+
+class OtherBenchmarkEvent(Event):
+    pass
+
+
+class EndOfBenchmarkEvent(Event):
+    pass
+
+
+@benchmark("event_bus")
+async def in_memory_emit_and_dispatch():
+    """Emit 1000 events to `InMemoryEventBus` with 20 filtered subscribers and wait until all \
+    are dispatched."""
+    event_bus = InMemoryEventBus()
+    await event_bus.start()
+
+    async def _callback(event: Event) -> None:
+        pass
+
+    for index in range(SUBSCRIBER_COUNT):
+        await event_bus.on(
+            BenchmarkEvent, _callback, lambda e, index=index: e.value % SUBSCRIBER_COUNT == index
+        )
+        await event_bus.on(OtherBenchmarkEvent, _callback)
+
+    events = [BenchmarkEvent(value) for value in range(EVENT_COUNT)]
+
+    async def _run() -> None:
+        finished = asyncio.Event()
+
+        async def _on_end(event: EndOfBenchmarkEvent) -> None:
+            finished.set()
+
+        await event_bus.on_once(EndOfBenchmarkEvent, _on_end)
+
+        for event in events:
+            await event_bus.emit(event)
+        await event_bus.emit(EndOfBenchmarkEvent())
+
+        await finished.wait()
+
+    return _run
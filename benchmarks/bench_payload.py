@@ -0,0 +1,103 @@
+from copy import deepcopy
+
+from benchmarks.base import benchmark
+from benchmarks.data import demand_constraints, offer_constraints, offer_properties
+from golem.payload import PayloadSyntaxParser, Properties
+
+
+@benchmark("payload")
+def parse_offer_constraints():
+    """Parse constraints of 1000 offers."""
+    parser = PayloadSyntaxParser.get_instance()
+    constraints = offer_constraints()
+
+    def _run() -> None:
+        for syntax in constraints:
+            parser.parse_constraints(syntax)
+
+    return _run
+
+
+@benchmark("payload")
+def parse_offer_constraints_uncached():
+    """Parse constraints of 1000 offers with hand-written parser only."""
+    parser = PayloadSyntaxParser(cache_size=0)
+    constraints = offer_constraints()
+
+    def _run() -> None:
+        for syntax in constraints:
+            parser.parse_constraints(syntax)
+
+    return _run
+
+
+@benchmark("payload")
+def parse_offer_constraints_textx():
+    """Parse constraints of 1000 offers with textX only, for reference."""
+    parser = PayloadSyntaxParser(cache_size=0)
+    constraints = offer_constraints()
+
+    def _run() -> None:
+        for syntax in constraints:
+            parser._parse_with_textx(syntax)
+
+    return _run
+
+
+@benchmark("payload")
+def parse_demand_constraints():
+    """Parse typical demand constraints."""
+    parser = PayloadSyntaxParser(cache_size=0)
+    syntax = demand_constraints().serialize()
+
+    def _run() -> None:
+        parser.parse_constraints(syntax)
+
+    return _run
+
+
+@benchmark("payload")
+def properties_from_offers():
+    """Create `Properties` from properties of 1000 offers."""
+    properties = offer_properties()
+
+    def _run() -> None:
+        for props in properties:
+            Properties(props)
+
+    return _run
+
+
+@benchmark("payload")
+def properties_deepcopy():
+    """Deep copy `Properties` of 1000 offers, like negotiation does with demand data."""
+    properties = [Properties(props) for props in offer_properties()]
+
+    def _run() -> None:
+        for props in properties:
+            deepcopy(props)
+
+    return _run
+
+
+@benchmark("payload")
+def properties_serialize():
+    """Serialize `Properties` of 1000 offers."""
+    properties = [Properties(props) for props in offer_properties()]
+
+    def _run() -> None:
+        for props in properties:
+            props.serialize()
+
+    return _run
+
+
+@benchmark("payload")
+def constraints_serialize():
+    """Serialize typical demand constraints."""
+    constraints = demand_constraints()
+
+    def _run() -> None:
+        constraints.serialize()
+
+    return _run
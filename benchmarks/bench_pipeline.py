@@ -0,0 +1,53 @@
+from typing import AsyncIterator
+
+from benchmarks.base import benchmark
+from golem.pipeline import Buffer, Chain, Limit, Map, Zip
+
+ELEMENT_COUNT = 1000
+
+
+async def _source() -> AsyncIterator[int]:
+    for element in range(ELEMENT_COUNT):
+        yield element
+
+
+async def _identity(element: int) -> int:
+    return element
+
+
+async def _add(*elements: int) -> int:
+    #   `Map` passes zipped elements unpacked
+    return sum(elements)
+
+
+@benchmark("pipeline")
+def map_chain():
+    """Pass 1000 elements through a chain of three `Map` stages."""
+
+    async def _run() -> None:
+        async for _ in Chain(_source(), Map(_identity), Map(_identity), Map(_identity), Buffer()):
+            pass
+
+    return _run
+
+
+@benchmark("pipeline")
+def buffered_map_chain():
+    """Pass 1000 elements through `Map` stages separated with `Buffer`."""
+
+    async def _run() -> None:
+        async for _ in Chain(_source(), Map(_identity), Buffer(10), Map(_identity), Buffer(10)):
+            pass
+
+    return _run
+
+
+@benchmark("pipeline")
+def limit_zip_chain():
+    """Pass 1000 elements through `Limit`, `Zip` and `Map` stages."""
+
+    async def _run() -> None:
+        async for _ in Chain(_source(), Limit(ELEMENT_COUNT), Zip(_source()), Map(_add), Buffer()):
+            pass
+
+    return _run
@@ -0,0 +1,71 @@
+from datetime import timedelta
+from typing import List, cast
+
+from benchmarks.base import benchmark
+from benchmarks.data import yagna_proposals
+from golem.managers import (
+    LinearAverageCostPricing,
+    MapScore,
+    PropertyValueLerpScore,
+    ProposalScoringMixin,
+)
+from golem.node import GolemNode
+from golem.payload import defaults
+from golem.resources import Proposal
+
+
+class BenchmarkProposalScorer(ProposalScoringMixin):
+    ...
+
+
+def _scorer() -> BenchmarkProposalScorer:
+    return BenchmarkProposalScorer(
+        proposal_scorers=(
+            (0.5, PropertyValueLerpScore(defaults.PROP_INF_MEM, zero_at=1, one_at=32)),
+            (
+                1.0,
+                MapScore(
+                    LinearAverageCostPricing(
+                        average_cpu_load=1, average_duration=timedelta(seconds=60)
+                    ),
+                    normalize=True,
+                    normalize_flip=True,
+                ),
+            ),
+        )
+    )
+
+
+async def _proposals() -> List[Proposal]:
+    """Return proposals with already fetched data, so no API calls are made."""
+    golem = GolemNode(app_key="benchmark")
+    await golem.event_bus.start()
+
+    return [Proposal(golem, cast(str, data.proposal_id), data) for data in yagna_proposals()]
+
+
+@benchmark("scoring")
+async def do_scoring():
+    """Score 1000 proposals with memory and linear pricing scorers."""
+    scorer = _scorer()
+    proposals = await _proposals()
+
+    async def _run() -> None:
+        await scorer.do_scoring(proposals)
+
+    return _run
+
+
+@benchmark("scoring")
+async def do_scoring_uncached():
+    """Score 1000 proposals seen for the first time, including their constraints parsing."""
+    scorer = _scorer()
+    proposals = await _proposals()
+
+    async def _run() -> None:
+        for proposal in proposals:
+            proposal._proposal_data = None
+
+        await scorer.do_scoring(proposals)
+
+    return _run
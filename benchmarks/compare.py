@@ -0,0 +1,77 @@
+"""Compare benchmark results with stored baseline.
+
+Usage::
+
+    python -m benchmarks.compare .benchmarks/baseline.json .benchmarks/current.json
+
+Exits with non-zero status if any benchmark is slower than baseline by more than given threshold.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_THRESHOLD = 0.1
+
+
+def _load(path: Path) -> Dict[str, Dict]:
+    return {result["name"]: result for result in json.loads(path.read_text())["benchmarks"]}
+
+
+def compare(
+    baseline: Dict[str, Dict], current: Dict[str, Dict], threshold: float = DEFAULT_THRESHOLD
+) -> Tuple[List[str], List[str]]:
+    """Return report lines and names of benchmarks that regressed more than `threshold`."""
+    lines = [f"{'benchmark':<50} {'baseline [ms]':>14} {'current [ms]':>14} {'change':>9}"]
+    regressions = []
+
+    for name in sorted(baseline.keys() | current.keys()):
+        if name not in current:
+            lines.append(f"{name:<50} {baseline[name]['median'] * 1000:>14.4f} {'-':>14} {'-':>9}")
+            continue
+
+        if name not in baseline:
+            lines.append(f"{name:<50} {'-':>14} {current[name]['median'] * 1000:>14.4f} {'-':>9}")
+            continue
+
+        baseline_median = baseline[name]["median"]
+        current_median = current[name]["median"]
+        change = (current_median - baseline_median) / baseline_median
+
+        marker = ""
+        if threshold < change:
+            marker = " !"
+            regressions.append(name)
+
+        lines.append(
+            f"{name:<50} {baseline_median * 1000:>14.4f} {current_median * 1000:>14.4f}"
+            f" {change:>+9.1%}{marker}"
+        )
+
+    return lines, regressions
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path, help="Path to JSON file with baseline results")
+    parser.add_argument("current", type=Path, help="Path to JSON file with current results")
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative slowdown of median time, e.g. 0.1 for 10%%",
+    )
+    args = parser.parse_args(argv)
+
+    lines, regressions = compare(_load(args.baseline), _load(args.current), args.threshold)
+    print("\n".join(lines))
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
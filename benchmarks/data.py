@@ -0,0 +1,67 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from ya_market.models import Proposal as yaProposal
+
+from golem.payload import Constraint, ConstraintGroup, Constraints, defaults
+from tests.simulator import generate_providers
+
+#   Sizes observed on the public subnet
+PROPOSAL_COUNT = 1000
+BUFFER_ITEM_COUNT = 1000
+EVENT_COUNT = 1000
+
+PAYMENT_PLATFORM = "erc20-holesky-tglm"
+SEED = 42
+
+
+def offer_properties(count: int = PROPOSAL_COUNT) -> List[Dict[str, Any]]:
+    return [
+        provider.offer_properties(PAYMENT_PLATFORM)
+        for provider in generate_providers(count, seed=SEED)
+    ]
+
+
+def offer_constraints(count: int = PROPOSAL_COUNT) -> List[str]:
+    return [provider.offer_constraints() for provider in generate_providers(count, seed=SEED)]
+
+
+def yagna_proposals(count: int = PROPOSAL_COUNT) -> List[yaProposal]:
+    timestamp = datetime.now(timezone.utc)
+    return [
+        yaProposal(
+            proposal_id=f"R-{index:064x}",
+            issuer_id=provider.provider_id,
+            state="Initial",
+            #   According to ya_client spec, this should be ya_market.models.Timestamp
+            timestamp=timestamp,  # type: ignore[arg-type]
+            constraints=provider.offer_constraints(),
+            properties=provider.offer_properties(PAYMENT_PLATFORM),
+        )
+        for index, provider in enumerate(generate_providers(count, seed=SEED))
+    ]
+
+
+def demand_constraints() -> Constraints:
+    """Return constraints similar to the ones of the `VmPayload` demand with manifest."""
+    platform_address = f"golem.com.payment.platform.{PAYMENT_PLATFORM}.address"
+
+    return Constraints(
+        [
+            Constraint(defaults.PROP_RUNTIME_NAME, "=", "vm"),
+            Constraint(defaults.PROP_INF_MEM, ">=", 0.5),
+            Constraint(defaults.PROP_INF_STORAGE, ">=", 2.0),
+            Constraint(defaults.PROP_INF_CPU_THREADS, ">=", 1),
+            Constraint("golem.runtime.capabilities", "=", ["vpn", "inet", "manifest-support"]),
+            Constraint("golem.node.debug.subnet", "=", defaults.DEFAULT_SUBNET),
+            Constraint(platform_address, "=", "*"),
+            Constraint("golem.com.payment.protocol.version", ">", 1),
+            ConstraintGroup(
+                [
+                    Constraint("golem.srv.caps.multi-activity", "=", True),
+                    ConstraintGroup([Constraint("golem.node.net.is-public", "=", True)], "!"),
+                ],
+                "|",
+            ),
+        ]
+    )
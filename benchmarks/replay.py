@@ -0,0 +1,138 @@
+"""Record a market session to the first agreement and measure its replay.
+
+Usage::
+
+    # Record session against local yagna (requires `YAGNA_APPKEY`)
+    python -m benchmarks.replay record .benchmarks/session.jsonl.gz
+
+    # Record session against in-process yagna simulator
+    python -m benchmarks.replay record .benchmarks/session.jsonl.gz --simulator
+
+    # Replay session with recorded timings scaled by 0.5
+    python -m benchmarks.replay replay .benchmarks/session.jsonl.gz --time-scale 0.5
+"""
+import argparse
+import asyncio
+import json
+import time
+from contextlib import AsyncExitStack
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from golem.managers import (
+    DefaultAgreementManager,
+    DefaultPaymentManager,
+    DefaultProposalManager,
+    NegotiatingPlugin,
+    PaymentPlatformNegotiator,
+    RefreshingDemandManager,
+)
+from golem.node import GolemNode
+from golem.payload import VmPayload
+from golem.utils.low import ApiRecorder
+from golem.utils.low.replay import ApiReplayServer
+
+PAYLOAD = VmPayload("9a3b5d67b0b27746283cb5f287c13eab1beaa12d92a9f536b747c7ae")
+
+
+async def run_to_first_agreement(golem: GolemNode) -> Dict[str, float]:
+    """Run default managers stack until first agreement is approved.
+
+    Return time to first agreement and CPU time used by the process in seconds.
+    """
+    payment_manager = DefaultPaymentManager(golem, budget=1.0)
+    demand_manager = RefreshingDemandManager(golem, payment_manager.get_allocation, [PAYLOAD])
+    proposal_manager = DefaultProposalManager(
+        golem,
+        demand_manager.get_initial_proposal,
+        plugins=[NegotiatingPlugin(proposal_negotiators=[PaymentPlatformNegotiator()])],
+    )
+    agreement_manager = DefaultAgreementManager(golem, proposal_manager.get_draft_proposal)
+
+    async with golem:
+        async with AsyncExitStack() as stack:
+            for manager in (payment_manager, demand_manager, proposal_manager, agreement_manager):
+                await stack.enter_async_context(manager)
+
+            start_time = time.monotonic()
+            start_cpu_time = time.process_time()
+
+            agreement = await agreement_manager.get_agreement()
+
+            result = {
+                "time_to_first_agreement": time.monotonic() - start_time,
+                "cpu_time": time.process_time() - start_cpu_time,
+            }
+
+            await agreement.terminate()
+
+    return result
+
+
+async def record(path: Path, simulator: bool) -> Dict[str, Any]:
+    with ApiRecorder(path) as recorder:
+        if not simulator:
+            result = await run_to_first_agreement(GolemNode(api_recorder=recorder))
+        else:
+            from tests.simulator import SimulatorConfig, YagnaSimulator, generate_providers
+
+            config = SimulatorConfig(
+                providers=generate_providers(100, seed=1),
+                negotiation_delay=timedelta(milliseconds=100),
+                agreement_approval_delay=timedelta(milliseconds=200),
+                latency=timedelta(milliseconds=5),
+                seed=1,
+            )
+            async with YagnaSimulator(config) as yagna:
+                result = await run_to_first_agreement(yagna.create_node(api_recorder=recorder))
+
+    return {**result, "exchanges": recorder.exchanges_count}
+
+
+async def replay(path: Path, time_scale: float) -> Dict[str, Any]:
+    async with ApiReplayServer(path, time_scale=time_scale) as server:
+        result = await run_to_first_agreement(server.create_node())
+
+    return {
+        **result,
+        "replayed": server.stats.replayed,
+        "exhausted": server.stats.exhausted,
+        "missing": server.stats.missing,
+        "out_of_sync": server.stats.out_of_sync,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Record session")
+    record_parser.add_argument("path", type=Path, help="Path to the recording file")
+    record_parser.add_argument(
+        "--simulator", action="store_true", help="Record against in-process yagna simulator"
+    )
+
+    replay_parser = subparsers.add_parser("replay", help="Replay recorded session")
+    replay_parser.add_argument("path", type=Path, help="Path to the recording file")
+    replay_parser.add_argument(
+        "-t",
+        "--time-scale",
+        type=float,
+        default=1.0,
+        help="Multiplier of recorded response times, 0 replays as fast as possible",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        args.path.parent.mkdir(parents=True, exist_ok=True)
+        result = asyncio.run(record(args.path, args.simulator))
+    else:
+        result = asyncio.run(replay(args.path, args.time_scale))
+
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
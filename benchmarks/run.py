@@ -0,0 +1,85 @@
+"""Run microbenchmarks and store results as JSON.
+
+Usage::
+
+    python -m benchmarks.run --output .benchmarks/current.json
+    python -m benchmarks.run --filter buffer --filter scoring
+"""
+import argparse
+import asyncio
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from benchmarks import bench_buffer, bench_event_bus, bench_payload, bench_pipeline, bench_scoring
+from benchmarks.base import BenchmarkResult, get_benchmarks, run_benchmark
+
+BENCHMARK_MODULES = (bench_buffer, bench_event_bus, bench_payload, bench_pipeline, bench_scoring)
+
+
+def _get_meta() -> Dict[str, Any]:
+    try:
+        from importlib.metadata import version
+
+        golem_version = version("golem-core")
+    except Exception:
+        golem_version = None
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "golem_version": golem_version,
+        "datetime": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def run(filters: Optional[List[str]] = None, rounds: int = 10) -> List[BenchmarkResult]:
+    results = []
+
+    for definition in get_benchmarks(filters):
+        result = asyncio.run(run_benchmark(definition, rounds=rounds))
+        print(
+            f"{result.name:<50} {result.median * 1000:>12.4f} ms"
+            f" (± {result.stddev * 1000:.4f} ms, {result.iterations} iterations)",
+            file=sys.stderr,
+        )
+        results.append(result)
+
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", type=Path, help="Path to JSON file with results")
+    parser.add_argument(
+        "-f",
+        "--filter",
+        action="append",
+        dest="filters",
+        help="Run only benchmarks with names containing given text, can be used multiple times",
+    )
+    parser.add_argument("-r", "--rounds", type=int, default=10, help="Number of measured rounds")
+    args = parser.parse_args(argv)
+
+    results = run(args.filters, args.rounds)
+    output = json.dumps(
+        {"meta": _get_meta(), "benchmarks": [result.to_json() for result in results]},
+        indent=2,
+    )
+
+    if args.output is None:
+        print(output)
+        return
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(output)
+    print(f"Results saved to `{args.output}`", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
-from golem.managers.activity import PoolActivityManager, SingleUseActivityManager
-from golem.managers.agreement import DefaultAgreementManager
+from golem.managers.activity import (
+    ActivityPoolMetrics,
+    MultiPayloadPoolActivityManager,
+    PoolActivityManager,
+    RecyclingActivityManager,
+    SingleUseActivityManager,
+)
+from golem.managers.agreement import DefaultAgreementManager, PoolAgreementManager
 from golem.managers.base import (
     ActivityManager,
     AgreementManager,
@@ -23,6 +29,7 @@ from golem.managers.network import SingleNetworkManager
 from golem.managers.payment import DefaultPaymentManager
 from golem.managers.proposal import (
     BlacklistProviderIdPlugin,
+    DeduplicateProposalsPlugin,
     DefaultProposalManager,
     LinearAverageCostPricing,
     LinearCoeffsCost,
@@ -36,22 +43,37 @@ from golem.managers.proposal import (
     ProposalBuffer,
     ProposalScoringBuffer,
     ProposalScoringMixin,
+    ProposalTable,
+    ProviderCooldownPlugin,
+    ProviderStatsScore,
     RandomScore,
     RejectIfCostsExceeds,
 )
+from golem.managers.provider_stats import (
+    ProviderStats,
+    ProviderStatsManager,
+    SqliteProviderStatsStore,
+)
 from golem.managers.work import (
     ConcurrentWorkManager,
+    PackedWorkContext,
+    PackingWorkManager,
     SequentialWorkManager,
     WorkManagerPluginsMixin,
     redundancy_cancel_others_on_first_done,
     retry,
+    speculative_execution,
     work_plugin,
 )
 
 __all__ = (
+    "ActivityPoolMetrics",
+    "MultiPayloadPoolActivityManager",
     "PoolActivityManager",
+    "RecyclingActivityManager",
     "SingleUseActivityManager",
     "DefaultAgreementManager",
+    "PoolAgreementManager",
     "DoWorkCallable",
     "Manager",
     "ProposalScorer",
@@ -74,6 +96,8 @@ __all__ = (
     "DefaultPaymentManager",
     "DefaultProposalManager",
     "BlacklistProviderIdPlugin",
+    "ProviderCooldownPlugin",
+    "DeduplicateProposalsPlugin",
     "ProposalBuffer",
     "PaymentPlatformNegotiator",
     "MidAgreementPaymentsNegotiator",
@@ -86,12 +110,20 @@ __all__ = (
     "LinearPerCpuCoeffsCost",
     "LinearCoeffsCost",
     "PropertyValueLerpScore",
+    "ProviderStatsScore",
     "RandomScore",
     "ProposalScoringBuffer",
+    "ProposalTable",
+    "ProviderStats",
+    "ProviderStatsManager",
+    "SqliteProviderStatsStore",
     "SequentialWorkManager",
     "ConcurrentWorkManager",
+    "PackedWorkContext",
+    "PackingWorkManager",
     "WorkManagerPluginsMixin",
     "redundancy_cancel_others_on_first_done",
     "retry",
+    "speculative_execution",
     "work_plugin",
 )
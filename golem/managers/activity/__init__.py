@@ -1,12 +1,17 @@
 from golem.managers.activity.defaults import default_on_activity_start, default_on_activity_stop
 from golem.managers.activity.mixins import ActivityPrepareReleaseMixin
-from golem.managers.activity.pool import PoolActivityManager
+from golem.managers.activity.multi_payload import MultiPayloadPoolActivityManager
+from golem.managers.activity.pool import ActivityPoolMetrics, PoolActivityManager
+from golem.managers.activity.recycling import RecyclingActivityManager
 from golem.managers.activity.single_use import SingleUseActivityManager
 
 __all__ = (
     "default_on_activity_start",
     "default_on_activity_stop",
     "ActivityPrepareReleaseMixin",
+    "ActivityPoolMetrics",
+    "MultiPayloadPoolActivityManager",
     "PoolActivityManager",
+    "RecyclingActivityManager",
     "SingleUseActivityManager",
 )
@@ -0,0 +1,193 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Awaitable, Callable, Dict, Hashable, Mapping, Optional, Set
+
+from golem.managers.activity.mixins import ActivityPrepareReleaseMixin
+from golem.managers.activity.pool import ActivityPoolMetrics, PoolActivity, _ActivityPool
+from golem.managers.base import Manager, ManagerException
+from golem.managers.mixins import BackgroundLoopMixin
+from golem.node import GolemNode
+from golem.resources import Activity, Agreement
+from golem.utils.asyncio import create_task_with_logging, wait_for_event
+from golem.utils.logging import get_trace_id_name, trace_span
+
+logger = logging.getLogger(__name__)
+
+
+class MultiPayloadPoolActivityManager(BackgroundLoopMixin, ActivityPrepareReleaseMixin, Manager):
+    """Manager that keeps warm activities for multiple payloads, sharing one size budget.
+
+    Each key, e.g. payload image or deploy profile, has its own agreement source given in
+    `get_agreement_funcs`, and activities are requested for given key with `get_activity(key)`.
+    To plug given key into a work manager, use `functools.partial(manager.get_activity, key)`.
+
+    All keys together have at most `max_size` activities, preparing at most
+    `prepare_concurrency` of them at a time, and each key keeps at least `min_size_per_key`
+    activities. When requests for some key are waiting and the budget is used up, least recently
+    used idle activity of another key is released to make room for it, so capacity follows
+    the demand. Activities idle for longer than `idle_timeout` are released as well.
+
+    After consecutive failed preparations for given key, next ones for that key are delayed
+    starting with `base_prepare_retry_delay`, doubling up to `max_prepare_retry_delay`, so
+    a failing key doesn't take the capacity from the other ones.
+    """
+
+    def __init__(
+        self,
+        golem: GolemNode,
+        get_agreement_funcs: Mapping[Hashable, Callable[[], Awaitable[Agreement]]],
+        max_size: int = 1,
+        min_size_per_key: int = 0,
+        prepare_concurrency: int = 1,
+        idle_timeout: Optional[timedelta] = timedelta(minutes=1),
+        base_prepare_retry_delay: timedelta = timedelta(seconds=1),
+        max_prepare_retry_delay: timedelta = timedelta(minutes=1),
+        *args,
+        **kwargs,
+    ):
+        self._event_bus = golem.event_bus
+        self._pools: Dict[Hashable, _ActivityPool] = {
+            key: _ActivityPool(
+                get_agreement,
+                self._prepare_activity,
+                self._release_activity,
+                self._wakeup,
+                base_prepare_retry_delay,
+                max_prepare_retry_delay,
+            )
+            for key, get_agreement in get_agreement_funcs.items()
+        }
+
+        self._max_size = max_size
+        self._min_size_per_key = min_size_per_key
+        self._prepare_concurrency = prepare_concurrency
+        self._idle_timeout = idle_timeout
+
+        self._release_tasks: Set[asyncio.Task] = set()
+        self._wakeup_event = asyncio.Event()
+
+        super().__init__(*args, **kwargs)
+
+    @property
+    def metrics(self) -> Dict[Hashable, ActivityPoolMetrics]:
+        return {key: pool.get_metrics() for key, pool in self._pools.items()}
+
+    def _get_size(self) -> int:
+        return sum(pool.size for pool in self._pools.values())
+
+    def _get_preparing_count(self) -> int:
+        return sum(len(pool.prepare_tasks) for pool in self._pools.values())
+
+    async def _background_loop(self):
+        for pool in self._pools.values():
+            pool.is_stopping = False
+
+        try:
+            while True:
+                self._wakeup_event.clear()
+                self._scale()
+
+                await wait_for_event(self._wakeup_event, self._get_next_wakeup_delay())
+        finally:
+            logger.info("Releasing all idle activities from the pools")
+
+            for pool in self._pools.values():
+                for activity in await pool.close():
+                    self._start_release(activity)
+
+            await asyncio.gather(*self._release_tasks, return_exceptions=True)
+
+    def _wakeup(self) -> None:
+        self._wakeup_event.set()
+
+    def _scale(self) -> None:
+        if self._idle_timeout is not None:
+            for pool in self._pools.values():
+                for activity in pool.pop_expired(self._idle_timeout, self._min_size_per_key):
+                    self._start_release(activity)
+
+        #   Keys with the longest waiting requests get the capacity first
+        for key in sorted(self._pools, key=self._get_oldest_waiting_since):
+            pool = self._pools[key]
+
+            if pool.get_retry_delay() is not None:
+                continue
+
+            waiting_count = pool.missing_count
+            missing_count = max(self._min_size_per_key - pool.size, waiting_count)
+
+            for _ in range(missing_count):
+                if self._prepare_concurrency <= self._get_preparing_count():
+                    return
+
+                if self._max_size <= self._get_size():
+                    #   Only waiting requests can take capacity over from other keys
+                    if waiting_count <= 0 or not self._release_idle_activity_of_other_key(key):
+                        break
+
+                waiting_count -= 1
+                pool.start_prepare(get_trace_id_name(self, f"prepare-activity-{key}"))
+
+    def _get_oldest_waiting_since(self, key: Hashable) -> float:
+        oldest_waiting_since = self._pools[key].get_oldest_waiting_since()
+        return oldest_waiting_since if oldest_waiting_since is not None else float("inf")
+
+    def _release_idle_activity_of_other_key(self, key: Hashable) -> bool:
+        candidates = [
+            pool
+            for other_key, pool in self._pools.items()
+            if other_key != key and pool.idle_activities and self._min_size_per_key < pool.size
+        ]
+
+        if not candidates:
+            return False
+
+        #   Least recently used activities are on the left
+        pool = min(candidates, key=lambda p: p.idle_activities[0][1])
+        activity = pool.pop_least_recently_used()
+        self._start_release(activity)
+
+        logger.debug(f"Activity `{activity}` released to make room for `{key}` payload")
+
+        return True
+
+    def _get_next_wakeup_delay(self) -> Optional[float]:
+        delays = []
+
+        for pool in self._pools.values():
+            retry_delay = pool.get_retry_delay()
+            if retry_delay is not None:
+                delays.append(retry_delay)
+
+            if self._idle_timeout is not None:
+                expires_at = pool.get_next_expiration_at(self._idle_timeout, self._min_size_per_key)
+                if expires_at is not None:
+                    delays.append(max(expires_at - asyncio.get_running_loop().time(), 0))
+
+        if not delays:
+            return None
+
+        return min(delays)
+
+    def _start_release(self, activity: Activity) -> None:
+        logger.debug(f"Releasing activity `{activity}` from the pool")
+
+        task = create_task_with_logging(
+            self._release_activity(activity),
+            trace_id=get_trace_id_name(self, "release-activity"),
+        )
+        self._release_tasks.add(task)
+        task.add_done_callback(self._release_tasks.discard)
+
+    @trace_span(show_arguments=True, show_results=True)
+    async def get_activity(self, key: Hashable) -> Activity:
+        pool = self._pools.get(key)
+        if pool is None:
+            raise ManagerException(f"Unknown payload key `{key}`!")
+
+        activity = await pool.get()
+        logger.debug(f"Activity `{activity}` taken from the `{key}` pool")
+
+        # mypy doesn't support `ABCMeta.register` https://github.com/python/mypy/issues/2922
+        return PoolActivity(activity, pool.put)  # type: ignore[return-value]
@@ -1,13 +1,17 @@
 import asyncio
 import logging
-from typing import Awaitable, Callable
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Awaitable, Callable, Deque, List, Optional, Set, Tuple
 
 from golem.managers.activity.mixins import ActivityPrepareReleaseMixin, ActivityWrapper
 from golem.managers.base import ActivityManager
 from golem.managers.mixins import BackgroundLoopMixin
 from golem.node import GolemNode
 from golem.resources import Activity, Agreement
-from golem.utils.logging import trace_span
+from golem.utils.asyncio import create_task_with_logging, ensure_cancelled_many, wait_for_event
+from golem.utils.logging import get_trace_id_name, trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -22,80 +26,425 @@ class PoolActivity(ActivityWrapper):
         await self._put_activity_to_pool_func(self._activity)
 
 
+@dataclass(frozen=True)
+class ActivityPoolMetrics:
+    size: int
+    """Number of all activities in the pool, including ones in use and being prepared."""
+    idle_count: int
+    in_use_count: int
+    preparing_count: int
+    waiters_count: int
+    """Number of requests waiting for an activity."""
+    average_prepare_time: Optional[timedelta]
+    average_wait_time: Optional[timedelta]
+    """Average time requests waited for an activity, including ones served right away."""
+
+
+class _ActivityPool:
+    """Activities of a single pool, given to requests in order of their arrival.
+
+    Pool only prepares, hands out and takes back activities. How many activities to prepare
+    and which idle ones to release is decided by the manager owning the pool, which is notified
+    with `on_changed` about each change of the pool state.
+
+    After each consecutive failed preparation, new preparations should not be started for
+    a delay, doubled with each failure, starting at `base_retry_delay` and capped at
+    `max_retry_delay`, see `get_retry_delay()`.
+    """
+
+    def __init__(
+        self,
+        get_agreement: Callable[[], Awaitable[Agreement]],
+        prepare_activity: Callable[[Agreement], Awaitable[Activity]],
+        release_activity: Callable[[Activity], Awaitable[None]],
+        on_changed: Callable[[], None],
+        base_retry_delay: timedelta = timedelta(seconds=1),
+        max_retry_delay: timedelta = timedelta(minutes=1),
+    ) -> None:
+        self._get_agreement = get_agreement
+        self._prepare_activity = prepare_activity
+        self._release_activity = release_activity
+        self._on_changed = on_changed
+        self._base_retry_delay = base_retry_delay
+        self._max_retry_delay = max_retry_delay
+
+        self.size = 0
+        #   Idle activities with loop time they became idle at, most recently used on the right
+        self.idle_activities: Deque[Tuple[Activity, float]] = deque()
+        self.waiters: Deque[Tuple["asyncio.Future[Activity]", float]] = deque()
+        self.prepare_tasks: Set[asyncio.Task] = set()
+        self.is_stopping = False
+
+        self._failures_count = 0
+        self._retry_at: Optional[float] = None
+        self._prepared_count = 0
+        self._prepare_time_total = 0.0
+        self._served_count = 0
+        self._wait_time_total = 0.0
+
+    @property
+    def missing_count(self) -> int:
+        """Number of waiting requests no idle or preparing activity is there for."""
+        return len(self.waiters) - len(self.idle_activities) - len(self.prepare_tasks)
+
+    def get_oldest_waiting_since(self) -> Optional[float]:
+        """Loop time the longest waiting request started waiting at."""
+        return self.waiters[0][1] if self.waiters else None
+
+    def get_retry_delay(self) -> Optional[float]:
+        """Seconds left until new preparations may be started after failed ones, if any."""
+        if self._retry_at is None:
+            return None
+
+        delay = self._retry_at - asyncio.get_running_loop().time()
+        return delay if 0 < delay else None
+
+    def get_metrics(self) -> ActivityPoolMetrics:
+        idle_count = len(self.idle_activities)
+        preparing_count = len(self.prepare_tasks)
+
+        return ActivityPoolMetrics(
+            size=self.size,
+            idle_count=idle_count,
+            in_use_count=self.size - idle_count - preparing_count,
+            preparing_count=preparing_count,
+            waiters_count=len(self.waiters),
+            average_prepare_time=(
+                timedelta(seconds=self._prepare_time_total / self._prepared_count)
+                if self._prepared_count
+                else None
+            ),
+            average_wait_time=(
+                timedelta(seconds=self._wait_time_total / self._served_count)
+                if self._served_count
+                else None
+            ),
+        )
+
+    def start_prepare(self, trace_id: str) -> None:
+        self.size += 1
+
+        task = create_task_with_logging(self._prepare_activity_and_put(), trace_id=trace_id)
+        self.prepare_tasks.add(task)
+        task.add_done_callback(self.prepare_tasks.discard)
+
+    def pop_least_recently_used(self) -> Activity:
+        activity, _ = self.idle_activities.popleft()
+        self.size -= 1
+        return activity
+
+    def pop_expired(self, idle_timeout: timedelta, min_size: int) -> List[Activity]:
+        """Remove and return activities idle for longer than `idle_timeout`, keeping `min_size`."""
+        expired_before = asyncio.get_running_loop().time() - idle_timeout.total_seconds()
+        activities = []
+
+        #   Least recently used activities are on the left
+        while self.idle_activities and min_size < self.size:
+            if expired_before < self.idle_activities[0][1]:
+                break
+
+            activities.append(self.pop_least_recently_used())
+
+        return activities
+
+    def get_next_expiration_at(self, idle_timeout: timedelta, min_size: int) -> Optional[float]:
+        if not self.idle_activities or self.size <= min_size:
+            return None
+
+        return self.idle_activities[0][1] + idle_timeout.total_seconds()
+
+    async def close(self) -> List[Activity]:
+        """Stop preparations and waiting requests, then remove and return all idle activities.
+
+        Activities returned to the pool from now on are released right away.
+        """
+        self.is_stopping = True
+
+        await ensure_cancelled_many(self.prepare_tasks)
+
+        for waiter, _ in self.waiters:
+            waiter.cancel()
+        self.waiters.clear()
+
+        activities = [activity for activity, _ in self.idle_activities]
+        self.idle_activities.clear()
+        self.size -= len(activities)
+
+        return activities
+
+    async def get(self) -> Activity:
+        if self.idle_activities:
+            activity, _ = self.idle_activities.pop()
+            self._served_count += 1
+            self._on_changed()
+            return activity
+
+        waiter: "asyncio.Future[Activity]" = asyncio.get_running_loop().create_future()
+        self.waiters.append((waiter, asyncio.get_running_loop().time()))
+        self._on_changed()
+
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            #   Activity given right before the request was cancelled goes back to the pool
+            if waiter.done() and not waiter.cancelled():
+                await self.put(waiter.result())
+            else:
+                self._remove_waiter(waiter)
+
+            raise
+
+    async def put(self, activity: Activity) -> None:
+        if not self.is_stopping:
+            self._put_nowait(activity)
+            return
+
+        logger.debug(f"Activity `{activity}` returned to the stopped pool, releasing it")
+
+        self.size -= 1
+        await self._release_activity(activity)
+
+    def _put_nowait(self, activity: Activity) -> None:
+        waiter = self._pop_waiter()
+
+        if waiter is not None:
+            waiter.set_result(activity)
+            logger.debug(f"Activity `{activity}` given to waiting request")
+        else:
+            self.idle_activities.append((activity, asyncio.get_running_loop().time()))
+            logger.debug(f"Activity `{activity}` back to the pool")
+
+        self._on_changed()
+
+    def _remove_waiter(self, waiter: "asyncio.Future[Activity]") -> None:
+        for entry in self.waiters:
+            if entry[0] is waiter:
+                self.waiters.remove(entry)
+                self._on_changed()
+                return
+
+    def _pop_waiter(self) -> Optional["asyncio.Future[Activity]"]:
+        while self.waiters:
+            waiter, waiting_since = self.waiters.popleft()
+
+            if not waiter.done():
+                self._served_count += 1
+                self._wait_time_total += asyncio.get_running_loop().time() - waiting_since
+                return waiter
+
+        return None
+
+    @trace_span()
+    async def _prepare_activity_and_put(self) -> None:
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+
+        try:
+            agreement = await self._get_agreement()
+            activity = await self._prepare_activity(agreement)
+        except Exception as e:
+            self.size -= 1
+            self._set_failed()
+
+            #   Error is passed to the waiting request, so it is not silently retried forever
+            waiter = self._pop_waiter()
+            if waiter is None:
+                raise
+
+            waiter.set_exception(e)
+            return
+        else:
+            self._failures_count = 0
+            self._retry_at = None
+            self._prepared_count += 1
+            self._prepare_time_total += loop.time() - started_at
+
+            self._put_nowait(activity)
+        finally:
+            #   Task must leave preparations before the owning manager scales the pool again
+            task = asyncio.current_task()
+            assert task is not None  # mypy
+            self.prepare_tasks.discard(task)
+            self._on_changed()
+
+    def _set_failed(self) -> None:
+        self._failures_count += 1
+
+        retry_delay = min(
+            self._base_retry_delay * 2 ** (self._failures_count - 1), self._max_retry_delay
+        )
+        self._retry_at = asyncio.get_running_loop().time() + retry_delay.total_seconds()
+
+        logger.debug(
+            f"Preparing activity failed {self._failures_count} times in a row, next preparation"
+            f" not sooner than in {retry_delay}"
+        )
+
+
 class PoolActivityManager(BackgroundLoopMixin, ActivityPrepareReleaseMixin, ActivityManager):
+    """ActivityManager that keeps a pool of prepared activities, sized between given bounds.
+
+    Pool keeps at least `min_size` activities and grows up to `max_size`, preparing at most
+    `prepare_concurrency` activities at a time, when:
+
+    - requests wait for an activity no idle or preparing activity is there for, and the longest
+      waiting one waits for at least `scale_up_wait_time`,
+    - share of activities in use reaches `scale_up_utilization`, so an activity is prepared
+      before requests have to wait for it.
+
+    Activities idle for longer than `idle_timeout` are released while pool is bigger than
+    `min_size`. Both bounds default to `pool_size`. After consecutive failed preparations, next
+    ones are delayed starting with `base_prepare_retry_delay`, doubling up to
+    `max_prepare_retry_delay`.
+
+    Pool reacts to events, i.e. requests, activities returned to the pool and finished
+    preparations, instead of polling. Current state of the pool is available as `metrics`.
+    """
+
     def __init__(
         self,
         golem: GolemNode,
         get_agreement: Callable[[], Awaitable[Agreement]],
-        pool_size: int,
+        pool_size: int = 1,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        prepare_concurrency: int = 1,
+        idle_timeout: Optional[timedelta] = timedelta(minutes=1),
+        scale_up_wait_time: timedelta = timedelta(0),
+        scale_up_utilization: Optional[float] = None,
+        base_prepare_retry_delay: timedelta = timedelta(seconds=1),
+        max_prepare_retry_delay: timedelta = timedelta(minutes=1),
         *args,
         **kwargs,
     ):
-        self._get_agreement = get_agreement
         self._event_bus = golem.event_bus
 
-        self._pool_target_size = pool_size
-        self._pool_current_size = 0
-        self._pool: asyncio.Queue[Activity] = asyncio.Queue()
+        self._min_size = min_size if min_size is not None else pool_size
+        self._max_size = max_size if max_size is not None else max(pool_size, self._min_size)
+        self._prepare_concurrency = prepare_concurrency
+        self._idle_timeout = idle_timeout
+        self._scale_up_wait_time = scale_up_wait_time
+        self._scale_up_utilization = scale_up_utilization
+
+        self._pool = _ActivityPool(
+            get_agreement,
+            self._prepare_activity,
+            self._release_activity,
+            self._wakeup,
+            base_prepare_retry_delay,
+            max_prepare_retry_delay,
+        )
+        self._release_tasks: Set[asyncio.Task] = set()
+        self._wakeup_event = asyncio.Event()
+
         super().__init__(*args, **kwargs)
 
+    @property
+    def metrics(self) -> ActivityPoolMetrics:
+        return self._pool.get_metrics()
+
     async def _background_loop(self):
+        self._pool.is_stopping = False
+
         try:
             while True:
-                if self._pool_current_size > self._pool_target_size:
-                    # TODO check tasks results and add fallback
-                    await asyncio.gather(
-                        *[
-                            self._release_activity_and_pop_from_pool()
-                            for _ in range(self._pool_current_size - self._pool_target_size)
-                        ]
-                    )
-                elif self._pool_current_size < self._pool_target_size:
-                    # TODO check tasks results and add fallback
-                    await asyncio.gather(
-                        *[
-                            self._prepare_activity_and_put_to_pool()
-                            for _ in range(self._pool_target_size - self._pool_current_size)
-                        ]
-                    )
-                # TODO: Use events instead of sleep
-                await asyncio.sleep(0.01)
+                self._wakeup_event.clear()
+                self._scale()
+
+                await wait_for_event(self._wakeup_event, self._get_next_wakeup_delay())
         finally:
-            logger.info(f"Releasing all {self._pool_current_size} activities from the pool")
-            # TODO cancel release adn prepare tasks
-            await asyncio.gather(
-                *[
-                    self._release_activity_and_pop_from_pool()
-                    for _ in range(self._pool_current_size)
-                ]
-            )
+            idle_activities = await self._pool.close()
 
-    @trace_span()
-    async def _release_activity_and_pop_from_pool(self):
-        activity = await self._pool.get()
-        self._pool.task_done()
-        self._pool_current_size -= 1
-        await self._release_activity(activity)
+            logger.info(f"Releasing all {len(idle_activities)} idle activities from the pool")
 
-    @trace_span()
-    async def _prepare_activity_and_put_to_pool(self):
-        agreement = await self._get_agreement()
-        activity = await self._prepare_activity(agreement)
-        await self._pool.put(activity)
-        self._pool_current_size += 1
+            for activity in idle_activities:
+                self._start_release(activity)
 
-    async def _get_activity_from_pool(self):
-        activity = await self._pool.get()
-        self._pool.task_done()
-        logger.debug(f"Activity `{activity}` taken from the pool")
-        return activity
+            await asyncio.gather(*self._release_tasks, return_exceptions=True)
+
+    def _wakeup(self) -> None:
+        self._wakeup_event.set()
+
+    def _scale(self) -> None:
+        if self._idle_timeout is not None:
+            for activity in self._pool.pop_expired(self._idle_timeout, self._min_size):
+                self._start_release(activity)
+
+        if self._pool.get_retry_delay() is not None:
+            return
+
+        missing_count = min(
+            self._get_wanted_count(),
+            self._max_size - self._pool.size,
+            self._prepare_concurrency - len(self._pool.prepare_tasks),
+        )
+
+        for _ in range(missing_count):
+            self._pool.start_prepare(get_trace_id_name(self, "prepare-activity"))
+
+    def _get_wanted_count(self) -> int:
+        wanted_count = self._min_size - self._pool.size
+
+        scale_up_at = self._get_scale_up_at()
+        if scale_up_at is not None and scale_up_at <= asyncio.get_running_loop().time():
+            wanted_count = max(wanted_count, self._pool.missing_count)
+
+        metrics = self._pool.get_metrics()
+        if (
+            self._scale_up_utilization is not None
+            and metrics.size
+            and self._scale_up_utilization <= metrics.in_use_count / metrics.size
+        ):
+            wanted_count = max(wanted_count, 1)
+
+        return wanted_count
+
+    def _get_scale_up_at(self) -> Optional[float]:
+        """Loop time waiting requests make the pool grow at, if any are missing an activity."""
+        oldest_waiting_since = self._pool.get_oldest_waiting_since()
 
-    async def _put_activity_to_pool(self, activity):
-        await self._pool.put(activity)
-        logger.debug(f"Activity `{activity}` back to the pool")
+        if self._pool.missing_count <= 0 or oldest_waiting_since is None:
+            return None
+
+        return oldest_waiting_since + self._scale_up_wait_time.total_seconds()
+
+    def _get_next_wakeup_delay(self) -> Optional[float]:
+        now = asyncio.get_running_loop().time()
+        wakeup_ats = []
+
+        if self._idle_timeout is not None:
+            expires_at = self._pool.get_next_expiration_at(self._idle_timeout, self._min_size)
+            if expires_at is not None:
+                wakeup_ats.append(max(expires_at, now))
+
+        retry_delay = self._pool.get_retry_delay()
+        scale_up_at = self._get_scale_up_at()
+
+        if retry_delay is not None:
+            wakeup_ats.append(now + retry_delay)
+        elif scale_up_at is not None and now < scale_up_at:
+            #   Already passed scale up is handled, pool waits for a change of its state
+            wakeup_ats.append(scale_up_at)
+
+        if not wakeup_ats:
+            return None
+
+        return min(wakeup_ats) - now
+
+    def _start_release(self, activity: Activity) -> None:
+        logger.debug(f"Releasing activity `{activity}` from the pool")
+
+        task = create_task_with_logging(
+            self._release_activity(activity),
+            trace_id=get_trace_id_name(self, "release-activity"),
+        )
+        self._release_tasks.add(task)
+        task.add_done_callback(self._release_tasks.discard)
 
     @trace_span(show_arguments=True, show_results=True)
     async def get_activity(self) -> Activity:
-        activity = await self._get_activity_from_pool()
+        activity = await self._pool.get()
+        logger.debug(f"Activity `{activity}` taken from the pool")
+
         # mypy doesn't support `ABCMeta.register` https://github.com/python/mypy/issues/2922
-        return PoolActivity(activity, self._put_activity_to_pool)  # type: ignore[return-value]
+        return PoolActivity(activity, self._pool.put)  # type: ignore[return-value]
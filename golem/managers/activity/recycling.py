@@ -0,0 +1,150 @@
+import asyncio
+import logging
+from collections import deque
+from datetime import timedelta
+from typing import Awaitable, Callable, Deque, Dict, Optional
+
+from golem.managers.activity.mixins import ActivityPrepareReleaseMixin, ActivityWrapper
+from golem.managers.agreement.default import DefaultAgreementManager
+from golem.managers.base import ActivityManager, ManagerException
+from golem.node import GolemNode
+from golem.payload import defaults as payload_defaults
+from golem.resources import Activity, Agreement
+from golem.utils.clock import utc_now
+from golem.utils.logging import trace_span
+
+logger = logging.getLogger(__name__)
+
+
+@Activity.register
+class RecyclingActivity(ActivityWrapper):
+    def __init__(self, activity, release_activity_func) -> None:
+        super().__init__(activity)
+        self._release_activity_func = release_activity_func
+
+    async def destroy(self) -> None:
+        await self._release_activity_func(self._activity)
+
+
+class RecyclingActivityManager(ActivityPrepareReleaseMixin, ActivityManager):
+    """ActivityManager that creates next activities on agreements of already released ones.
+
+    When activity is released, its agreement is kept for the next activity, as long as the
+    provider supports multiple activities per agreement, the agreement has at least
+    `min_remaining_time` before its expiration and has less than `max_activities_per_agreement`
+    activities. New agreements are requested only when there is no agreement to reuse, or
+    creating activity on it fails.
+
+    Agreements are terminated by this manager, so agreement manager should not terminate them
+    when activity is closed, e.g. `DefaultAgreementManager` with
+    `terminate_on_activity_closed=False`. Agreement manager given as `agreement_manager` is
+    checked for that on construction. Agreements of activities released after `stop()` are
+    terminated right away.
+    """
+
+    def __init__(
+        self,
+        golem: GolemNode,
+        get_agreement: Callable[[], Awaitable[Agreement]],
+        max_activities_per_agreement: Optional[int] = None,
+        min_remaining_time: timedelta = timedelta(minutes=1),
+        *args,
+        agreement_manager: Optional[DefaultAgreementManager] = None,
+        **kwargs,
+    ):
+        if agreement_manager is not None and agreement_manager.terminate_on_activity_closed:
+            raise ManagerException(
+                "RecyclingActivityManager can't reuse agreements terminated by the agreement"
+                " manager when their activity is closed, use `DefaultAgreementManager` with"
+                " `terminate_on_activity_closed=False`!"
+            )
+
+        self._get_agreement = get_agreement
+        self._event_bus = golem.event_bus
+        self._max_activities_per_agreement = max_activities_per_agreement
+        self._min_remaining_time = min_remaining_time
+
+        self._idle_agreements: Deque[Agreement] = deque()
+        self._activities_counts: Dict[str, int] = {}
+        self._is_stopping = False
+
+        super().__init__(*args, **kwargs)
+
+    @trace_span("Starting RecyclingActivityManager", log_level=logging.INFO)
+    async def start(self) -> None:
+        self._is_stopping = False
+
+    @trace_span("Stopping RecyclingActivityManager", log_level=logging.INFO)
+    async def stop(self) -> None:
+        #   Activities still in use release their agreements after the manager is stopped
+        self._is_stopping = True
+
+        idle_agreements = list(self._idle_agreements)
+        self._idle_agreements.clear()
+
+        if idle_agreements:
+            await asyncio.gather(*[self._close_agreement(a) for a in idle_agreements])
+
+    @trace_span(show_arguments=True, show_results=True)
+    async def get_activity(self) -> Activity:
+        while True:
+            if self._idle_agreements:
+                #   Most recently used agreement is the least likely to be dropped by its provider
+                agreement = self._idle_agreements.pop()
+                logger.debug(f"Reusing agreement `{agreement}`")
+            else:
+                agreement = await self._get_agreement()
+
+            try:
+                activity = await self._prepare_activity(agreement)
+            except Exception:
+                logger.exception("Creating activity failed, but will be retried with new agreement")
+                await self._close_agreement(agreement)
+                continue
+
+            self._activities_counts[agreement.id] = self._activities_counts.get(agreement.id, 0) + 1
+
+            # mypy doesn't support `ABCMeta.register` https://github.com/python/mypy/issues/2922
+            return RecyclingActivity(
+                activity, self._release_activity_and_recycle_agreement
+            )  # type: ignore[return-value]
+
+    @trace_span(show_arguments=True)
+    async def _release_activity_and_recycle_agreement(self, activity: Activity) -> None:
+        await self._release_activity(activity)
+
+        agreement = activity.agreement
+
+        is_reusable = activity.destroyed and await self._is_agreement_reusable(agreement)
+
+        if is_reusable and not self._is_stopping:
+            self._idle_agreements.append(agreement)
+        else:
+            await self._close_agreement(agreement)
+
+    async def _is_agreement_reusable(self, agreement: Agreement) -> bool:
+        activities_count = self._activities_counts.get(agreement.id, 0)
+        if (
+            self._max_activities_per_agreement is not None
+            and self._max_activities_per_agreement <= activities_count
+        ):
+            return False
+
+        agreement_data = await agreement.get_data()
+
+        if not payload_defaults.ActivityInfo.from_properties(
+            agreement_data.offer.properties
+        ).multi_activity:
+            return False
+
+        expiration = payload_defaults.ActivityInfo.from_properties(
+            agreement_data.demand.properties
+        ).expiration
+
+        return expiration is None or self._min_remaining_time <= expiration - utc_now()
+
+    async def _close_agreement(self, agreement: Agreement) -> None:
+        self._activities_counts.pop(agreement.id, None)
+        await agreement.close_all()
+
+        logger.info(f"Agreement `{agreement}` closed")
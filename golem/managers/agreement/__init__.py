@@ -1,3 +1,7 @@
 from golem.managers.agreement.default import DefaultAgreementManager
+from golem.managers.agreement.pool import PoolAgreementManager
 
-__all__ = ("DefaultAgreementManager",)
+__all__ = (
+    "DefaultAgreementManager",
+    "PoolAgreementManager",
+)
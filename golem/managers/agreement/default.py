@@ -1,56 +1,251 @@
 import asyncio
 import logging
-from typing import Awaitable, Callable, List
+from datetime import timedelta
+from typing import Awaitable, Callable, List, Optional, Set, Union
 
-from golem.managers.base import AgreementManager
+from golem.managers.base import AgreementManager, ManagerException
 from golem.node import GolemNode
-from golem.resources import ActivityClosed, Agreement, Proposal
-from golem.utils.logging import trace_span
+from golem.resources import ActivityClosed, Agreement, AgreementClosed, Proposal
+from golem.utils.asyncio import create_task_with_logging, ensure_cancelled_many
+from golem.utils.logging import get_trace_id_name, trace_span
 
 logger = logging.getLogger(__name__)
 
 
 class DefaultAgreementManager(AgreementManager):
+    """AgreementManager that creates agreements from draft proposals, when requested.
+
+    By default draft proposals are tried one at a time. With `agreement_concurrency` greater
+    than 1, agreements with up to that many providers are created concurrently while there are
+    pending requests, and first approved ones are given. Up to `max_surplus_agreements` of
+    approved agreements that were not needed are kept for next requests, others are terminated.
+    Kept agreements are terminated if no request takes them within `surplus_agreement_timeout`,
+    as providers drop agreements without activities on their own.
+
+    Agreement is terminated when its activity is closed, unless `terminate_on_activity_closed`
+    is `False`, e.g. when activity manager reuses agreements for next activities and terminates
+    them on its own.
+    """
+
     def __init__(
         self,
         golem: GolemNode,
         get_draft_proposal: Callable[[], Awaitable[Proposal]],
+        agreement_concurrency: int = 1,
+        max_surplus_agreements: int = 0,
+        terminate_on_activity_closed: bool = True,
+        surplus_agreement_timeout: timedelta = timedelta(minutes=1),
         *args,
         **kwargs,
     ):
         self._get_draft_proposal = get_draft_proposal
         self._event_bus = golem.event_bus
+        self._agreement_concurrency = agreement_concurrency
+        self._max_surplus_agreements = max_surplus_agreements
+        self._terminate_on_activity_closed = terminate_on_activity_closed
+        self._surplus_agreement_timeout = surplus_agreement_timeout
 
         self._agreements: List[Agreement] = []
 
+        self._agreement_tasks: Set[asyncio.Task] = set()
+        self._draft_proposal_tasks: Set[asyncio.Task] = set()
+        self._surplus_termination_tasks: Set[asyncio.Task] = set()
+        self._surplus_expiration_tasks: Set[asyncio.Task] = set()
+        self._approved_agreements: asyncio.Queue[Union[Agreement, BaseException]] = asyncio.Queue()
+        self._pending_requests_count = 0
+
         super().__init__(*args, **kwargs)
 
     @trace_span("Stopping DefaultAgreementManager", log_level=logging.INFO)
     async def stop(self) -> None:
+        #   Cancelled tasks terminate agreements they already created
+        await ensure_cancelled_many(self._agreement_tasks)
+        self._agreement_tasks.clear()
+        await ensure_cancelled_many(self._surplus_expiration_tasks)
+        self._surplus_expiration_tasks.clear()
+
+        while not self._approved_agreements.empty():
+            result = self._approved_agreements.get_nowait()
+            if isinstance(result, Agreement):
+                self._terminate_surplus_agreement(result)
+
+        if self._surplus_termination_tasks:
+            await asyncio.gather(*self._surplus_termination_tasks, return_exceptions=True)
+
         if self._agreements:
             await asyncio.gather(*[agreement.close_all() for agreement in self._agreements])
         else:
             logger.info("All agreements are already terminated")
 
+    @property
+    def terminate_on_activity_closed(self) -> bool:
+        """Whether agreement is terminated when its activity is closed."""
+        return self._terminate_on_activity_closed
+
     @trace_span("Getting agreement", show_results=True, log_level=logging.INFO)
     async def get_agreement(self) -> Agreement:
+        if self._agreement_concurrency <= 1:
+            agreement = await self._create_agreement()
+        else:
+            agreement = await self._get_first_approved_agreement()
+
+        await self._track_agreement(agreement)
+        return agreement
+
+    async def _get_first_approved_agreement(self) -> Agreement:
+        self._pending_requests_count += 1
+
+        try:
+            self._start_agreement_tasks()
+
+            result = await self._approved_agreements.get()
+        finally:
+            self._pending_requests_count -= 1
+
+        if self._pending_requests_count <= self._approved_agreements.qsize():
+            #   Agreements were not created yet, so they can be cancelled without any cleanup
+            for task in list(self._draft_proposal_tasks):
+                task.cancel()
+
+        if isinstance(result, BaseException):
+            raise result
+
+        return result
+
+    def _start_agreement_tasks(self) -> None:
+        #   All tasks are racing for pending requests, first approved agreements win
+        while (
+            self._approved_agreements.qsize() < self._pending_requests_count
+            and len(self._agreement_tasks) < self._agreement_concurrency
+        ):
+            task = create_task_with_logging(
+                self._try_create_agreement(),
+                trace_id=get_trace_id_name(self, "create-agreement"),
+            )
+            task.add_done_callback(self._on_agreement_task_done)
+            self._agreement_tasks.add(task)
+
+    def _on_agreement_task_done(self, task: asyncio.Task) -> None:
+        self._agreement_tasks.discard(task)
+        self._draft_proposal_tasks.discard(task)
+
+        if task.cancelled():
+            return
+
+        exception = task.exception()
+        result: Optional[Union[Agreement, BaseException]] = (
+            exception if exception is not None else task.result()
+        )
+
+        if isinstance(result, Agreement):
+            surplus_count = self._approved_agreements.qsize() - self._pending_requests_count
+
+            if self._max_surplus_agreements <= surplus_count:
+                self._terminate_surplus_agreement(result)
+            else:
+                self._approved_agreements.put_nowait(result)
+                self._start_surplus_expiration(result)
+        elif result is not None:
+            if self._approved_agreements.qsize() < self._pending_requests_count:
+                self._approved_agreements.put_nowait(result)
+            else:
+                #   Nobody is waiting for the error, so it would be raised to some unrelated request
+                logger.debug("Surplus agreement task failed, ignoring the error", exc_info=result)
+
+        self._start_agreement_tasks()
+
+    async def _try_create_agreement(self) -> Optional[Agreement]:
+        task = asyncio.current_task()
+        assert task is not None  # mypy
+
+        self._draft_proposal_tasks.add(task)
+        try:
+            proposal = await self._get_draft_proposal()
+        finally:
+            self._draft_proposal_tasks.discard(task)
+
+        try:
+            return await self._create_approved_agreement(proposal)
+        except Exception as e:
+            logger.debug(f"Creating agreement failed with `{e}`. Retrying...")
+            return None
+
+    async def _create_approved_agreement(self, proposal: Proposal) -> Agreement:
+        agreement = await proposal.create_agreement()
+
+        try:
+            await agreement.confirm()
+            approved = await agreement.wait_for_approval()
+        except asyncio.CancelledError:
+            #   Agreement could be already confirmed, so provider would keep it for nobody
+            self._terminate_surplus_agreement(agreement)
+            raise
+
+        if not approved:
+            raise ManagerException(f"Agreement `{agreement}` was not approved")
+
+        return agreement
+
+    def _terminate_surplus_agreement(self, agreement: Agreement) -> None:
+        logger.debug(f"Agreement `{agreement}` is not needed, terminating...")
+
+        task = create_task_with_logging(
+            agreement.close_all(),
+            trace_id=get_trace_id_name(self, "terminate-surplus-agreement"),
+        )
+        task.add_done_callback(self._surplus_termination_tasks.discard)
+        self._surplus_termination_tasks.add(task)
+
+    def _start_surplus_expiration(self, agreement: Agreement) -> None:
+        task = create_task_with_logging(
+            self._expire_surplus_agreement(agreement),
+            trace_id=get_trace_id_name(self, "expire-surplus-agreement"),
+        )
+        task.add_done_callback(self._surplus_expiration_tasks.discard)
+        self._surplus_expiration_tasks.add(task)
+
+    async def _expire_surplus_agreement(self, agreement: Agreement) -> None:
+        await asyncio.sleep(self._surplus_agreement_timeout.total_seconds())
+
+        #   `asyncio.Queue` can't remove single item, so other items are put back in order
+        results = []
+        while not self._approved_agreements.empty():
+            results.append(self._approved_agreements.get_nowait())
+
+        for result in results:
+            if result is agreement:
+                logger.debug(f"Agreement `{agreement}` was not requested in time")
+                self._terminate_surplus_agreement(agreement)
+            else:
+                self._approved_agreements.put_nowait(result)
+
+    async def _create_agreement(self) -> Agreement:
         while True:
             proposal = await self._get_draft_proposal()
             try:
-                agreement = await proposal.create_agreement()
-                await agreement.confirm()
-                await agreement.wait_for_approval()
+                return await self._create_approved_agreement(proposal)
             except Exception as e:
                 logger.debug(f"Creating agreement failed with `{e}`. Retrying...")
-            else:
-                # TODO: Support removing callback on resource close
-                await self._event_bus.on_once(
-                    ActivityClosed,
-                    self._terminate_agreement,
-                    lambda event: event.resource.parent.id == agreement.id,
-                )
-                self._agreements.append(agreement)
-                return agreement
+
+    async def _track_agreement(self, agreement: Agreement) -> None:
+        # TODO: Support removing callback on resource close
+        if self._terminate_on_activity_closed:
+            await self._event_bus.on_once(
+                ActivityClosed,
+                self._terminate_agreement,
+                lambda event: event.resource.parent.id == agreement.id,
+            )
+        else:
+            await self._event_bus.on_once(
+                AgreementClosed,
+                self._forget_agreement,
+                lambda event: event.resource.id == agreement.id,
+            )
+        self._agreements.append(agreement)
+
+    async def _forget_agreement(self, event: AgreementClosed) -> None:
+        if event.resource in self._agreements:
+            self._agreements.remove(event.resource)
 
     @trace_span(show_arguments=True)
     async def _terminate_agreement(self, event: ActivityClosed) -> None:
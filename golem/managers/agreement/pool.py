@@ -0,0 +1,176 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Awaitable, Callable, Dict, Optional
+
+from golem.managers.agreement.default import DefaultAgreementManager
+from golem.managers.base import ManagerException
+from golem.node import GolemNode
+from golem.payload import defaults as payload_defaults
+from golem.resources import Agreement, Proposal
+from golem.utils.asyncio.buffer import BackgroundFillBuffer, ExpirableBuffer, SimpleBuffer
+from golem.utils.clock import utc_now
+from golem.utils.logging import trace_span
+
+logger = logging.getLogger(__name__)
+
+
+class PoolAgreementManager(DefaultAgreementManager):
+    """AgreementManager that keeps approved agreements ready in the background.
+
+    Pool is filled up to `max_size` agreements on start, and again each time its size drops
+    below `min_size`, so agreements are usually given without waiting for the negotiations and
+    the provider's approval. Agreements not given until `min_remaining_time` before their
+    expiration are terminated and replaced with fresh ones. Optional `max_idle_time` retires them
+    earlier, e.g. for providers that don't keep idle agreements for long.
+
+    Number of agreements given right away and of ones that had to be waited for are available as
+    `hits_count` and `misses_count`.
+
+    Agreements are created concurrently by `fill_concurrency_size` workers, so
+    `agreement_concurrency` of :any:`DefaultAgreementManager` is not supported.
+    """
+
+    def __init__(
+        self,
+        golem: GolemNode,
+        get_draft_proposal: Callable[[], Awaitable[Proposal]],
+        min_size: int = 1,
+        max_size: int = 1,
+        fill_concurrency_size: int = 1,
+        max_idle_time: Optional[timedelta] = None,
+        min_remaining_time: timedelta = timedelta(minutes=1),
+        *args,
+        **kwargs,
+    ) -> None:
+        if kwargs.get("agreement_concurrency", 1) != 1:
+            raise ManagerException(
+                "PoolAgreementManager doesn't support `agreement_concurrency`,"
+                " use `fill_concurrency_size` instead!"
+            )
+
+        self._min_size = min_size
+        self._max_size = max_size
+        self._max_idle_time = max_idle_time
+        self._min_remaining_time = min_remaining_time
+
+        self._hits_count = 0
+        self._misses_count = 0
+        self._waiting_requests_count = 0
+        self._idle_expirations: Dict[str, Optional[timedelta]] = {}
+
+        self._buffer: BackgroundFillBuffer[Agreement] = BackgroundFillBuffer(
+            buffer=ExpirableBuffer(
+                buffer=SimpleBuffer(),
+                get_expiration_func=lambda agreement: self._idle_expirations.pop(
+                    agreement.id, self._max_idle_time
+                ),
+                on_expired_func=self._on_expired,
+            ),
+            fill_func=self._create_pooled_agreement,
+            fill_concurrency_size=fill_concurrency_size,
+        )
+
+        super().__init__(golem, get_draft_proposal, *args, **kwargs)
+
+    @property
+    def hits_count(self) -> int:
+        """Number of agreements given right away from the pool."""
+        return self._hits_count
+
+    @property
+    def misses_count(self) -> int:
+        """Number of agreements that had to be waited for, as the pool was empty."""
+        return self._misses_count
+
+    @trace_span("Starting PoolAgreementManager", log_level=logging.INFO)
+    async def start(self) -> None:
+        await super().start()
+
+        await self._buffer.start()
+        await self._request_agreements()
+
+    @trace_span("Stopping PoolAgreementManager", log_level=logging.INFO)
+    async def stop(self) -> None:
+        await self._buffer.stop()
+
+        #   Error of a failed fill is not raised, as pooled agreements have to be terminated anyway
+        self._buffer.reset_exception()
+        pooled_agreements = await self._buffer.get_all()
+        if pooled_agreements:
+            logger.info(f"Terminating {len(pooled_agreements)} unused agreements from the pool")
+            await asyncio.gather(*[agreement.close_all() for agreement in pooled_agreements])
+
+        self._idle_expirations.clear()
+
+        #   Agreements cancelled while waiting for approval are terminated here
+        await super().stop()
+
+    @trace_span("Getting agreement", show_results=True, log_level=logging.INFO)
+    async def get_agreement(self) -> Agreement:
+        is_hit = self._waiting_requests_count < self._buffer.size()
+
+        if is_hit:
+            self._hits_count += 1
+        else:
+            self._misses_count += 1
+
+        self._waiting_requests_count += 1
+
+        try:
+            if not is_hit:
+                logger.debug("No agreements in the pool, requesting fill")
+                await self._request_agreements()
+
+            agreement = await self._buffer.get()
+        finally:
+            self._waiting_requests_count -= 1
+
+        if self._buffer.size() < self._min_size:
+            await self._request_agreements()
+
+        await self._track_agreement(agreement)
+        return agreement
+
+    async def _create_pooled_agreement(self) -> Agreement:
+        agreement = await self._create_agreement()
+
+        #   Expiration is resolved before the agreement is put into the pool, so it can't be lost
+        try:
+            self._idle_expirations[agreement.id] = await self._get_idle_expiration(agreement)
+        except BaseException:
+            self._terminate_surplus_agreement(agreement)
+            raise
+
+        return agreement
+
+    async def _get_idle_expiration(self, agreement: Agreement) -> Optional[timedelta]:
+        agreement_data = await agreement.get_data()
+        expiration = payload_defaults.ActivityInfo.from_properties(
+            agreement_data.demand.properties
+        ).expiration
+
+        if expiration is None:
+            return self._max_idle_time
+
+        idle_expiration = max(expiration - utc_now() - self._min_remaining_time, timedelta(0))
+
+        if self._max_idle_time is not None:
+            return min(idle_expiration, self._max_idle_time)
+
+        return idle_expiration
+
+    async def _request_agreements(self) -> None:
+        #   Pending requests are always served, even if pool size would exceed its maximum
+        target_size = max(self._max_size, self._waiting_requests_count)
+        requested = target_size - self._buffer.size_with_requested()
+
+        if 0 < requested:
+            logger.debug("Requesting %d agreements to fill the pool", requested)
+            await self._buffer.request(requested)
+
+    async def _on_expired(self, agreement: Agreement) -> None:
+        logger.debug("Terminating agreement `%s` idle in the pool for too long", agreement)
+
+        await self._request_agreements()
+        await agreement.close_all()
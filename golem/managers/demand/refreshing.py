@@ -1,23 +1,44 @@
 import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Awaitable, Callable, List, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List
 
-from golem.managers.base import DemandManager
+from golem.managers.base import DemandManager, ManagerException
 from golem.managers.mixins import BackgroundLoopMixin
 from golem.node import GolemNode
 from golem.payload import Payload
 from golem.payload import defaults as payload_defaults
 from golem.resources import Allocation, Demand, Proposal
 from golem.resources.demand.demand_builder import DemandBuilder
-from golem.utils.asyncio import ErrorReportingQueue, create_task_with_logging, ensure_cancelled_many
+from golem.utils.asyncio import (
+    ErrorReportingQueue,
+    create_task_with_logging,
+    ensure_cancelled,
+    ensure_cancelled_many,
+)
+from golem.utils.clock import utc_now
 from golem.utils.logging import get_trace_id_name, trace_span
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _SubscribedDemand:
+    demand: Demand
+    consumer_task: asyncio.Task
+    first_proposal_received: asyncio.Event
+
+
 class RefreshingDemandManager(BackgroundLoopMixin, DemandManager):
-    """DemandManager that creates new demand under the hood after given lifetime is reached."""
+    """DemandManager that creates new demand under the hood after given lifetime is reached.
+
+    Replacement demand is subscribed `rollover_lead_time` before the current one expires, so
+    the proposal stream doesn't go dry while it is created. Proposals of the replaced demand
+    stop being collected as soon as the new one receives its first proposal, but the replaced
+    demand is unsubscribed only when it expires, so its proposals that are already queued or
+    being negotiated stay usable until then. Its proposals still queued at that point are skipped.
+    """
 
     def __init__(
         self,
@@ -26,16 +47,24 @@ class RefreshingDemandManager(BackgroundLoopMixin, DemandManager):
         payloads: List[Payload],
         demand_lifetime: timedelta = payload_defaults.DEFAULT_LIFETIME,
         subnet_tag: str = payload_defaults.DEFAULT_SUBNET,
+        rollover_lead_time: timedelta = timedelta(minutes=1),
     ) -> None:
+        if rollover_lead_time >= demand_lifetime:
+            raise ManagerException(
+                "RefreshingDemandManager `rollover_lead_time` must be shorter than"
+                " `demand_lifetime`!"
+            )
+
         self._golem = golem
         self._get_allocation = get_allocation
         self._payloads = payloads
         self._demand_lifetime = demand_lifetime
         self._subnet_tag = subnet_tag
+        self._rollover_lead_time = rollover_lead_time
 
         self._initial_proposals: ErrorReportingQueue[Proposal] = ErrorReportingQueue()
 
-        self._demands: List[Tuple[Demand, asyncio.Task]] = []
+        self._demands: List[_SubscribedDemand] = []
         super().__init__()
 
     @trace_span("Starting RefreshingDemandManager", log_level=logging.INFO)
@@ -48,19 +77,28 @@ class RefreshingDemandManager(BackgroundLoopMixin, DemandManager):
 
     @trace_span("Getting initial proposal", show_results=True)
     async def get_initial_proposal(self) -> Proposal:
-        proposal = await self._initial_proposals.get()
-        self._initial_proposals.task_done()
-        return proposal
+        while True:
+            proposal = await self._initial_proposals.get()
+            self._initial_proposals.task_done()
+
+            if any(d.demand is proposal.demand for d in self._demands):
+                return proposal
+
+            logger.debug(f"Skipping initial proposal {proposal} of unsubscribed demand")
 
     @trace_span()
     async def _background_loop(self) -> None:
         try:
+            await self._create_and_subscribe_demand()
+
             while True:
-                if self._demands:
-                    await self._wait_for_demand_to_expire()
-                    await self._stop_consuming_initial_proposals()
+                current_demand = self._demands[-1]
+
+                expiration_date = await current_demand.demand.get_expiration_date()
+                await self._sleep_until(expiration_date - self._rollover_lead_time)
 
                 await self._create_and_subscribe_demand()
+                await self._retire_demand(current_demand, self._demands[-1], expiration_date)
         except Exception as e:
             self._initial_proposals.set_exception(e)
             logger.debug(
@@ -71,11 +109,38 @@ class RefreshingDemandManager(BackgroundLoopMixin, DemandManager):
             await self._stop_consuming_initial_proposals()
             await self._unsubscribe_demands()
 
-    async def _wait_for_demand_to_expire(self):
-        await self._demands[-1][0].get_data()
-        expiration_date = await self._demands[-1][0].get_expiration_date()
-        remaining = expiration_date - datetime.now(timezone.utc)
-        await asyncio.sleep(remaining.total_seconds())
+    async def _sleep_until(self, date: datetime) -> None:
+        remaining = date - utc_now()
+        await asyncio.sleep(max(remaining.total_seconds(), 0))
+
+    @trace_span()
+    async def _retire_demand(
+        self,
+        demand: _SubscribedDemand,
+        new_demand: _SubscribedDemand,
+        expiration_date: datetime,
+    ) -> None:
+        #   Proposals from replaced demand are consumed until the new one takes over
+        try:
+            await asyncio.wait_for(
+                new_demand.first_proposal_received.wait(),
+                timeout=max((expiration_date - utc_now()).total_seconds(), 0),
+            )
+        except asyncio.TimeoutError:
+            logger.debug(
+                "Demand `%s` expired before its replacement received any proposal", demand.demand
+            )
+
+        await ensure_cancelled(demand.consumer_task)
+
+        #   Proposals already collected from replaced demand are negotiable until it expires
+        await self._sleep_until(expiration_date)
+        self._demands.remove(demand)
+
+        try:
+            await demand.demand.unsubscribe()
+        except Exception as e:
+            logger.warning(f"Unable to unsubscribe demand due to {type(e)}:\n{e}")
 
     @trace_span()
     async def _create_and_subscribe_demand(self):
@@ -85,18 +150,23 @@ class RefreshingDemandManager(BackgroundLoopMixin, DemandManager):
         demand = await demand_builder.create_demand(self._golem)
         demand.start_collecting_events()
         await demand.get_data()
+
+        first_proposal_received = asyncio.Event()
         self._demands.append(
-            (
+            _SubscribedDemand(
                 demand,
                 create_task_with_logging(
-                    self._consume_initial_proposals(demand),
+                    self._consume_initial_proposals(demand, first_proposal_received),
                     trace_id=get_trace_id_name(self, f"demand-{demand.id}-proposal-consumer-loop"),
                 ),
+                first_proposal_received,
             )
         )
 
     @trace_span()
-    async def _consume_initial_proposals(self, demand: Demand):
+    async def _consume_initial_proposals(
+        self, demand: Demand, first_proposal_received: asyncio.Event
+    ):
         try:
             initial_proposals_gen = demand.initial_proposals()
             first_initial_proposal = await initial_proposals_gen.__anext__()
@@ -104,6 +174,7 @@ class RefreshingDemandManager(BackgroundLoopMixin, DemandManager):
 
             logger.debug(f"New initial proposal {first_initial_proposal}")
             self._initial_proposals.put_nowait(first_initial_proposal)
+            first_proposal_received.set()
 
             async for initial in initial_proposals_gen:
                 logger.debug(f"New initial proposal {initial}")
@@ -113,7 +184,7 @@ class RefreshingDemandManager(BackgroundLoopMixin, DemandManager):
 
     @trace_span()
     async def _stop_consuming_initial_proposals(self) -> None:
-        await ensure_cancelled_many([d[1] for d in self._demands])
+        await ensure_cancelled_many([d.consumer_task for d in self._demands])
 
     @trace_span()
     async def _prepare_demand_builder(self, allocation: Allocation) -> DemandBuilder:
@@ -133,7 +204,7 @@ class RefreshingDemandManager(BackgroundLoopMixin, DemandManager):
     @trace_span()
     async def _unsubscribe_demands(self):
         results = await asyncio.gather(
-            *[demand.unsubscribe() for demand, _ in self._demands], return_exceptions=True
+            *[d.demand.unsubscribe() for d in self._demands], return_exceptions=True
         )
         for result in results:
             if isinstance(result, Exception):
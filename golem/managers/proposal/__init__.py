@@ -1,6 +1,7 @@
 from golem.managers.proposal.default import DefaultProposalManager
 from golem.managers.proposal.plugins import (
     BlacklistProviderIdPlugin,
+    DeduplicateProposalsPlugin,
     LinearAverageCostPricing,
     LinearCoeffsCost,
     LinearPerCpuAverageCostPricing,
@@ -13,6 +14,9 @@ from golem.managers.proposal.plugins import (
     ProposalBuffer,
     ProposalScoringBuffer,
     ProposalScoringMixin,
+    ProposalTable,
+    ProviderCooldownPlugin,
+    ProviderStatsScore,
     RandomScore,
     RejectIfCostsExceeds,
 )
@@ -20,6 +24,8 @@ from golem.managers.proposal.plugins import (
 __all__ = (
     "DefaultProposalManager",
     "BlacklistProviderIdPlugin",
+    "ProviderCooldownPlugin",
+    "DeduplicateProposalsPlugin",
     "ProposalBuffer",
     "PaymentPlatformNegotiator",
     "MidAgreementPaymentsNegotiator",
@@ -32,6 +38,8 @@ __all__ = (
     "LinearCoeffsCost",
     "LinearPerCpuCoeffsCost",
     "PropertyValueLerpScore",
+    "ProviderStatsScore",
     "RandomScore",
     "ProposalScoringBuffer",
+    "ProposalTable",
 )
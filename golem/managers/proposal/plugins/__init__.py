@@ -1,5 +1,7 @@
 from golem.managers.proposal.plugins.blacklist import BlacklistProviderIdPlugin
 from golem.managers.proposal.plugins.buffer import ProposalBuffer
+from golem.managers.proposal.plugins.cooldown import ProviderCooldownPlugin
+from golem.managers.proposal.plugins.deduplicate import DeduplicateProposalsPlugin
 from golem.managers.proposal.plugins.linear_coeffs import LinearCoeffsCost, LinearPerCpuCoeffsCost
 from golem.managers.proposal.plugins.negotiating import (
     MidAgreementPaymentsNegotiator,
@@ -14,12 +16,16 @@ from golem.managers.proposal.plugins.scoring import (
     PropertyValueLerpScore,
     ProposalScoringBuffer,
     ProposalScoringMixin,
+    ProposalTable,
+    ProviderStatsScore,
     RandomScore,
 )
 
 __all__ = (
     "BlacklistProviderIdPlugin",
     "ProposalBuffer",
+    "ProviderCooldownPlugin",
+    "DeduplicateProposalsPlugin",
     "PaymentPlatformNegotiator",
     "MidAgreementPaymentsNegotiator",
     "NegotiatingPlugin",
@@ -31,6 +37,8 @@ __all__ = (
     "LinearCoeffsCost",
     "LinearPerCpuCoeffsCost",
     "PropertyValueLerpScore",
+    "ProviderStatsScore",
     "RandomScore",
     "ProposalScoringBuffer",
+    "ProposalTable",
 )
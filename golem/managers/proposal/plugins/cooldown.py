@@ -0,0 +1,219 @@
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+from golem.managers import ProposalManagerPlugin
+from golem.node import GolemNode
+from golem.resources import (
+    Activity,
+    ActivityClosed,
+    AgreementNotApproved,
+    BatchFinished,
+    PoolingBatch,
+    Proposal,
+    ProposalRejectedByProvider,
+)
+from golem.utils.clock import utc_now
+from golem.utils.logging import trace_span
+
+logger = logging.getLogger(__name__)
+
+PROPOSAL_REJECTED = "proposal_rejected"
+AGREEMENT_NOT_APPROVED = "agreement_not_approved"
+ACTIVITY_FAILED = "activity_failed"
+
+
+@dataclass
+class _ProviderFailures:
+    count: int
+    last_failure_at: datetime
+    cooldown_until: datetime
+
+
+class ProviderCooldownPlugin(ProposalManagerPlugin):
+    """Skips proposals from providers that recently failed, until their cooldown passes.
+
+    Provider fails when it rejects our proposal, doesn't approve the agreement, or when its
+    activity doesn't run the first batch successfully, i.e. the first batch fails, or the activity
+    is closed before that, e.g. as it couldn't be deployed. Agreements closed by us, e.g. when
+    managers release surplus or idle ones, are no failures of the provider.
+    Each failure puts the provider on a cooldown, doubled with
+    each consecutive failure, starting at `base_cooldown` and capped at `max_cooldown`. Failures
+    are forgotten after `failures_ttl` without a new failure, and after the provider successfully
+    runs its first batch.
+
+    Plugin should be placed before any negotiating plugin, so negotiations and agreements with
+    providers on cooldown are not even attempted. Counters of failures and of skipped proposals
+    are available as `failures_counts` and `skipped_proposals_count`.
+    """
+
+    def __init__(
+        self,
+        golem: GolemNode,
+        base_cooldown: timedelta = timedelta(seconds=30),
+        max_cooldown: timedelta = timedelta(minutes=30),
+        failures_ttl: timedelta = timedelta(hours=1),
+    ) -> None:
+        self._golem = golem
+        self._base_cooldown = base_cooldown
+        self._max_cooldown = max_cooldown
+        self._failures_ttl = failures_ttl
+
+        self._event_handlers: List = []
+        self._providers_failures: Dict[str, _ProviderFailures] = {}
+        self._started_activities_ids: Set[str] = set()
+
+        self._failures_counts: Counter = Counter()
+        self._skipped_proposals_count = 0
+
+    @property
+    def failures_counts(self) -> Dict[str, int]:
+        """Number of provider failures seen, by their kind."""
+        return dict(self._failures_counts)
+
+    @property
+    def skipped_proposals_count(self) -> int:
+        """Number of proposals skipped, as their providers were on cooldown.
+
+        Each skipped proposal is at least one negotiation round-trip saved.
+        """
+        return self._skipped_proposals_count
+
+    @trace_span()
+    async def start(self) -> None:
+        self._event_handlers.extend(
+            [
+                await self._golem.event_bus.on(
+                    ProposalRejectedByProvider, self._handle_proposal_rejected
+                ),
+                await self._golem.event_bus.on(
+                    AgreementNotApproved, self._handle_agreement_not_approved
+                ),
+                await self._golem.event_bus.on(BatchFinished, self._handle_batch_finished),
+                await self._golem.event_bus.on(ActivityClosed, self._handle_activity_closed),
+            ]
+        )
+
+    @trace_span()
+    async def stop(self) -> None:
+        for event_handler in self._event_handlers:
+            await self._golem.event_bus.off(event_handler)
+        self._event_handlers.clear()
+
+    @trace_span(show_results=True)
+    async def get_proposal(self) -> Proposal:
+        while True:
+            proposal: Proposal = await self._get_proposal()
+            provider_id = await proposal.get_provider_id()
+            cooldown_until = self.get_cooldown_until(provider_id)
+
+            if cooldown_until is None:
+                return proposal
+
+            self._skipped_proposals_count += 1
+
+            if not proposal.initial:
+                await proposal.reject("provider_id is on cooldown")
+
+            logger.debug(
+                "Provider `%s` from proposal `%s` is on cooldown until %s, picking different"
+                " proposal...",
+                provider_id,
+                proposal,
+                cooldown_until,
+            )
+
+    def get_cooldown_until(self, provider_id: str) -> Optional[datetime]:
+        """Return end of the cooldown of given provider, or `None` if it is not on cooldown."""
+        failures = self._get_provider_failures(provider_id)
+
+        if failures is None or failures.cooldown_until <= utc_now():
+            return None
+
+        return failures.cooldown_until
+
+    def record_failure(self, provider_id: str, kind: str) -> None:
+        """Put given provider on cooldown, longer with each consecutive failure."""
+        now = utc_now()
+        failures = self._get_provider_failures(provider_id)
+        count = failures.count + 1 if failures is not None else 1
+
+        cooldown = min(self._base_cooldown * 2 ** (count - 1), self._max_cooldown)
+        self._providers_failures[provider_id] = _ProviderFailures(count, now, now + cooldown)
+        self._failures_counts[kind] += 1
+
+        logger.debug(
+            "Provider `%s` failed with `%s` %d time(s) in a row, putting it on cooldown for %s",
+            provider_id,
+            kind,
+            count,
+            cooldown,
+        )
+
+    def record_success(self, provider_id: str) -> None:
+        """Forget failures of given provider."""
+        self._providers_failures.pop(provider_id, None)
+
+    def _get_provider_failures(self, provider_id: str) -> Optional[_ProviderFailures]:
+        failures = self._providers_failures.get(provider_id)
+
+        if failures is not None and failures.last_failure_at + self._failures_ttl <= utc_now():
+            del self._providers_failures[provider_id]
+            return None
+
+        return failures
+
+    async def _handle_proposal_rejected(self, event: ProposalRejectedByProvider) -> None:
+        proposal = event.resource
+
+        #   Rejected proposal is our counter proposal, issued in response to provider's proposal
+        if not proposal.has_parent or not isinstance(proposal.parent, Proposal):
+            return
+
+        self.record_failure(await proposal.parent.get_provider_id(), PROPOSAL_REJECTED)
+
+    async def _handle_agreement_not_approved(self, event: AgreementNotApproved) -> None:
+        agreement = event.resource
+
+        if not agreement.has_parent:
+            return
+
+        self.record_failure(await agreement.proposal.get_provider_id(), AGREEMENT_NOT_APPROVED)
+
+    async def _handle_batch_finished(self, event: BatchFinished) -> None:
+        batch: PoolingBatch = event.resource
+
+        if not batch.has_parent:
+            return
+
+        activity: Activity = batch.parent
+
+        #   Only the first batch tells if activity failed right away, e.g. on deploy
+        if activity.id in self._started_activities_ids:
+            return
+
+        self._started_activities_ids.add(activity.id)
+
+        if not activity.has_parent or not activity.agreement.has_parent:
+            return
+
+        provider_id = await activity.agreement.proposal.get_provider_id()
+
+        if batch.success:
+            self.record_success(provider_id)
+        else:
+            self.record_failure(provider_id, ACTIVITY_FAILED)
+
+    async def _handle_activity_closed(self, event: ActivityClosed) -> None:
+        activity: Activity = event.resource
+
+        if activity.id in self._started_activities_ids:
+            self._started_activities_ids.discard(activity.id)
+            return
+
+        #   Activity closed before finishing any batch, e.g. its deploy timed out
+        if activity.has_parent and activity.agreement.has_parent:
+            provider_id = await activity.agreement.proposal.get_provider_id()
+            self.record_failure(provider_id, ACTIVITY_FAILED)
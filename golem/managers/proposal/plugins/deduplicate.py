@@ -0,0 +1,163 @@
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple, Union
+
+from golem.managers.base import ProposalManagerPlugin
+from golem.node import GolemNode
+from golem.resources import (
+    NewAgreement,
+    Proposal,
+    ProposalData,
+    ProposalRejectedByProvider,
+    ProposalRejectedByRequestor,
+)
+from golem.utils.clock import utc_now
+from golem.utils.logging import trace_span
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PassedProposal:
+    proposal_id: str
+    demand_expiration_date: datetime
+    passed_at: datetime
+
+
+class DeduplicateProposalsPlugin(ProposalManagerPlugin):
+    """Drops initial proposals that duplicate a recently passed one.
+
+    Same offer of a provider can be received many times, e.g. from overlapping demands of
+    `RefreshingDemandManager` or from several demands aggregated by `AggregatingDemandManager`.
+    Initial proposals are considered duplicates if they have the same issuer and the same
+    properties. Duplicates received within `window` after passing a proposal are dropped before
+    they are scored, negotiated or turned into agreements, unless they come from a newer demand,
+    as proposals of the older demand become unusable when it expires.
+
+    Passed proposal is forgotten when it is rejected by either side or turned into an agreement,
+    so the next duplicate is passed on again.
+
+    Initial proposals don't require rejection, so dropping them costs no network round-trips.
+    Other proposals are always passed on.
+    """
+
+    def __init__(self, golem: GolemNode, window: timedelta = timedelta(minutes=5)) -> None:
+        self._golem = golem
+        self._window = window
+
+        self._event_handlers: List = []
+        #   Ordered by passing time, so expired keys are always at the front
+        self._passed_proposals: "OrderedDict[Tuple[str, str], _PassedProposal]" = OrderedDict()
+        self._passed_proposals_keys: Dict[str, Tuple[str, str]] = {}
+        self._dropped_proposals_count = 0
+
+    @property
+    def dropped_proposals_count(self) -> int:
+        """Number of duplicated proposals dropped."""
+        return self._dropped_proposals_count
+
+    @trace_span()
+    async def start(self) -> None:
+        self._event_handlers.extend(
+            [
+                await self._golem.event_bus.on(
+                    ProposalRejectedByProvider, self._handle_proposal_done
+                ),
+                await self._golem.event_bus.on(
+                    ProposalRejectedByRequestor, self._handle_proposal_done
+                ),
+                await self._golem.event_bus.on(NewAgreement, self._handle_new_agreement),
+            ]
+        )
+
+    @trace_span()
+    async def stop(self) -> None:
+        for event_handler in self._event_handlers:
+            await self._golem.event_bus.off(event_handler)
+        self._event_handlers.clear()
+
+    @trace_span(show_results=True)
+    async def get_proposal(self) -> Proposal:
+        while True:
+            proposal: Proposal = await self._get_proposal()
+
+            if not proposal.initial:
+                return proposal
+
+            proposal_data = await proposal.get_proposal_data()
+            key = (proposal_data.issuer_id or "", self._get_properties_hash(proposal_data))
+            demand_expiration_date = await proposal.demand.get_expiration_date()
+            now = utc_now()
+
+            self._forget_expired(now)
+
+            passed_proposal = self._passed_proposals.get(key)
+
+            if (
+                passed_proposal is None
+                or passed_proposal.demand_expiration_date < demand_expiration_date
+            ):
+                self._forget(key)
+                self._passed_proposals[key] = _PassedProposal(
+                    proposal.id, demand_expiration_date, now
+                )
+                self._passed_proposals_keys[proposal.id] = key
+                return proposal
+
+            self._dropped_proposals_count += 1
+
+            logger.debug(
+                "Proposal `%s` duplicates proposal from `%s` passed at %s, picking different"
+                " one...",
+                proposal,
+                proposal_data.issuer_id,
+                passed_proposal.passed_at,
+            )
+
+    def _forget_expired(self, now: datetime) -> None:
+        while self._passed_proposals:
+            key, passed_proposal = next(iter(self._passed_proposals.items()))
+
+            if now < passed_proposal.passed_at + self._window:
+                return
+
+            self._forget(key)
+
+    def _forget(self, key: Tuple[str, str]) -> None:
+        passed_proposal = self._passed_proposals.pop(key, None)
+
+        if passed_proposal is not None:
+            del self._passed_proposals_keys[passed_proposal.proposal_id]
+
+    async def _handle_proposal_done(
+        self, event: Union[ProposalRejectedByProvider, ProposalRejectedByRequestor]
+    ) -> None:
+        self._forget_initial_proposal(event.resource)
+
+    async def _handle_new_agreement(self, event: NewAgreement) -> None:
+        agreement = event.resource
+
+        if agreement.has_parent:
+            self._forget_initial_proposal(agreement.proposal)
+
+    def _forget_initial_proposal(self, proposal: Proposal) -> None:
+        #   Negotiation goes down the tree of counter proposals starting at the initial one
+        while proposal.has_parent and isinstance(proposal.parent, Proposal):
+            proposal = proposal.parent
+
+        key = self._passed_proposals_keys.get(proposal.id)
+
+        if key is not None:
+            self._forget(key)
+
+    @staticmethod
+    def _get_properties_hash(proposal_data: ProposalData) -> str:
+        #   `dict.items()` is used to read values without making their copies
+        serialized = json.dumps(
+            dict(dict.items(proposal_data.properties)), sort_keys=True, default=str
+        )
+        return hashlib.sha256(serialized.encode()).hexdigest()
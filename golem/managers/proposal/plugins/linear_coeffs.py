@@ -1,10 +1,15 @@
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from golem.payload import defaults
 from golem.resources import LinearCoeffs, ProposalData
 from golem.utils.logging import trace_span
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from golem.managers.proposal.plugins.scoring.table import ProposalTable
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +29,9 @@ class LinearCoeffsCost:
 
         return float(getattr(coeffs, self._coeff_name))
 
+    def calculate_table(self, table: "ProposalTable") -> "npt.NDArray[Any]":
+        return table.get_linear_coeffs_column(self._coeff_name)
+
 
 class LinearPerCpuCoeffsCost(LinearCoeffsCost):
     def __call__(self, proposal_data: ProposalData) -> Optional[float]:
@@ -33,3 +41,10 @@ class LinearPerCpuCoeffsCost(LinearCoeffsCost):
             return None
 
         return super().__call__(proposal_data) / cpu_count
+
+    def calculate_table(self, table: "ProposalTable") -> "npt.NDArray[Any]":
+        import numpy as np
+
+        cpu_count = table.get_property_column(defaults.PROP_INF_CPU_THREADS)
+
+        return super().calculate_table(table) / np.where(cpu_count != 0, cpu_count, np.nan)
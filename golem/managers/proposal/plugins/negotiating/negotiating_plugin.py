@@ -2,7 +2,7 @@ import asyncio
 import logging
 from copy import deepcopy
 from datetime import timedelta
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Set, Union
 
 from ya_market import ApiException
 
@@ -10,8 +10,13 @@ from golem.managers import ProposalManagerPlugin, RejectProposal
 from golem.managers.base import ManagerPluginException, ProposalNegotiator
 from golem.resources import DemandData, Proposal
 from golem.resources.proposal.exceptions import ProposalRejected
-from golem.utils.asyncio.tasks import resolve_maybe_awaitable
-from golem.utils.logging import trace_span
+from golem.utils.asyncio.tasks import (
+    create_task_with_logging,
+    ensure_cancelled_many,
+    resolve_maybe_awaitable,
+)
+from golem.utils.clock import utc_now
+from golem.utils.logging import get_trace_id_name, trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +24,24 @@ DEFAULT_PROPOSAL_RESPONSE_TIMEOUT = timedelta(seconds=5)
 
 
 class NegotiatingPlugin(ProposalManagerPlugin):
+    """Negotiates proposals with `proposal_negotiators` until they are ready for an agreement.
+
+    By default proposals are negotiated one at a time, when requested. With
+    `negotiation_concurrency` greater than 1, up to that many negotiations are running
+    concurrently while there are pending requests, so a few unresponsive providers don't hold up
+    the others. Negotiated proposals are served in order of completion, and negotiations
+    still running when all pending requests are served are cancelled, rejecting provider responses
+    to their outstanding counter proposals. Negotiated proposals that expired while waiting for
+    a request are skipped. Number of counter proposals waiting for a provider response can be
+    capped with `max_pending_counter_proposals`.
+    """
+
     def __init__(
         self,
         proposal_negotiators: Optional[Sequence[ProposalNegotiator]] = None,
         proposal_response_timeout: timedelta = DEFAULT_PROPOSAL_RESPONSE_TIMEOUT,
+        negotiation_concurrency: int = 1,
+        max_pending_counter_proposals: Optional[int] = None,
         *args,
         **kwargs,
     ) -> None:
@@ -30,14 +49,93 @@ class NegotiatingPlugin(ProposalManagerPlugin):
             list(proposal_negotiators) if proposal_negotiators is not None else []
         )
         self._proposal_response_timeout = proposal_response_timeout.total_seconds()
+        self._negotiation_concurrency = negotiation_concurrency
+        self._counter_proposals_semaphore = (
+            asyncio.Semaphore(max_pending_counter_proposals)
+            if max_pending_counter_proposals is not None
+            else None
+        )
 
         self._success_count = 0
         self._fail_count = 0
 
+        self._negotiation_tasks: Set[asyncio.Task] = set()
+        self._reject_tasks: Set[asyncio.Task] = set()
+        self._negotiated_proposals: asyncio.Queue[Union[Proposal, BaseException]] = asyncio.Queue()
+        self._pending_requests_count = 0
+
         super().__init__(*args, **kwargs)
 
+    @trace_span()
+    async def stop(self) -> None:
+        await ensure_cancelled_many(self._negotiation_tasks)
+        self._negotiation_tasks.clear()
+        await ensure_cancelled_many(self._reject_tasks)
+
     @trace_span(show_results=True)
     async def get_proposal(self) -> Proposal:
+        if self._negotiation_concurrency <= 1:
+            return await self._get_negotiated_proposal()
+
+        self._pending_requests_count += 1
+
+        try:
+            while True:
+                self._start_negotiations()
+
+                result = await self._negotiated_proposals.get()
+
+                if isinstance(result, BaseException):
+                    raise result
+
+                if not await self._is_expired(result):
+                    return result
+
+                logger.debug(f"Negotiated proposal `{result}` expired in the queue, skipping...")
+        finally:
+            self._pending_requests_count -= 1
+
+    async def _is_expired(self, proposal: Proposal) -> bool:
+        return await proposal.get_expiration_date() <= utc_now()
+
+    def _start_negotiations(self) -> None:
+        if self._pending_requests_count <= self._negotiated_proposals.qsize():
+            return
+
+        #   All negotiations are racing for pending requests, first negotiated proposals win
+        while len(self._negotiation_tasks) < self._negotiation_concurrency:
+            task = asyncio.create_task(self._get_negotiated_proposal())
+            task.add_done_callback(self._on_negotiation_done)
+            self._negotiation_tasks.add(task)
+
+    def _on_negotiation_done(self, task: asyncio.Task) -> None:
+        self._negotiation_tasks.discard(task)
+
+        if task.cancelled():
+            return
+
+        exception = task.exception()
+
+        if exception is None:
+            self._negotiated_proposals.put_nowait(task.result())
+        elif self._negotiated_proposals.qsize() < self._pending_requests_count:
+            self._negotiated_proposals.put_nowait(exception)
+        else:
+            #   Nobody is waiting for the error, so it would be raised to some unrelated request
+            logger.debug("Surplus negotiation failed, ignoring the error", exc_info=exception)
+
+        if self._pending_requests_count <= self._negotiated_proposals.qsize():
+            surplus_tasks = list(self._negotiation_tasks)
+            self._negotiation_tasks.clear()
+
+            logger.debug("All requests are served, cancelling %d negotiations", len(surplus_tasks))
+
+            for surplus_task in surplus_tasks:
+                surplus_task.cancel()
+        else:
+            self._start_negotiations()
+
+    async def _get_negotiated_proposal(self) -> Proposal:
         while True:
             proposal = await self._get_proposal()
             demand_data = await proposal.demand.get_demand_data()
@@ -90,10 +188,45 @@ class NegotiatingPlugin(ProposalManagerPlugin):
 
             demand_data = demand_data_after_negotiators
 
-            demand_proposal = await self._send_demand_proposal(offer_proposal, demand_data)
-            new_offer_proposal = await self._wait_for_proposal_response(demand_proposal)
+            offer_proposal = await self._send_demand_proposal_and_wait_for_response(
+                offer_proposal, demand_data
+            )
+
+    async def _send_demand_proposal_and_wait_for_response(
+        self, offer_proposal: Proposal, demand_data: DemandData
+    ) -> Proposal:
+        if self._counter_proposals_semaphore is None:
+            return await self._send_and_wait_for_response(offer_proposal, demand_data)
+
+        async with self._counter_proposals_semaphore:
+            return await self._send_and_wait_for_response(offer_proposal, demand_data)
 
-            offer_proposal = new_offer_proposal
+    async def _send_and_wait_for_response(
+        self, offer_proposal: Proposal, demand_data: DemandData
+    ) -> Proposal:
+        demand_proposal = await self._send_demand_proposal(offer_proposal, demand_data)
+
+        try:
+            return await self._wait_for_proposal_response(demand_proposal)
+        except asyncio.CancelledError:
+            #   Provider would keep negotiating on the counter proposal nobody waits for anymore
+            task = create_task_with_logging(
+                self._reject_proposal_response(demand_proposal),
+                trace_id=get_trace_id_name(self, "reject-proposal-response"),
+            )
+            self._reject_tasks.add(task)
+            task.add_done_callback(self._reject_tasks.discard)
+            raise
+
+    async def _reject_proposal_response(self, demand_proposal: Proposal) -> None:
+        try:
+            offer_proposal = await self._wait_for_proposal_response(demand_proposal)
+            await self._reject_proposal(offer_proposal)
+        except Exception:
+            logger.debug(
+                f"Failed to reject response to cancelled counter proposal `{demand_proposal}`",
+                exc_info=True,
+            )
 
     @trace_span()
     async def _wait_for_proposal_response(self, demand_proposal: Proposal) -> Proposal:
@@ -1,10 +1,7 @@
 import logging
-from datetime import datetime
-from typing import cast
 
 from golem.managers.base import PricingCallable, ProposalManagerPlugin
-from golem.payload import Constraints, Properties
-from golem.resources import Proposal, ProposalData
+from golem.resources import Proposal
 from golem.utils.logging import trace_span
 
 logger = logging.getLogger(__name__)
@@ -22,7 +19,7 @@ class RejectIfCostsExceeds(ProposalManagerPlugin):
     async def get_proposal(self) -> Proposal:
         while True:
             proposal: Proposal = await self._get_proposal()
-            proposal_data = await self._get_proposal_data_from_proposal(proposal)
+            proposal_data = await proposal.get_proposal_data()
 
             cost = self._pricing_callable(proposal_data)
 
@@ -56,16 +53,3 @@ class RejectIfCostsExceeds(ProposalManagerPlugin):
                 continue
 
             return proposal
-
-    async def _get_proposal_data_from_proposal(self, proposal: Proposal) -> ProposalData:
-        data = await proposal.get_data()
-
-        return ProposalData(
-            properties=Properties(data.properties),
-            constraints=Constraints(),
-            proposal_id=data.proposal_id,
-            issuer_id=data.issuer_id,
-            state=data.state,
-            timestamp=cast(datetime, data.timestamp),
-            prev_proposal_id=data.prev_proposal_id,
-        )
@@ -5,8 +5,10 @@ from golem.managers.proposal.plugins.scoring.pricings import (
     LinearPerCpuAverageCostPricing,
 )
 from golem.managers.proposal.plugins.scoring.property_value_lerp import PropertyValueLerpScore
+from golem.managers.proposal.plugins.scoring.provider_stats import ProviderStatsScore
 from golem.managers.proposal.plugins.scoring.random import RandomScore
 from golem.managers.proposal.plugins.scoring.scoring_buffer import ProposalScoringBuffer
+from golem.managers.proposal.plugins.scoring.table import ProposalTable
 
 __all__ = (
     "MapScore",
@@ -14,6 +16,8 @@ __all__ = (
     "LinearAverageCostPricing",
     "LinearPerCpuAverageCostPricing",
     "PropertyValueLerpScore",
+    "ProviderStatsScore",
     "RandomScore",
     "ProposalScoringBuffer",
+    "ProposalTable",
 )
@@ -1,8 +1,13 @@
-from typing import Callable, List, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple, Union
 
 from golem.managers.base import ProposalScorer, ProposalScoringResult
 from golem.resources import ProposalData
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from golem.managers.proposal.plugins.scoring.table import ProposalTable
+
 PropertyValueNumeric = Union[int, float]
 BoundaryValues = Tuple[Tuple[float, PropertyValueNumeric], Tuple[float, PropertyValueNumeric]]
 
@@ -18,6 +23,11 @@ class MapScore(ProposalScorer):
         self._normalize = normalize
         self._normalize_flip = normalize_flip
 
+    @property
+    def is_stateless(self) -> bool:
+        """Score of the proposal doesn't depend on other scored proposals, unless normalized."""
+        return not self._normalize
+
     def __call__(self, proposals_data: Sequence[ProposalData]) -> ProposalScoringResult:
         result = [self._callback(proposal_data) for proposal_data in proposals_data]
 
@@ -52,3 +62,33 @@ class MapScore(ProposalScorer):
             else:
                 flipped_result.append(v)
         return flipped_result
+
+    def score_table(self, table: "ProposalTable") -> Optional["npt.NDArray[Any]"]:
+        """Score proposals at once, if callback supports `calculate_table()`."""
+        calculate_table = getattr(self._callback, "calculate_table", None)
+        if calculate_table is None:
+            return None
+
+        import numpy as np
+
+        result = np.asarray(calculate_table(table), dtype=np.float64)
+
+        if not self._normalize:
+            return result
+
+        #   Like in regular scoring, zeros are not taken into account
+        filtered = result[~np.isnan(result) & (result != 0)]
+        if not filtered.size:
+            return result
+
+        result_min = filtered.min()
+        result_div = filtered.max() - result_min
+        if result_div == 0:
+            return result
+
+        normalized_result = (result - result_min) / result_div
+
+        if not self._normalize_flip:
+            return normalized_result
+
+        return 1 - normalized_result
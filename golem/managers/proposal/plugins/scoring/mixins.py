@@ -1,27 +1,52 @@
-from datetime import datetime
-from typing import List, Optional, Sequence, Tuple, cast
+import asyncio
+from typing import Any, List, Optional, Sequence, Tuple
 
 from golem.managers.base import ScorerWithOptionalWeight
-from golem.payload import PayloadSyntaxParser, Properties
+from golem.managers.proposal.plugins.scoring.table import (
+    ProposalTable,
+    calculate_weighted_table_scores,
+    is_numpy_available,
+    is_table_scores,
+    table_scores_to_list,
+)
 from golem.resources import Proposal, ProposalData
 from golem.utils.asyncio.tasks import resolve_maybe_awaitable
 from golem.utils.logging import trace_span
 
 
 class ProposalScoringMixin:
+    """Scores proposals with given `proposal_scorers`.
+
+    If optional `numpy` dependency is installed, scorers supporting vectorized scoring are run
+    on :any:`ProposalTable` built once per scoring round.
+
+    Scorers can declare with `is_stateless` attribute set to `True`, that score of the proposal
+    doesn't depend on other scored proposals, so proposals can be scored incrementally.
+    """
+
     def __init__(
         self,
         proposal_scorers: Optional[Sequence[ScorerWithOptionalWeight]] = None,
         *args,
+        proposal_data_fetch_concurrency: int = 10,
         **kwargs,
     ) -> None:
-        self._demand_offer_parser = PayloadSyntaxParser.get_instance()
         self._proposal_scorers: List[ScorerWithOptionalWeight] = (
             list(proposal_scorers) if proposal_scorers is not None else []
         )
+        self._proposal_data_fetch_concurrency = proposal_data_fetch_concurrency
 
         super().__init__(*args, **kwargs)
 
+    def is_incremental_scoring_possible(self) -> bool:
+        """Return `True` if proposals can be scored separately, as all the scorers are stateless."""
+        return all(
+            getattr(
+                scorer[1] if isinstance(scorer, (list, tuple)) else scorer, "is_stateless", False
+            )
+            for scorer in self._proposal_scorers
+        )
+
     async def do_scoring(self, proposals: Sequence[Proposal]) -> List[Tuple[float, Proposal]]:
         proposals_data = await self._get_proposals_data_from_proposals(proposals)
         proposal_scores = await self._run_scorers(proposals_data)
@@ -34,8 +59,9 @@ class ProposalScoringMixin:
     @trace_span()
     async def _run_scorers(
         self, proposals_data: Sequence[ProposalData]
-    ) -> Sequence[Tuple[float, Sequence[float]]]:
-        proposal_scores: List[Tuple[float, Sequence[float]]] = []
+    ) -> Sequence[Tuple[float, Any]]:
+        proposal_scores: List[Tuple[float, Any]] = []
+        table: Optional[ProposalTable] = None
 
         for scorer in self._proposal_scorers:
             if isinstance(scorer, (list, tuple)):
@@ -43,17 +69,36 @@ class ProposalScoringMixin:
             else:
                 weight = 1
 
-            scorer_scores = await resolve_maybe_awaitable(scorer(proposals_data))
+            scorer_scores = None
+            score_table = getattr(scorer, "score_table", None)
+
+            if score_table is not None and is_numpy_available():
+                if table is None:
+                    table = ProposalTable(proposals_data)
+
+                scorer_scores = score_table(table)
 
-            proposal_scores.append((weight, scorer_scores))  # type: ignore[arg-type]
+            if scorer_scores is None:
+                scorer_scores = await resolve_maybe_awaitable(scorer(proposals_data))
+
+            proposal_scores.append((weight, scorer_scores))
 
         return proposal_scores
 
     def _calculate_proposal_score(
         self,
         proposals: Sequence[Proposal],
-        scorer_scores: Sequence[Tuple[float, Sequence[float]]],
+        scorer_scores: Sequence[Tuple[float, Any]],
     ) -> List[Tuple[float, Proposal]]:
+        if scorer_scores and all(is_table_scores(scores) for _, scores in scorer_scores):
+            weighted_scores = calculate_weighted_table_scores(scorer_scores)
+            return list(zip(weighted_scores.tolist(), proposals))
+
+        scorer_scores = [
+            (weight, table_scores_to_list(scores) if is_table_scores(scores) else scores)
+            for weight, scores in scorer_scores
+        ]
+
         # FIXME: can this be refactored?
         return [
             (
@@ -86,27 +131,16 @@ class ProposalScoringMixin:
             if scorer_scores[proposal_index] is not None
         ]
 
-    # FIXME: This should be already provided by low level
+    @trace_span()
     async def _get_proposals_data_from_proposals(
         self, proposals: Sequence[Proposal]
     ) -> Sequence[ProposalData]:
-        result = []
-
-        for proposal in proposals:
-            data = await proposal.get_data()
-
-            constraints = self._demand_offer_parser.parse_constraints(data.constraints)
-
-            result.append(
-                ProposalData(
-                    properties=Properties(data.properties),
-                    constraints=constraints,
-                    proposal_id=data.proposal_id,
-                    issuer_id=data.issuer_id,
-                    state=data.state,
-                    timestamp=cast(datetime, data.timestamp),
-                    prev_proposal_id=data.prev_proposal_id,
-                )
-            )
+        # `ProposalData` is built once and cached by each proposal, so only proposals seen for the
+        # first time need to be fetched and parsed
+        semaphore = asyncio.Semaphore(self._proposal_data_fetch_concurrency)
+
+        async def get_proposal_data(proposal: Proposal) -> ProposalData:
+            async with semaphore:
+                return await proposal.get_proposal_data()
 
-        return result
+        return await asyncio.gather(*[get_proposal_data(proposal) for proposal in proposals])
@@ -1,11 +1,16 @@
 import logging
 from datetime import timedelta
 from decimal import Decimal
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from golem.payload import defaults
 from golem.resources import LinearCoeffs, ProposalData
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from golem.managers.proposal.plugins.scoring.table import ProposalTable
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +27,13 @@ class LinearAverageCostPricing:
 
         return self._calculate_cost(coeffs)
 
+    def calculate_table(self, table: "ProposalTable") -> "npt.NDArray[Any]":
+        return self._calculate_table_cost(
+            table.get_linear_coeffs_column("price_initial"),
+            table.get_linear_coeffs_column("price_duration_sec"),
+            table.get_linear_coeffs_column("price_cpu_sec"),
+        )
+
     def __str__(self) -> str:
         return (
             f"{self.__class__.__name__}("
@@ -40,6 +52,19 @@ class LinearAverageCostPricing:
 
         return float(average_initial_price + average_duration_cost + average_cpu_cost)
 
+    def _calculate_table_cost(
+        self,
+        price_initial: "npt.NDArray[Any]",
+        price_duration_sec: "npt.NDArray[Any]",
+        price_cpu_sec: "npt.NDArray[Any]",
+    ) -> "npt.NDArray[Any]":
+        average_duration_sec = self._average_duration.total_seconds()
+        return (
+            price_initial
+            + price_duration_sec * average_duration_sec
+            + price_cpu_sec * self._average_cpu_load * average_duration_sec
+        )
+
 
 class LinearPerCpuAverageCostPricing(LinearAverageCostPricing):
     def __call__(self, proposal_data: ProposalData) -> Optional[float]:
@@ -55,3 +80,15 @@ class LinearPerCpuAverageCostPricing(LinearAverageCostPricing):
         coeffs.price_duration_sec /= cpu_count
 
         return self._calculate_cost(coeffs)
+
+    def calculate_table(self, table: "ProposalTable") -> "npt.NDArray[Any]":
+        import numpy as np
+
+        cpu_count = table.get_property_column(defaults.PROP_INF_CPU_THREADS)
+        cpu_count = np.where(cpu_count != 0, cpu_count, np.nan)
+
+        return self._calculate_table_cost(
+            table.get_linear_coeffs_column("price_initial") / cpu_count,
+            table.get_linear_coeffs_column("price_duration_sec") / cpu_count,
+            table.get_linear_coeffs_column("price_cpu_sec"),
+        )
@@ -1,9 +1,14 @@
-from typing import Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Tuple, Union
 
 from golem.managers.base import ManagerPluginException, ProposalScorer, ProposalScoringResult
 from golem.payload.constraints import PropertyName
 from golem.resources import ProposalData
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from golem.managers.proposal.plugins.scoring.table import ProposalTable
+
 PropertyValueNumeric = Union[int, float]
 BoundaryValues = Tuple[Tuple[float, PropertyValueNumeric], Tuple[float, PropertyValueNumeric]]
 
@@ -26,9 +31,27 @@ class PropertyValueLerpScore(ProposalScorer):
         self._raise_on_missing = raise_on_missing
         self._raise_on_bad_value = raise_on_bad_value
 
+    @property
+    def is_stateless(self) -> bool:
+        """Score of the proposal doesn't depend on other scored proposals."""
+        return True
+
     def __call__(self, proposals_data: Sequence[ProposalData]) -> ProposalScoringResult:
         return [self._calculate_linear_score(proposal_data) for proposal_data in proposals_data]
 
+    def score_table(self, table: "ProposalTable") -> Optional["npt.NDArray[Any]"]:
+        """Score proposals at once, unless errors should be raised on missing or bad values."""
+        if self._raise_on_missing or self._raise_on_bad_value:
+            return None
+
+        import numpy as np
+
+        x1, y1 = self._boundary_values[0]
+        x2, y2 = self._boundary_values[1]
+        y3 = np.clip(table.get_property_column(self._property_name), min(y1, y2), max(y1, y2))
+
+        return (((y2 - y3) * x1) + ((y3 - y1) * x2)) / (y2 - y1)
+
     def _calculate_linear_score(self, proposal_data: ProposalData) -> Optional[float]:
         property_value = self._get_property_value(proposal_data)
 
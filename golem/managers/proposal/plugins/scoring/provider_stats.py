@@ -0,0 +1,60 @@
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+from golem.managers.base import ProposalScorer, ProposalScoringResult
+from golem.resources import ProposalData
+
+if TYPE_CHECKING:
+    from golem.managers.provider_stats import ProviderStatsManager
+
+
+class ProviderStatsScore(ProposalScorer):
+    """Scores proposals by expected throughput per GLM of their providers.
+
+    Throughput per GLM is calculated from statistics collected by :any:`ProviderStatsManager`, as
+    the success rate divided by average duration and average cost of successful work. Scores are
+    normalized, so the best of scored providers gets `1`. Proposals of providers without at least
+    `min_works_count` successful and paid works are scored with `unknown_score`.
+    """
+
+    def __init__(
+        self,
+        provider_stats: "ProviderStatsManager",
+        min_works_count: int = 1,
+        unknown_score: Optional[float] = None,
+    ) -> None:
+        self._provider_stats = provider_stats
+        self._min_works_count = min_works_count
+        self._unknown_score = unknown_score
+
+    def __call__(self, proposals_data: Sequence[ProposalData]) -> ProposalScoringResult:
+        throughputs = [
+            self._get_throughput_per_glm(proposal_data.issuer_id)
+            for proposal_data in proposals_data
+        ]
+
+        max_throughput = max((t for t in throughputs if t is not None), default=None)
+
+        result: List[Optional[float]] = []
+        for throughput in throughputs:
+            if throughput is None or not max_throughput:
+                result.append(self._unknown_score)
+            else:
+                result.append(throughput / max_throughput)
+
+        return result
+
+    def _get_throughput_per_glm(self, provider_id: Optional[str]) -> Optional[float]:
+        if provider_id is None:
+            return None
+
+        stats = self._provider_stats.get_provider_stats(provider_id)
+        if stats is None or stats.works_succeeded_count < self._min_works_count:
+            return None
+
+        work_duration = stats.work_duration
+        cost_per_work = stats.cost_per_work
+        failure_rate = stats.failure_rate
+        if not work_duration or cost_per_work is None or failure_rate is None:
+            return None
+
+        return (1 - failure_rate) / (work_duration.total_seconds() * cost_per_work)
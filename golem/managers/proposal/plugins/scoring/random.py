@@ -1,13 +1,28 @@
 from random import random
-from typing import Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Sequence, Tuple, Union
 
 from golem.managers.base import ProposalScorer, ProposalScoringResult
 from golem.resources import ProposalData
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from golem.managers.proposal.plugins.scoring.table import ProposalTable
+
 PropertyValueNumeric = Union[int, float]
 BoundaryValues = Tuple[Tuple[float, PropertyValueNumeric], Tuple[float, PropertyValueNumeric]]
 
 
 class RandomScore(ProposalScorer):
+    @property
+    def is_stateless(self) -> bool:
+        """Score of the proposal doesn't depend on other scored proposals."""
+        return True
+
     def __call__(self, proposals_data: Sequence[ProposalData]) -> ProposalScoringResult:
         return [random() for _ in range(len(proposals_data))]
+
+    def score_table(self, table: "ProposalTable") -> "npt.NDArray[Any]":
+        import numpy as np
+
+        return np.random.random(len(table))
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from datetime import timedelta
-from typing import Callable, Optional, Sequence
+from typing import Callable, Dict, MutableSequence, Optional, Sequence
 
 from golem.managers.base import ScorerWithOptionalWeight
 from golem.managers.proposal.plugins.buffer import ProposalBuffer
@@ -10,7 +10,7 @@ from golem.resources import Proposal
 from golem.utils.asyncio import (
     Buffer,
     ExpirableBuffer,
-    SimpleBuffer,
+    HeapBuffer,
     create_task_with_logging,
     ensure_cancelled,
 )
@@ -21,6 +21,13 @@ logger = logging.getLogger(__name__)
 
 
 class ProposalScoringBuffer(ProposalScoringMixin, ProposalBuffer):
+    """Proposal buffer that returns proposals with the highest score first.
+
+    If all the scorers are stateless (see :any:`ProposalScoringMixin`), new proposals are scored
+    as soon as they arrive and inserted among already scored ones. Otherwise, new proposals are
+    collected for `scoring_debounce` and all buffered proposals are scored again.
+    """
+
     def __init__(
         self,
         min_size: int,
@@ -33,6 +40,7 @@ class ProposalScoringBuffer(ProposalScoringMixin, ProposalBuffer):
         on_expiration_func: Optional[Callable[[Proposal], MaybeAwaitable[None]]] = None,
         scoring_debounce: timedelta = timedelta(seconds=10),
         proposal_scorers: Optional[Sequence[ScorerWithOptionalWeight]] = None,
+        proposal_data_fetch_concurrency: int = 10,
     ) -> None:
         super().__init__(
             min_size=min_size,
@@ -42,6 +50,7 @@ class ProposalScoringBuffer(ProposalScoringMixin, ProposalBuffer):
             get_expiration_func=None,
             on_expiration_func=on_expiration_func,
             proposal_scorers=proposal_scorers,
+            proposal_data_fetch_concurrency=proposal_data_fetch_concurrency,
         )
 
         self._scoring_debounce = scoring_debounce
@@ -50,7 +59,10 @@ class ProposalScoringBuffer(ProposalScoringMixin, ProposalBuffer):
         # as we want to expire only scored proposals instead
         self._get_expiration_func = get_expiration_func
 
-        scored_buffer: Buffer[Proposal] = SimpleBuffer()
+        #   Scores of proposals being put into scored buffer, used only to order them
+        self._proposal_scores: Dict[Proposal, float] = {}
+
+        scored_buffer: Buffer[Proposal] = HeapBuffer(key=self._get_scored_proposal_key)
 
         if get_expiration_func is not None:
             scored_buffer = ExpirableBuffer(
@@ -81,15 +93,21 @@ class ProposalScoringBuffer(ProposalScoringMixin, ProposalBuffer):
     async def _on_added(self, proposal: Proposal) -> None:
         pass  # explicit no-op
 
+    def _get_scored_proposal_key(self, proposal: Proposal) -> float:
+        return -self._proposal_scores[proposal]
+
     async def _background_loop(self) -> None:
         while True:
+            is_incremental = self.is_incremental_scoring_possible()
+            debounce = timedelta() if is_incremental else self._scoring_debounce
+
             logger.debug(
                 "Waiting for any proposals to score with debounce of `%s`...",
-                self._scoring_debounce,
+                debounce,
             )
 
             try:
-                proposals = await self._buffer.get_requested(self._scoring_debounce)
+                proposals = await self._buffer.get_requested(debounce)
             except Exception as e:
                 await self._buffer_scored.set_exception(e)
                 logger.debug(
@@ -103,14 +121,39 @@ class ProposalScoringBuffer(ProposalScoringMixin, ProposalBuffer):
                 "Waiting for any proposals done, %d new proposals will be scored", len(proposals)
             )
 
-            proposals.extend(await self._buffer_scored.get_all())
+            if is_incremental:
+                await self._score_new_proposals(proposals)
+            else:
+                await self._score_all_proposals(proposals)
+
+    async def _score_new_proposals(self, proposals: Sequence[Proposal]) -> None:
+        logger.debug("Scoring %d new proposals...", len(proposals))
+
+        scored_proposals = await self.do_scoring(proposals)
+
+        self._proposal_scores = {proposal: score for score, proposal in scored_proposals}
+        try:
+            for _, proposal in scored_proposals:
+                await self._buffer_scored.put(proposal)
+        finally:
+            self._proposal_scores.clear()
+
+        logger.debug("Scoring %d new proposals done", len(proposals))
+
+    async def _score_all_proposals(self, proposals: MutableSequence[Proposal]) -> None:
+        proposals.extend(await self._buffer_scored.get_all())
+
+        logger.debug("Scoring total %d proposals...", len(proposals))
 
-            logger.debug("Scoring total %d proposals...", len(proposals))
+        scored_proposals = await self.do_scoring(proposals)
 
-            scored_proposals = await self.do_scoring(proposals)
+        self._proposal_scores = {proposal: score for score, proposal in scored_proposals}
+        try:
             await self._buffer_scored.put_all([proposal for _, proposal in scored_proposals])
+        finally:
+            self._proposal_scores.clear()
 
-            logger.debug("Scoring total %d proposals done", len(proposals))
+        logger.debug("Scoring total %d proposals done", len(proposals))
 
     async def _get_buffered_proposal(self) -> Proposal:
         return await self._buffer_scored.get()
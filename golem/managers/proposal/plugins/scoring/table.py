@@ -0,0 +1,122 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from golem.payload.constraints import PropertyName
+from golem.resources import LinearCoeffs, ProposalData
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+LINEAR_COEFFS_NAMES = (
+    "price_storage_gib",
+    "price_mem_gib",
+    "price_cpu_sec",
+    "price_duration_sec",
+    "price_initial",
+)
+
+
+def is_numpy_available() -> bool:
+    """Return `True` if optional `numpy` dependency is installed."""
+    return np is not None
+
+
+def is_table_scores(scores: Any) -> bool:
+    """Return `True` if given scores are result of vectorized scoring."""
+    return np is not None and isinstance(scores, np.ndarray)
+
+
+def table_scores_to_list(scores: "npt.NDArray[Any]") -> List[Optional[float]]:
+    """Convert result of vectorized scoring to the regular scoring result."""
+    return [None if score != score else score for score in scores.tolist()]
+
+
+def calculate_weighted_table_scores(
+    scorer_scores: Sequence[Tuple[float, "npt.NDArray[Any]"]]
+) -> "npt.NDArray[Any]":
+    """Return weighted average of results of vectorized scorers, ignoring missing scores."""
+    scores = np.vstack([scores for _, scores in scorer_scores])
+    weights = np.array([weight for weight, _ in scorer_scores], dtype=np.float64)[:, np.newaxis]
+    valid = ~np.isnan(scores)
+
+    weighted_sum = np.where(valid, scores * weights, 0).sum(axis=0)
+    weights_sum = np.where(valid, weights, 0).sum(axis=0)
+
+    return np.divide(
+        weighted_sum, weights_sum, out=np.zeros_like(weighted_sum), where=weights_sum != 0
+    )
+
+
+class ProposalTable:
+    """Columnar view of proposals data, for vectorized scoring with `numpy`.
+
+    Table is meant to be built once per scoring round. Columns are built on first use and are
+    shared by all the scorers of the round. Missing or non-numeric values are stored as `NaN`.
+
+    Scorers and pricing callables can support vectorized scoring by implementing
+    `score_table(table) -> Optional[numpy.ndarray]` or `calculate_table(table) -> numpy.ndarray`
+    respectively. Resulting arrays contain `NaN` where regular scorers would return `None`.
+
+    Requires optional `numpy` dependency, installed with `golem-core[numpy]` extra.
+    """
+
+    def __init__(self, proposals_data: Sequence[ProposalData]) -> None:
+        if np is None:
+            raise RuntimeError("`ProposalTable` requires `numpy` to be installed!")
+
+        self._proposals_data = proposals_data
+
+        self._property_columns: Dict[PropertyName, "npt.NDArray[Any]"] = {}
+        self._linear_coeffs_columns: Optional[Dict[str, "npt.NDArray[Any]"]] = None
+
+    def __len__(self) -> int:
+        return len(self._proposals_data)
+
+    @property
+    def proposals_data(self) -> Sequence[ProposalData]:
+        return self._proposals_data
+
+    def get_property_column(self, property_name: PropertyName) -> "npt.NDArray[Any]":
+        """Return float values of given numeric property of all the proposals."""
+        if property_name not in self._property_columns:
+            self._property_columns[property_name] = np.fromiter(
+                (
+                    self._get_numeric_value(proposal_data.properties.get(property_name))
+                    for proposal_data in self._proposals_data
+                ),
+                dtype=np.float64,
+                count=len(self._proposals_data),
+            )
+
+        return self._property_columns[property_name]
+
+    def get_linear_coeffs_column(self, coeff_name: str) -> "npt.NDArray[Any]":
+        """Return given linear pricing coefficient of all the proposals.
+
+        Proposals without valid linear pricing have `NaN` as all the coefficients.
+        """
+        if self._linear_coeffs_columns is None:
+            columns = np.full((len(LINEAR_COEFFS_NAMES), len(self)), np.nan)
+
+            for index, proposal_data in enumerate(self._proposals_data):
+                coeffs = LinearCoeffs.from_properties(proposal_data.properties)
+
+                if coeffs is not None:
+                    columns[:, index] = [
+                        float(getattr(coeffs, name)) for name in LINEAR_COEFFS_NAMES
+                    ]
+
+            self._linear_coeffs_columns = dict(zip(LINEAR_COEFFS_NAMES, columns))
+
+        return self._linear_coeffs_columns[coeff_name]
+
+    @staticmethod
+    def _get_numeric_value(value: Any) -> float:
+        if isinstance(value, (int, float)):
+            return float(value)
+
+        return np.nan
@@ -0,0 +1,8 @@
+from golem.managers.provider_stats.manager import ProviderStatsManager
+from golem.managers.provider_stats.store import ProviderStats, SqliteProviderStatsStore
+
+__all__ = (
+    "ProviderStatsManager",
+    "ProviderStats",
+    "SqliteProviderStatsStore",
+)
@@ -0,0 +1,265 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from golem.managers.base import DoWorkCallable, Manager, Work, WorkContext, WorkResult
+from golem.managers.mixins import BackgroundLoopMixin
+from golem.managers.provider_stats.store import ProviderStats, SqliteProviderStatsStore
+from golem.node import GolemNode
+from golem.resources import (
+    Activity,
+    ActivityClosed,
+    AgreementClosed,
+    BatchFinished,
+    NewActivity,
+    NewAgreement,
+    NewInvoice,
+    PoolingBatch,
+)
+from golem.utils.clock import utc_now
+from golem.utils.logging import trace_span
+
+logger = logging.getLogger(__name__)
+
+TResult = TypeVar("TResult")
+
+
+class ProviderStatsManager(BackgroundLoopMixin, Manager):
+    """Collects statistics of providers from agreement, activity, batch and invoice events.
+
+    First batch executed on the activity is considered to be its deploy. Works are recorded by
+    `work_plugin`, which has to be added to the plugins of the work manager. Costs are taken from
+    invoices.
+
+    Statistics are kept in memory, so reading them is cheap. Statistics saved by previous runs
+    are loaded from `store` on start, and changes are saved there in batches every
+    `flush_interval`, in a separate thread, so collecting them adds no latency to the event loop.
+    Changes that failed to be saved are kept and saved with the next batch.
+    """
+
+    def __init__(
+        self,
+        golem: GolemNode,
+        store: SqliteProviderStatsStore,
+        flush_interval: timedelta = timedelta(seconds=10),
+        *args,
+        **kwargs,
+    ) -> None:
+        self._golem = golem
+        self._store = store
+        self._flush_interval = flush_interval
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._event_handlers: List = []
+
+        self._stats: Dict[str, ProviderStats] = {}
+        self._stats_changes: Dict[str, ProviderStats] = {}
+
+        self._agreements_provider_ids: Dict[str, str] = {}
+        self._deploys_started_at: Dict[str, datetime] = {}
+
+        super().__init__(*args, **kwargs)
+
+    @trace_span("Starting ProviderStatsManager", log_level=logging.INFO)
+    async def start(self) -> None:
+        #   Single thread, as store connection can't be shared between threads
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="provider-stats")
+        self._stats = await self._run_in_executor(self._store.load)
+
+        self._event_handlers.extend(
+            [
+                await self._golem.event_bus.on(NewAgreement, self._handle_new_agreement),
+                await self._golem.event_bus.on(AgreementClosed, self._handle_agreement_closed),
+                await self._golem.event_bus.on(NewActivity, self._handle_new_activity),
+                await self._golem.event_bus.on(ActivityClosed, self._handle_activity_closed),
+                await self._golem.event_bus.on(BatchFinished, self._handle_batch_finished),
+                await self._golem.event_bus.on(NewInvoice, self._handle_new_invoice),
+            ]
+        )
+
+        await super().start()
+
+    @trace_span("Stopping ProviderStatsManager", log_level=logging.INFO)
+    async def stop(self) -> None:
+        await super().stop()
+
+        for event_handler in self._event_handlers:
+            await self._golem.event_bus.off(event_handler)
+        self._event_handlers.clear()
+
+        await self._flush()
+        await self._run_in_executor(self._store.close)
+
+        assert self._executor is not None  # mypy
+        self._executor.shutdown()
+        self._executor = None
+
+    def get_provider_stats(self, provider_id: str) -> Optional[ProviderStats]:
+        """Return statistics of given provider, or `None` if provider is not known.
+
+        Returned object is updated in place with new statistics.
+        """
+        return self._stats.get(provider_id)
+
+    def record_deploy(self, provider_id: str, duration: timedelta, success: bool) -> None:
+        self._record(
+            ProviderStats(
+                provider_id,
+                deploys_count=1,
+                deploys_failed_count=0 if success else 1,
+                deploys_seconds=duration.total_seconds() if success else 0.0,
+            )
+        )
+
+    def record_work(self, provider_id: str, duration: timedelta, success: bool) -> None:
+        self._record(
+            ProviderStats(
+                provider_id,
+                works_count=1,
+                works_failed_count=0 if success else 1,
+                works_seconds=duration.total_seconds() if success else 0.0,
+            )
+        )
+
+    def work_plugin(self, do_work: DoWorkCallable) -> DoWorkCallable:
+        """Work manager plugin recording each work done, including each retry of the work."""
+
+        @wraps(do_work)
+        async def wrapper(work: Work) -> WorkResult:
+            return await do_work(self._measure_work(work))
+
+        return wrapper
+
+    def _measure_work(self, work: Work) -> Work:
+        #   Work is measured on its own activity, so work managers don't need to report anything
+        @wraps(work)
+        async def measured_work(context: WorkContext) -> Optional[WorkResult]:
+            started_at = asyncio.get_running_loop().time()
+
+            try:
+                result = await work(context)
+            except Exception:
+                self._record_work_on_activity(context.activity, started_at, False)
+                raise
+
+            success = not isinstance(result, WorkResult) or result.exception is None
+            self._record_work_on_activity(context.activity, started_at, success)
+            return result
+
+        return measured_work
+
+    def _record_work_on_activity(
+        self, activity: Activity, started_at: float, success: bool
+    ) -> None:
+        duration = timedelta(seconds=asyncio.get_running_loop().time() - started_at)
+        provider_id = self._get_activity_provider_id(activity)
+
+        if provider_id is None:
+            logger.debug("Ignoring work done on activity `%s` with unknown provider", activity)
+            return
+
+        self.record_work(provider_id, duration, success)
+
+    def record_cost(self, provider_id: str, amount: Decimal) -> None:
+        self._record(ProviderStats(provider_id, cost=float(amount)))
+
+    def _record(self, stats_change: ProviderStats) -> None:
+        provider_id = stats_change.provider_id
+
+        if provider_id not in self._stats:
+            self._stats[provider_id] = ProviderStats(provider_id)
+        self._stats[provider_id].add(stats_change)
+
+        if provider_id in self._stats_changes:
+            self._stats_changes[provider_id].add(stats_change)
+        else:
+            self._stats_changes[provider_id] = stats_change
+
+    async def _background_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval.total_seconds())
+            await self._flush()
+
+    async def _flush(self) -> None:
+        if not self._stats_changes:
+            return
+
+        stats_changes = list(self._stats_changes.values())
+        self._stats_changes = {}
+
+        logger.debug("Saving statistics changes of %d providers...", len(stats_changes))
+
+        try:
+            await self._run_in_executor(self._store.add, stats_changes)
+        except Exception:
+            logger.exception(
+                "Saving statistics changes of %d providers failed, retrying with the next flush!",
+                len(stats_changes),
+            )
+
+            for stats_change in stats_changes:
+                #   Changes recorded in the meantime are merged with the unsaved ones
+                newer_stats_change = self._stats_changes.get(stats_change.provider_id)
+                if newer_stats_change is not None:
+                    stats_change.add(newer_stats_change)
+
+                self._stats_changes[stats_change.provider_id] = stats_change
+        else:
+            logger.debug("Saving statistics changes of %d providers done", len(stats_changes))
+
+    async def _run_in_executor(self, func: Callable[..., TResult], *args: Any) -> TResult:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def _handle_new_agreement(self, event: NewAgreement) -> None:
+        agreement = event.resource
+
+        if agreement.has_parent:
+            provider_id = await agreement.proposal.get_provider_id()
+        else:
+            provider_id = (await agreement.get_agreement_data()).provider_id
+
+        if provider_id is not None:
+            self._agreements_provider_ids[agreement.id] = provider_id
+
+    async def _handle_agreement_closed(self, event: AgreementClosed) -> None:
+        self._agreements_provider_ids.pop(event.resource.id, None)
+
+    async def _handle_new_activity(self, event: NewActivity) -> None:
+        self._deploys_started_at[event.resource.id] = utc_now()
+
+    async def _handle_activity_closed(self, event: ActivityClosed) -> None:
+        self._deploys_started_at.pop(event.resource.id, None)
+
+    async def _handle_batch_finished(self, event: BatchFinished) -> None:
+        batch: PoolingBatch = event.resource
+
+        if not batch.has_parent:
+            return
+
+        activity: Activity = batch.parent
+        deploy_started_at = self._deploys_started_at.pop(activity.id, None)
+
+        if deploy_started_at is None:
+            return
+
+        provider_id = self._get_activity_provider_id(activity)
+
+        if provider_id is None:
+            logger.debug("Ignoring `%s` of activity with unknown provider", batch)
+            return
+
+        self.record_deploy(provider_id, utc_now() - deploy_started_at, batch.success)
+
+    async def _handle_new_invoice(self, event: NewInvoice) -> None:
+        invoice_data = await event.resource.get_data()
+        self.record_cost(invoice_data.issuer_id, Decimal(invoice_data.amount))
+
+    def _get_activity_provider_id(self, activity: Activity) -> Optional[str]:
+        if not activity.has_parent:
+            return None
+
+        return self._agreements_provider_ids.get(activity.agreement.id)
@@ -0,0 +1,134 @@
+import sqlite3
+from dataclasses import dataclass, fields
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+
+@dataclass
+class ProviderStats:
+    """Statistics of deploys and works executed by a single provider."""
+
+    provider_id: str
+    deploys_count: int = 0
+    deploys_failed_count: int = 0
+    #   Total duration of successful deploys
+    deploys_seconds: float = 0.0
+    works_count: int = 0
+    works_failed_count: int = 0
+    #   Total duration of successful works
+    works_seconds: float = 0.0
+    #   Total amount paid to the provider, in GLM
+    cost: float = 0.0
+
+    @property
+    def deploy_time(self) -> Optional[timedelta]:
+        """Average duration of successful deploy."""
+        deploys_succeeded_count = self.deploys_count - self.deploys_failed_count
+        if not deploys_succeeded_count:
+            return None
+
+        return timedelta(seconds=self.deploys_seconds / deploys_succeeded_count)
+
+    @property
+    def work_duration(self) -> Optional[timedelta]:
+        """Average duration of successful work."""
+        if not self.works_succeeded_count:
+            return None
+
+        return timedelta(seconds=self.works_seconds / self.works_succeeded_count)
+
+    @property
+    def works_succeeded_count(self) -> int:
+        return self.works_count - self.works_failed_count
+
+    @property
+    def failure_rate(self) -> Optional[float]:
+        """Ratio of failed deploys and works to all deploys and works."""
+        total_count = self.deploys_count + self.works_count
+        if not total_count:
+            return None
+
+        return (self.deploys_failed_count + self.works_failed_count) / total_count
+
+    @property
+    def cost_per_work(self) -> Optional[float]:
+        """Average cost of successful work, in GLM."""
+        if not self.works_succeeded_count or not self.cost:
+            return None
+
+        return self.cost / self.works_succeeded_count
+
+    def add(self, other: "ProviderStats") -> None:
+        """Add counters of other statistics of the same provider."""
+        for field in fields(self):
+            if field.name != "provider_id":
+                setattr(self, field.name, getattr(self, field.name) + getattr(other, field.name))
+
+
+_COUNTER_NAMES = tuple(field.name for field in fields(ProviderStats) if field.name != "provider_id")
+
+
+class SqliteProviderStatsStore:
+    """Statistics of providers persisted in SQLite database file.
+
+    Database connection is not shared between threads, so all calls should be made from
+    the same thread.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self._path = path
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def load(self) -> Dict[str, ProviderStats]:
+        """Return statistics of all the known providers."""
+        rows = self._get_connection().execute(
+            f"SELECT provider_id, {', '.join(_COUNTER_NAMES)} FROM provider_stats"
+        )
+
+        return {row[0]: ProviderStats(*row) for row in rows}
+
+    def add(self, stats_changes: Iterable[ProviderStats]) -> None:
+        """Add given changes to the stored statistics, in a single transaction.
+
+        Changes are added to counters, so the same database can be updated by many runs.
+        """
+        updates = ", ".join(f"{name} = {name} + excluded.{name}" for name in _COUNTER_NAMES)
+        query = (
+            f"INSERT INTO provider_stats (provider_id, {', '.join(_COUNTER_NAMES)})"
+            f" VALUES ({', '.join('?' * (len(_COUNTER_NAMES) + 1))})"
+            f" ON CONFLICT (provider_id) DO UPDATE SET {updates}"
+        )
+
+        connection = self._get_connection()
+        with connection:
+            connection.executemany(
+                query,
+                (
+                    (stats.provider_id, *(getattr(stats, name) for name in _COUNTER_NAMES))
+                    for stats in stats_changes
+                ),
+            )
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self._path)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS provider_stats ("
+                "provider_id TEXT PRIMARY KEY,"
+                " deploys_count INTEGER NOT NULL,"
+                " deploys_failed_count INTEGER NOT NULL,"
+                " deploys_seconds REAL NOT NULL,"
+                " works_count INTEGER NOT NULL,"
+                " works_failed_count INTEGER NOT NULL,"
+                " works_seconds REAL NOT NULL,"
+                " cost REAL NOT NULL"
+                ")"
+            )
+
+        return self._connection
@@ -1,13 +1,22 @@
 from golem.managers.work.concurrent import ConcurrentWorkManager
 from golem.managers.work.mixins import WorkManagerPluginsMixin
-from golem.managers.work.plugins import redundancy_cancel_others_on_first_done, retry, work_plugin
+from golem.managers.work.packing import PackedWorkContext, PackingWorkManager
+from golem.managers.work.plugins import (
+    redundancy_cancel_others_on_first_done,
+    retry,
+    speculative_execution,
+    work_plugin,
+)
 from golem.managers.work.sequential import SequentialWorkManager
 
 __all__ = (
     "ConcurrentWorkManager",
     "WorkManagerPluginsMixin",
+    "PackedWorkContext",
+    "PackingWorkManager",
     "SequentialWorkManager",
     "work_plugin",
     "redundancy_cancel_others_on_first_done",
     "retry",
+    "speculative_execution",
 )
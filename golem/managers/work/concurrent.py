@@ -1,18 +1,32 @@
 import asyncio
 import logging
-from typing import Awaitable, Callable, List
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from golem.managers.base import Work, WorkManager, WorkResult
 from golem.managers.work.mixins import WorkManagerDoWorkMixin, WorkManagerPluginsMixin
 from golem.node import GolemNode
 from golem.resources import Activity
-from golem.utils.asyncio import create_task_with_logging
+from golem.utils.asyncio import create_task_with_logging, ensure_cancelled, ensure_cancelled_many
 from golem.utils.logging import get_trace_id_name, trace_span
 
 logger = logging.getLogger(__name__)
 
 
 class ConcurrentWorkManager(WorkManagerPluginsMixin, WorkManagerDoWorkMixin, WorkManager):
+    """WorkManager that does at most `size` works at the same time."""
+
     def __init__(
         self,
         golem: GolemNode,
@@ -24,9 +38,6 @@ class ConcurrentWorkManager(WorkManagerPluginsMixin, WorkManagerDoWorkMixin, Wor
         self._get_activity = get_activity
         self._size = size
 
-        self._queue: asyncio.Queue[Work] = asyncio.Queue()
-        self._results: List[WorkResult] = []
-
         super().__init__(*args, **kwargs)
 
     @trace_span("Doing work", show_arguments=True, show_results=True, log_level=logging.INFO)
@@ -35,25 +46,119 @@ class ConcurrentWorkManager(WorkManagerPluginsMixin, WorkManagerDoWorkMixin, Wor
 
     @trace_span("Doing work list", show_arguments=True, show_results=True, log_level=logging.INFO)
     async def do_work_list(self, work_list: List[Work]) -> List[WorkResult]:
-        workers = [
-            create_task_with_logging(self.worker(), trace_id=get_trace_id_name(self, f"worker-{i}"))
-            for i in range(self._size)
-        ]
-        for work in work_list:
-            self._queue.put_nowait(work)
-        await self._queue.join()
-        [w.cancel() for w in workers]
-        await asyncio.gather(*workers, return_exceptions=True)
-        return self._results
-
-    async def worker(self):
-        while True:
-            work = await self._get_work_from_queue()
-
-            result = await self.do_work(work)
-            self._queue.task_done()
-            self._results.append(result)
-
-    @trace_span(show_results=True)
-    async def _get_work_from_queue(self) -> Work:
-        return await self._queue.get()
+        """Do all given works and return their results in the order of `work_list`."""
+        return [result async for result in self.do_work_iter(work_list, ordered=True)]
+
+    async def do_work_iter(
+        self,
+        works: Union[AsyncIterable[Work], Iterable[Work]],
+        ordered: bool = False,
+        max_pending_count: Optional[int] = None,
+    ) -> AsyncIterator[WorkResult]:
+        """Do works pulled from `works` and yield their results.
+
+        Results are yielded as soon as works are done, or in the order of `works` if `ordered`
+        is set. At most `max_pending_count` works, by default twice the manager size, are done
+        or wait for their result to be consumed at the same time, so next works are pulled
+        only when earlier results are consumed. Errors of works are reported as results.
+        """
+        pending_semaphore = asyncio.Semaphore(max_pending_count or self._size * 2)
+        #   Work index with its result, or with `None` as the number of all works when feeding ends
+        results_queue: "asyncio.Queue[Tuple[int, Optional[WorkResult]]]" = asyncio.Queue()
+        work_tasks: Set[asyncio.Task] = set()
+
+        feed_task = create_task_with_logging(
+            self._feed_works(works, pending_semaphore, results_queue, work_tasks),
+            trace_id=get_trace_id_name(self, "feed-works"),
+        )
+
+        works_count: Optional[int] = None
+        yielded_count = 0
+        next_index = 0
+        reorder_buffer: Dict[int, WorkResult] = {}
+
+        try:
+            while works_count is None or yielded_count < works_count:
+                index, result = await results_queue.get()
+
+                if result is None:
+                    #   Errors from `works` iteration are raised here
+                    await feed_task
+                    works_count = index
+                    continue
+
+                if not ordered:
+                    pending_semaphore.release()
+                    yielded_count += 1
+                    yield result
+                    continue
+
+                reorder_buffer[index] = result
+
+                while next_index in reorder_buffer:
+                    result = reorder_buffer.pop(next_index)
+                    next_index += 1
+
+                    pending_semaphore.release()
+                    yielded_count += 1
+                    yield result
+        finally:
+            await ensure_cancelled(feed_task)
+            await ensure_cancelled_many(work_tasks)
+
+    async def _feed_works(
+        self,
+        works: Union[AsyncIterable[Work], Iterable[Work]],
+        pending_semaphore: asyncio.Semaphore,
+        results_queue: "asyncio.Queue[Tuple[int, Optional[WorkResult]]]",
+        work_tasks: Set[asyncio.Task],
+    ) -> None:
+        concurrency_semaphore = asyncio.Semaphore(self._size)
+        works_iterator = _iterate_works(works)
+        index = 0
+
+        try:
+            while True:
+                #   Next work is pulled only when there is room for it
+                await pending_semaphore.acquire()
+
+                try:
+                    work = await works_iterator.__anext__()
+                except StopAsyncIteration:
+                    pending_semaphore.release()
+                    return
+
+                task = create_task_with_logging(
+                    self._do_work_and_put_result(index, work, concurrency_semaphore, results_queue),
+                    trace_id=get_trace_id_name(self, f"work-{index}"),
+                )
+                work_tasks.add(task)
+                task.add_done_callback(work_tasks.discard)
+
+                index += 1
+        finally:
+            results_queue.put_nowait((index, None))
+
+    async def _do_work_and_put_result(
+        self,
+        index: int,
+        work: Work,
+        concurrency_semaphore: asyncio.Semaphore,
+        results_queue: "asyncio.Queue[Tuple[int, Optional[WorkResult]]]",
+    ) -> None:
+        async with concurrency_semaphore:
+            try:
+                result = await self.do_work(work)
+            except Exception as e:
+                result = WorkResult(exception=e)
+
+        results_queue.put_nowait((index, result))
+
+
+async def _iterate_works(works: Union[AsyncIterable[Work], Iterable[Work]]) -> AsyncIterator[Work]:
+    if isinstance(works, AsyncIterable):
+        async for work in works:
+            yield work
+    else:
+        for work in works:
+            yield work
@@ -0,0 +1,399 @@
+import asyncio
+import logging
+from datetime import timedelta
+from typing import Awaitable, Callable, List, Optional, Set, Tuple, Union, cast
+
+from ya_activity import models
+
+from golem.managers.base import ManagerException, Work, WorkContext, WorkManager, WorkResult
+from golem.managers.mixins import BackgroundLoopMixin
+from golem.managers.work.mixins import WorkManagerPluginsMixin
+from golem.node import GolemNode
+from golem.resources import (
+    Activity,
+    BatchError,
+    BatchTimeoutError,
+    CommandCancelled,
+    PoolingBatch,
+    Script,
+)
+from golem.resources.activity import commands
+from golem.utils.asyncio import (
+    create_task_with_logging,
+    ensure_cancelled,
+    ensure_cancelled_many,
+    wait_for_event,
+)
+from golem.utils.logging import get_trace_id_name, trace_span
+
+logger = logging.getLogger(__name__)
+
+
+class _ScriptPacker:
+    """Collects commands run by works sharing an activity and executes them as single scripts.
+
+    Pending commands are executed when every unfinished work waits for a command result, or
+    when `max_delay` passes since the first pending command was added. Commands are added with
+    the key of their work, so commands of a work which command failed are not executed again.
+    """
+
+    def __init__(self, activity: Activity, works_count: int, max_delay: timedelta) -> None:
+        self._activity = activity
+        self._max_delay = max_delay
+
+        self._unfinished_works_count = works_count
+        self._blocked_works_count = 0
+        self._pending_commands: List[
+            Tuple[commands.Command, object, "asyncio.Future[models.ExeScriptCommandResult]"]
+        ] = []
+        self._first_pending_at: Optional[float] = None
+        self._changed_event = asyncio.Event()
+
+    def add_command(
+        self, command: commands.Command, work_key: object
+    ) -> "asyncio.Future[models.ExeScriptCommandResult]":
+        future: "asyncio.Future[models.ExeScriptCommandResult]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._add_pending_command(command, work_key, future)
+        return future
+
+    def _add_pending_command(
+        self,
+        command: commands.Command,
+        work_key: object,
+        future: "asyncio.Future[models.ExeScriptCommandResult]",
+    ) -> None:
+        if not self._pending_commands:
+            self._first_pending_at = asyncio.get_running_loop().time()
+
+        self._pending_commands.append((command, work_key, future))
+        self._changed_event.set()
+
+    def set_work_blocked(self, blocked: bool) -> None:
+        self._blocked_works_count += 1 if blocked else -1
+        self._changed_event.set()
+
+    def set_work_finished(self) -> None:
+        self._unfinished_works_count -= 1
+        self._changed_event.set()
+
+    async def run(self) -> None:
+        while self._unfinished_works_count or self._pending_commands:
+            self._changed_event.clear()
+
+            if self._pending_commands and (
+                self._unfinished_works_count <= self._blocked_works_count
+                or self._get_pending_delay() <= 0
+            ):
+                await self._execute_pending_commands()
+                continue
+
+            await wait_for_event(
+                self._changed_event,
+                self._get_pending_delay() if self._pending_commands else None,
+            )
+
+    def _get_pending_delay(self) -> float:
+        assert self._first_pending_at is not None
+        deadline = self._first_pending_at + self._max_delay.total_seconds()
+        return deadline - asyncio.get_running_loop().time()
+
+    async def _execute_pending_commands(self) -> None:
+        pending_commands = [(c, k, f) for c, k, f in self._pending_commands if not f.done()]
+        self._pending_commands = []
+
+        if not pending_commands:
+            return
+
+        #   Results are set in order of commands, so failed command comes before cancelled ones
+        failed_work_keys: Set[object] = set()
+
+        script = Script()
+        script_futures = []
+        for command, work_key, future in pending_commands:
+            script_future = script.add_command(command)
+            script_future.add_done_callback(
+                self._create_result_callback(command, work_key, future, failed_work_keys)
+            )
+            script_futures.append(script_future)
+
+        logger.debug(f"Executing {len(pending_commands)} packed commands on `{self._activity}`")
+
+        try:
+            batch = await self._activity.execute_script(script)
+            await batch.wait(ignore_errors=True)
+        except Exception as e:
+            for _, _, future in pending_commands:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        #   Results are not collected when batch fails without events, e.g. activity is destroyed
+        for (_, _, future), script_future in zip(pending_commands, script_futures):
+            if not script_future.done() and not future.done():
+                future.set_exception(BatchError(batch))
+
+    def _create_result_callback(
+        self,
+        command: commands.Command,
+        work_key: object,
+        future: "asyncio.Future[models.ExeScriptCommandResult]",
+        failed_work_keys: Set[object],
+    ) -> Callable[["asyncio.Future[models.ExeScriptCommandResult]"], None]:
+        def callback(script_future: "asyncio.Future[models.ExeScriptCommandResult]") -> None:
+            if future.done():
+                return
+
+            exception = script_future.exception()
+
+            #   Command of other work failed first, so this one is executed in the next script
+            if isinstance(exception, CommandCancelled) and work_key not in failed_work_keys:
+                self._add_pending_command(command, work_key, future)
+            elif exception is not None:
+                #   Like in a regular batch, commands after the failed one are not executed
+                failed_work_keys.add(work_key)
+                future.set_exception(exception)
+            else:
+                future.set_result(script_future.result())
+
+        return callback
+
+
+class PackedCommandBatch:
+    """Single command executed as a part of packed script.
+
+    Mirrors the part of :any:`PoolingBatch` interface that works usually use.
+    """
+
+    def __init__(
+        self,
+        future: "asyncio.Future[models.ExeScriptCommandResult]",
+        context: "PackedWorkContext",
+    ) -> None:
+        self._future = future
+        self._context = context
+
+    @property
+    def done(self) -> bool:
+        return self._future.done()
+
+    @property
+    def events(self) -> List[models.ExeScriptCommandResult]:
+        if self._future.done() and not self._future.cancelled() and not self._future.exception():
+            return [self._future.result()]
+
+        return []
+
+    async def wait(
+        self,
+        timeout: Optional[Union[timedelta, float]] = None,
+        ignore_errors: bool = False,
+    ) -> List[models.ExeScriptCommandResult]:
+        timeout_seconds = timeout.total_seconds() if isinstance(timeout, timedelta) else timeout
+
+        self._context._set_blocked(True)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(self._future), timeout_seconds)
+        except asyncio.TimeoutError:
+            assert timeout_seconds is not None  # mypy
+            #   Packed command batch mirrors the interface of `PoolingBatch`
+            raise BatchTimeoutError(cast(PoolingBatch, self), timeout_seconds)
+        except BatchError:
+            if not ignore_errors:
+                raise
+        finally:
+            self._context._set_blocked(False)
+
+        return self.events
+
+
+class PackedWorkContext(WorkContext):
+    """WorkContext that packs commands run by multiple works into single scripts.
+
+    `run()` returns :any:`PackedCommandBatch` instead of :any:`PoolingBatch`. The activity is
+    shared by all works of the pack, so `terminate()` and `create_batch()` are not supported.
+    """
+
+    def __init__(self, activity: Activity, packer: _ScriptPacker) -> None:
+        super().__init__(activity)
+        self._packer = packer
+        self._blocked_count = 0
+
+    async def deploy(
+        self, deploy_args: Optional[commands.ArgsDict] = None, timeout: Optional[timedelta] = None
+    ):
+        await self._run_command(commands.Deploy(deploy_args)).wait(timeout)
+
+    async def start(self):
+        await self._run_command(commands.Start()).wait()
+
+    async def terminate(self):
+        raise ManagerException(
+            "Activity is shared by all works of the pack and can't be terminated by one of them!"
+        )
+
+    async def run(
+        self,
+        command: Union[str, List[str]],
+        *,
+        shell: Optional[bool] = None,
+        shell_cmd: str = "/bin/sh",
+        timeout: Optional[float] = None,
+    ):
+        #   Script timeout would apply to commands of all works of the pack
+        if timeout is not None:
+            raise ManagerException(
+                "Packed commands don't support `timeout`, use `PackedCommandBatch.wait(timeout)`!"
+            )
+
+        return self._run_command(commands.Run(command, shell=shell, shell_cmd=shell_cmd))
+
+    async def create_batch(self):
+        raise ManagerException(
+            "Batches bypass packing of commands, use `run()`, `deploy()` or `start()` instead!"
+        )
+
+    def _run_command(self, command: commands.Command) -> PackedCommandBatch:
+        return PackedCommandBatch(self._packer.add_command(command, self), self)
+
+    def _set_blocked(self, blocked: bool) -> None:
+        was_blocked = 0 < self._blocked_count
+        self._blocked_count += 1 if blocked else -1
+
+        #   Work waiting for many commands at once is counted once
+        if was_blocked != (0 < self._blocked_count):
+            self._packer.set_work_blocked(blocked)
+
+
+class PackingWorkManager(BackgroundLoopMixin, WorkManagerPluginsMixin, WorkManager):
+    """WorkManager that packs commands of many small works into single scripts.
+
+    Works queued by `do_work` are grouped into packs of at most `max_pack_size` works, waiting at
+    most `max_pack_delay` for the pack to fill. Works from a pack share a single activity and
+    commands they `run()` at the same time are executed in a single script, so the cost of
+    creating and polling a batch is paid once per pack instead of once per command. At most
+    `size` packs are done at the same time.
+
+    When a command fails, remaining commands of other works from the same script are executed
+    again in the next script, while remaining commands of its own work fail with
+    :any:`CommandCancelled`, like in a regular batch. Works run with :any:`PackedWorkContext`, so
+    its `run()` returns :any:`PackedCommandBatch` with the result of a single command.
+    """
+
+    def __init__(
+        self,
+        golem: GolemNode,
+        get_activity: Callable[[], Awaitable[Activity]],
+        size: int = 1,
+        max_pack_size: int = 10,
+        max_pack_delay: timedelta = timedelta(milliseconds=100),
+        *args,
+        **kwargs,
+    ):
+        self._get_activity = get_activity
+        self._size = size
+        self._max_pack_size = max_pack_size
+        self._max_pack_delay = max_pack_delay
+
+        self._queue: "asyncio.Queue[Tuple[Work, asyncio.Future[WorkResult]]]" = asyncio.Queue()
+        self._pack_tasks: Set[asyncio.Task] = set()
+
+        super().__init__(*args, **kwargs)
+
+    @trace_span("Doing work", show_arguments=True, show_results=True, log_level=logging.INFO)
+    async def do_work(self, work: Work) -> WorkResult:
+        return await self._do_work_with_plugins(self._queue_work, work)
+
+    @trace_span("Doing work list", show_arguments=True, show_results=True, log_level=logging.INFO)
+    async def do_work_list(self, work_list: List[Work]) -> List[WorkResult]:
+        return list(await asyncio.gather(*[self.do_work(work) for work in work_list]))
+
+    async def _queue_work(self, work: Work) -> WorkResult:
+        future: "asyncio.Future[WorkResult]" = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((work, future))
+        return await future
+
+    async def _background_loop(self) -> None:
+        semaphore = asyncio.Semaphore(self._size)
+
+        try:
+            while True:
+                await semaphore.acquire()
+                pack = await self._get_pack()
+
+                task = create_task_with_logging(
+                    self._do_pack(pack), trace_id=get_trace_id_name(self, "pack")
+                )
+                self._pack_tasks.add(task)
+                task.add_done_callback(self._pack_tasks.discard)
+                task.add_done_callback(lambda _: semaphore.release())
+        finally:
+            await ensure_cancelled_many(self._pack_tasks)
+
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+
+    async def _get_pack(self) -> List[Tuple[Work, "asyncio.Future[WorkResult]"]]:
+        loop = asyncio.get_running_loop()
+        pack = [await self._queue.get()]
+        deadline = loop.time() + self._max_pack_delay.total_seconds()
+
+        while len(pack) < self._max_pack_size:
+            try:
+                pack.append(
+                    await asyncio.wait_for(self._queue.get(), max(deadline - loop.time(), 0))
+                )
+            except asyncio.TimeoutError:
+                break
+
+        return pack
+
+    @trace_span(show_arguments=True)
+    async def _do_pack(self, pack: List[Tuple[Work, "asyncio.Future[WorkResult]"]]) -> None:
+        try:
+            activity = await self._get_activity()
+        except Exception as e:
+            for _, future in pack:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        packer = _ScriptPacker(activity, len(pack), self._max_pack_delay)
+        packer_task = create_task_with_logging(
+            packer.run(), trace_id=get_trace_id_name(self, "packer")
+        )
+
+        try:
+            await asyncio.gather(
+                *[self._do_packed_work(packer, activity, work, future) for work, future in pack]
+            )
+            #   Commands that works did not wait for are still executed
+            await packer_task
+        finally:
+            await ensure_cancelled(packer_task)
+            await activity.destroy()
+
+    async def _do_packed_work(
+        self,
+        packer: _ScriptPacker,
+        activity: Activity,
+        work: Work,
+        future: "asyncio.Future[WorkResult]",
+    ) -> None:
+        work_context = PackedWorkContext(activity, packer)
+
+        try:
+            work_result = await work(work_context)
+        except Exception as e:
+            work_result = WorkResult(exception=e)
+        else:
+            if not isinstance(work_result, WorkResult):
+                work_result = WorkResult(result=work_result)
+        finally:
+            packer.set_work_finished()
+
+        if not future.done():
+            future.set_result(work_result)
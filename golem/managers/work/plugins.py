@@ -1,7 +1,9 @@
 import asyncio
 import logging
+import math
+from collections import deque
 from functools import wraps
-from typing import List
+from typing import Deque, List, Optional, Set
 
 from golem.managers.base import (
     WORK_PLUGIN_FIELD_NAME,
@@ -78,3 +80,76 @@ def redundancy_cancel_others_on_first_done(size: int):
         return wrapper
 
     return _redundancy
+
+
+def speculative_execution(quantile: float = 0.9, min_samples: int = 10, max_samples: int = 100):
+    """Start a speculative copy of a work that runs longer than usual.
+
+    Durations of the last `max_samples` successful works are tracked, and once there are at least
+    `min_samples` of them, a work running longer than their `quantile` gets a copy started, which
+    is done with a separate call to the manager, e.g. on another activity. Result of the copy that
+    succeeds first is returned and the other one is cancelled.
+
+    Duration of a work is measured from its start until the first successful result, whichever
+    copy it comes from, so slow works that got overtaken still count to the tail of durations.
+    """
+
+    durations: Deque[float] = deque(maxlen=max_samples)
+
+    def get_threshold() -> Optional[float]:
+        if len(durations) < min_samples:
+            return None
+
+        sorted_durations = sorted(durations)
+        index = max(math.ceil(quantile * len(sorted_durations)) - 1, 0)
+        return sorted_durations[index]
+
+    def _speculative_execution(do_work: DoWorkCallable) -> DoWorkCallable:
+        @wraps(do_work)
+        async def wrapper(work: Work) -> WorkResult:
+            loop = asyncio.get_running_loop()
+            started_at = loop.time()
+            threshold = get_threshold()
+            tasks: Set[asyncio.Task] = {asyncio.ensure_future(do_work(work))}
+            speculated = False
+
+            try:
+                if threshold is not None:
+                    _, tasks_pending = await asyncio.wait(tasks, timeout=threshold)
+
+                    if tasks_pending:
+                        logger.info(
+                            f"Work is running longer than {threshold:.3f}s, starting its"
+                            " speculative copy"
+                        )
+                        speculated = True
+                        tasks.add(asyncio.ensure_future(do_work(work)))
+
+                #   Failed copy is ignored as long as the other one is still running
+                while True:
+                    tasks_done, tasks = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    work_results = [task.result() for task in tasks_done]
+                    work_result = next(
+                        (r for r in work_results if r.exception is None), work_results[0]
+                    )
+
+                    if work_result.exception is None or not tasks:
+                        break
+            finally:
+                await ensure_cancelled_many(tasks)
+
+            if work_result.exception is None:
+                durations.append(loop.time() - started_at)
+
+            work_result.extras["speculative_execution"] = {
+                "speculated": speculated,
+                "threshold": threshold,
+            }
+
+            return work_result
+
+        return wrapper
+
+    return _speculative_execution
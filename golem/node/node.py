@@ -1,6 +1,6 @@
 import asyncio
 from collections import defaultdict
-from datetime import datetime, timezone
+from datetime import datetime
 from decimal import Decimal
 from typing import Any, DefaultDict, Dict, Iterable, List, Optional, Set, Type, Union
 from uuid import uuid4
@@ -26,8 +26,9 @@ from golem.resources import (
     Resource,
     TResource,
 )
+from golem.utils.clock import utc_now
 from golem.utils.logging import get_trace_id_name, set_trace_id
-from golem.utils.low import ApiConfig, ApiFactory
+from golem.utils.low import ApiConfig, ApiFactory, ApiRecorder
 
 
 class _RandomSessionId:
@@ -57,6 +58,7 @@ class GolemNode:
         api_url: Optional[str] = None,
         collect_payment_events: bool = True,
         app_session_id: Optional[Union[str, Type[_RandomSessionId]]] = _RandomSessionId,
+        api_recorder: Optional[ApiRecorder] = None,
     ):
         """Init GolemNode.
 
@@ -71,6 +73,8 @@ class GolemNode:
             same `app_session_id` will receive the same debit note/invoice/agreement events.
             Defaults to a random sting. If set to `None`, this GolemNode will receive all events
             regardless of their corresponding session ids.
+        :param api_recorder: If not None, all `yagna` REST API requests and responses will be
+            recorded with it, so the session can be later replayed with :any:`ApiReplayServer`.
         """
         config_kwargs = {
             param: value
@@ -79,6 +83,7 @@ class GolemNode:
         }
         self._api_config = ApiConfig(**config_kwargs)
         self._collect_payment_events = collect_payment_events
+        self._api_recorder = api_recorder
         self.app_session_id = uuid4().hex if app_session_id is _RandomSessionId else app_session_id
 
         #   All created Resources will be stored here
@@ -114,7 +119,7 @@ class GolemNode:
     async def start(self) -> None:
         await self.event_bus.start()
 
-        api_factory = ApiFactory(self._api_config)
+        api_factory = ApiFactory(self._api_config, self._api_recorder)
         self._ya_market_api = api_factory.create_market_api_client()
         self._ya_activity_api = api_factory.create_activity_api_client()
         self._ya_payment_api = api_factory.create_payment_api_client()
@@ -233,7 +238,7 @@ class GolemNode:
             :func:`Demand.start_collecting_events`.
         """
         if expiration is None:
-            expiration = datetime.now(timezone.utc) + payload_defaults.DEFAULT_LIFETIME
+            expiration = utc_now() + payload_defaults.DEFAULT_LIFETIME
 
         builder = DemandBuilder()
         await builder.add(payload_defaults.ActivityInfo(expiration=expiration, multi_activity=True))
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field, replace
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from decimal import Decimal
 from os import getenv
 from typing import Optional, Tuple
@@ -7,6 +7,7 @@ from typing import Optional, Tuple
 from golem.payload.base import Payload, constraint, prop
 from golem.payload.constraints import Constraints
 from golem.payload.properties import Properties
+from golem.utils.clock import utc_now
 
 PROP_RUNTIME_NAME = "golem.runtime.name"
 PROP_RUNTIME_CAPABILITIES = "golem.runtime.capabilities"
@@ -102,7 +103,7 @@ class ActivityInfo(Payload):
         if not self.expiration:
             activity_info = replace(self)
             assert activity_info.lifetime  # set in `__post_init__`
-            activity_info.expiration = datetime.now(timezone.utc) + activity_info.lifetime
+            activity_info.expiration = utc_now() + activity_info.lifetime
             return await activity_info.build_properties_and_constraints()
 
         return await super().build_properties_and_constraints()
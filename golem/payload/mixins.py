@@ -8,6 +8,8 @@ from golem.utils.typing import match_type_union_aware
 
 
 class PropsConsSerializerMixin:
+    __slots__ = ()
+
     @classmethod
     def _serialize_value(cls, value: Any) -> Any:
         """Return value in primitive format compatible with Golem's property \
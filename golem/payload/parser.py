@@ -1,16 +1,152 @@
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, NamedTuple, NoReturn, Optional, Tuple, Union
 
 from textx import TextXSyntaxError, metamodel_from_file
 
 from golem.payload.constraints import Constraint, ConstraintGroup, Constraints
 
+#   Terminals of `parser.tx` grammar
+_WHITESPACE = re.compile(r"[\t\n\r ]*")
+_PROPERTY_NAME = re.compile(r"[\w!-]+(\.[\w!-]+)*")
+_PROPERTY_VALUE_STR = re.compile(r"[\sa-zA-Z0-9_.\*\/\\:;-]+")
+_CONSTRAINT_GROUP_OPERATORS = ("&", "|", "!")
+_CONSTRAINT_OPERATORS = ("=", "<=", ">=", "<", ">")
+
 
 class SyntaxException(Exception):
     pass
 
 
+class _FastParserError(Exception):
+    pass
+
+
+class _ParsedConstraint(NamedTuple):
+    property_name: str
+    operator: str
+    #   `str` or (possibly nested) tuple of values
+    value: Any
+
+
+class _ParsedConstraintGroup(NamedTuple):
+    items: Tuple[Union["_ParsedConstraintGroup", _ParsedConstraint], ...]
+    operator: str
+
+
+_ParsedElement = Union[_ParsedConstraintGroup, _ParsedConstraint]
+
+
+class _ConstraintsFastParser:
+    """Hand-written recursive-descent parser of the `parser.tx` grammar.
+
+    Produces immutable trees of named tuples, so they can be safely cached.
+    """
+
+    def __init__(self, syntax: str) -> None:
+        self._syntax = syntax
+        self._pos = 0
+
+    def parse(self) -> _ParsedElement:
+        element = self._parse_group_or_single()
+        self._skip_whitespace()
+
+        if self._pos != len(self._syntax):
+            self._fail("end of input")
+
+        return element
+
+    def _parse_group_or_single(self) -> _ParsedElement:
+        start = self._pos
+
+        try:
+            return self._parse_group()
+        except _FastParserError:
+            #   Like textX, backtrack and try constraint, as property names can start with `!`
+            self._pos = start
+            return self._parse_constraint()
+
+    def _parse_group(self) -> _ParsedConstraintGroup:
+        self._expect("(")
+        operator = self._expect_one_of(_CONSTRAINT_GROUP_OPERATORS)
+
+        items: List[_ParsedElement] = []
+        while not self._next_is(")"):
+            items.append(self._parse_group_or_single())
+
+        self._expect(")")
+        return _ParsedConstraintGroup(tuple(items), operator)
+
+    def _parse_constraint(self) -> _ParsedConstraint:
+        self._expect("(")
+        property_name = self._match(_PROPERTY_NAME, "property name")
+        operator = self._expect_one_of(_CONSTRAINT_OPERATORS)
+        value = self._parse_value()
+        self._expect(")")
+
+        return _ParsedConstraint(property_name, operator, value)
+
+    def _parse_value(self) -> Any:
+        if not self._next_is("["):
+            return self._match(_PROPERTY_VALUE_STR, "property value")
+
+        self._expect("[")
+        items = []
+        if not self._next_is("]"):
+            items.append(self._parse_value())
+
+            while self._next_is(","):
+                self._expect(",")
+                items.append(self._parse_value())
+
+        self._expect("]")
+        return tuple(items)
+
+    def _skip_whitespace(self) -> None:
+        match = _WHITESPACE.match(self._syntax, self._pos)
+        assert match is not None  # mypy
+        self._pos = match.end()
+
+    def _next_is(self, value: str) -> bool:
+        self._skip_whitespace()
+        return self._syntax.startswith(value, self._pos)
+
+    def _expect(self, value: str) -> None:
+        if not self._next_is(value):
+            self._fail(f"`{value}`")
+
+        self._pos += len(value)
+
+    def _expect_one_of(self, values: Tuple[str, ...]) -> str:
+        for value in values:
+            if self._next_is(value):
+                self._pos += len(value)
+                return value
+
+        self._fail(" or ".join(f"`{value}`" for value in values))
+
+    def _match(self, pattern: "re.Pattern[str]", name: str) -> str:
+        self._skip_whitespace()
+        match = pattern.match(self._syntax, self._pos)
+        if match is None:
+            self._fail(name)
+
+        self._pos = match.end()
+        return match.group()
+
+    def _fail(self, expected: str) -> NoReturn:
+        raise _FastParserError(f"Expected {expected} at position {self._pos}")
+
+
 class PayloadSyntaxParser:
+    """Parser of constraints syntax.
+
+    Constraints are parsed with hand-written parser, with `textX` used as a fallback to validate
+    and report syntax the fast parser rejects. Parsed constraints are cached by their syntax, as
+    the same constraints are usually sent in many offers.
+    """
+
     __instance: Optional["PayloadSyntaxParser"] = None
 
     @classmethod
@@ -19,20 +155,74 @@ class PayloadSyntaxParser:
             cls.__instance = cls()
         return cls.__instance
 
-    def __init__(self):
-        self._metamodel = metamodel_from_file(str(Path(__file__).with_name("parser.tx")))
-        self._metamodel.register_obj_processors(
-            {
-                "ConstraintGroup": lambda e: ConstraintGroup(e.items, e.operator),
-                "Constraint": lambda e: Constraint(e.property_path, e.operator, e.value),
-                "PropertyValueList": lambda e: e.items,
-            }
-        )
+    def __init__(self, cache_size: int = 1024):
+        self._metamodel: Optional[Any] = None
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse)
 
     def parse_constraints(self, syntax: str) -> Constraints:
+        #   Cached trees are immutable, so each call receives its own, freely modifiable constraints
+        return self._build_element(self._parse_cached(syntax))
+
+    def clear_cache(self) -> None:
+        self._parse_cached.cache_clear()
+
+    def _parse(self, syntax: str) -> _ParsedElement:
+        try:
+            return _ConstraintsFastParser(syntax).parse()
+        except _FastParserError:
+            return self._parse_with_textx(syntax)
+
+    def _parse_with_textx(self, syntax: str) -> _ParsedElement:
         try:
-            model = self._metamodel.model_from_str(syntax)
+            model = self._get_metamodel().model_from_str(syntax)
         except TextXSyntaxError as e:
             raise SyntaxException(f"Syntax `{syntax}` parsed with following error: {e}")
 
         return model.constraints
+
+    def _get_metamodel(self) -> Any:
+        if self._metamodel is None:
+            self._metamodel = metamodel_from_file(str(Path(__file__).with_name("parser.tx")))
+            self._metamodel.register_obj_processors(
+                {
+                    "ConstraintGroup": lambda e: _ParsedConstraintGroup(tuple(e.items), e.operator),
+                    "Constraint": lambda e: _ParsedConstraint(e.property_path, e.operator, e.value),
+                    "PropertyValueList": lambda e: tuple(e.items),
+                }
+            )
+
+        return self._metamodel
+
+    @classmethod
+    def _build_element(cls, element: _ParsedElement) -> Any:
+        if isinstance(element, _ParsedConstraint):
+            return Constraint(
+                element.property_name,
+                element.operator,  # type: ignore[arg-type]
+                cls._build_value(element.value),
+            )
+
+        return ConstraintGroup(
+            [cls._build_element(item) for item in element.items],
+            element.operator,  # type: ignore[arg-type]
+        )
+
+    @classmethod
+    def _build_value(cls, value: Any) -> Any:
+        if isinstance(value, tuple):
+            return [cls._build_value(item) for item in value]
+
+        return value
+
+
+def parse_constraints_lazily(constraints: Union[Constraints, str]) -> Constraints:
+    """Return given constraints, parsing them first if they are still a syntax string.
+
+    Proposal and demand data keep constraints as received until they are accessed, as most of
+    their consumers never read constraints.
+    """
+
+    if isinstance(constraints, str):
+        return PayloadSyntaxParser.get_instance().parse_constraints(constraints)
+
+    return constraints
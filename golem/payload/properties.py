@@ -1,28 +1,227 @@
 from copy import deepcopy
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Mapping, Optional, Set
 
 from golem.payload.mixins import PropsConsSerializerMixin
 
 _missing = object()
 
+#   Values of these types are never modified in place, so they can be shared between copies
+_IMMUTABLE_TYPES = frozenset((str, int, float, bool, type(None), bytes))
+
 
 class Properties(PropsConsSerializerMixin, dict):
-    """Low level wrapper class for Golem's Market API properties manipulation."""
+    """Low level wrapper class for Golem's Market API properties manipulation.
+
+    Properties behave like a deep copy of given mapping, but copies of properties are cheap:
+    immutable values are always shared, and mutable values (e.g. lists) that were never given out
+    are shared between copies and deep-copied only on their first access, so copies of large
+    properties that are mostly read (e.g. for each offer) don't copy anything. This also applies
+    to `copy.deepcopy()` of properties and to properties created from plain mappings, so mutable
+    values of given mapping must not be modified in place afterwards.
+    """
+
+    #   Mutable value of each key is in one of the states:
+    #   - shared: might be referenced by other properties or by the mapping it was given in, but
+    #     never modified in place by them, so it is deep-copied before it is given out,
+    #   - private (`_private_keys`): referenced only by these properties,
+    #   - owned (`_owned_keys`): referenced only by these properties and possibly by other code
+    #     it was given out to, so other properties need their own deep copy of it.
+    __slots__ = ("_private_keys", "_owned_keys")
 
     def __init__(self, mapping=_missing, /) -> None:
-        if mapping is _missing:
-            super().__init__()
+        #   Both sets are lazily created
+        self._private_keys: Optional[Set[Any]] = None
+        self._owned_keys: Optional[Set[Any]] = None
+
+        super().__init__()
+
+        if mapping is not _missing:
+            self.update(mapping)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = dict.__getitem__(self, key)
+
+        if type(value) in _IMMUTABLE_TYPES:
+            return value
+
+        return self._give_out(key, value)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._set_key_state(key, owned=True)
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._set_key_state(key)
+
+    def __iter__(self) -> Iterator[Any]:
+        #   Overriding `__iter__` makes `dict(properties)` and `{**properties}` read values with
+        #   `__getitem__` instead of sharing them with the new dict
+        return super().__iter__()
+
+    def __copy__(self) -> "Properties":
+        return self.copy()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Properties":
+        return self.copy()
+
+    def __reduce__(self) -> Any:
+        return type(self), (dict(dict.items(self)),)
+
+    def __or__(self, other: Any) -> "Properties":
+        if not isinstance(other, Mapping):
+            return NotImplemented
+
+        properties = self.copy()
+        properties.update(other)
+        return properties
+
+    def __ror__(self, other: Any) -> "Properties":
+        if not isinstance(other, Mapping):
+            return NotImplemented
+
+        properties = type(self)(other)
+        properties.update(self)
+        return properties
+
+    def __ior__(self, other: Any) -> "Properties":
+        self.update(other)
+        return self
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            return default
+
+        return self[key]
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+
+        return self[key]
+
+    def pop(self, key: Any, *args: Any) -> Any:
+        if key not in self:
+            return super().pop(key, *args)
+
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self) -> Any:
+        key, value = super().popitem()
+        item = (key, self._copy_if_shared(key, value))
+        self._set_key_state(key)
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._private_keys = None
+        self._owned_keys = None
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        if len(args) == 1 and not kwargs and isinstance(args[0], Properties):
+            self._update_from_properties(args[0])
             return
 
-        mapping_deep_copy = deepcopy(mapping)
+        #   Mutable values of given mapping are shared, so they are copied only on first access
+        other = dict(*args, **kwargs)
+        super().update(other)
+        self._forget_keys_states(other)
+
+    def values(self) -> Any:
+        self._give_out_all()
+        return super().values()
+
+    def items(self) -> Any:
+        self._give_out_all()
+        return super().items()
 
-        super().__init__(mapping_deep_copy)
+    def copy(self) -> "Properties":
+        properties = type(self)()
+        properties._update_from_properties(self)
+        return properties
 
     def serialize(self) -> Dict[str, Any]:
         """Serialize complex objects into format handled by Market API properties specification."""
         return {
-            key: self._serialize_property(value) for key, value in self.items() if value is not None
+            key: self._serialize_property(value)
+            for key, value in dict.items(self)
+            if value is not None
         }
 
     def _serialize_property(self, value: Any) -> Any:
         return self._serialize_value(value)
+
+    def _update_from_properties(self, other: "Properties") -> None:
+        #   Properties given directly would be read with `__getitem__`, copying shared values
+        super().update(dict.items(other))
+        self._forget_keys_states(other)
+
+        #   Values given out by other properties might be referenced by other code
+        if other._owned_keys:
+            for key in other._owned_keys:
+                super().__setitem__(key, _copy_value(dict.__getitem__(other, key)))
+                self._set_key_state(key, private=True)
+
+        #   Private values of other properties are shared from now on
+        if other._private_keys:
+            other._private_keys = None
+
+    def _give_out(self, key: Any, value: Any) -> Any:
+        value = self._copy_if_shared(key, value)
+        self._set_key_state(key, owned=True)
+        return value
+
+    def _copy_if_shared(self, key: Any, value: Any) -> Any:
+        if (self._private_keys is not None and key in self._private_keys) or (
+            self._owned_keys is not None and key in self._owned_keys
+        ):
+            return value
+
+        value = _copy_value(value)
+        super().__setitem__(key, value)
+        return value
+
+    def _give_out_all(self) -> None:
+        for key, value in dict.items(self):
+            if type(value) not in _IMMUTABLE_TYPES:
+                self._give_out(key, value)
+
+    def _set_key_state(self, key: Any, private: bool = False, owned: bool = False) -> None:
+        if private:
+            if self._private_keys is None:
+                self._private_keys = set()
+            self._private_keys.add(key)
+        elif self._private_keys is not None:
+            self._private_keys.discard(key)
+
+        if owned:
+            if self._owned_keys is None:
+                self._owned_keys = set()
+            self._owned_keys.add(key)
+        elif self._owned_keys is not None:
+            self._owned_keys.discard(key)
+
+    def _forget_keys_states(self, keys: Any) -> None:
+        if self._private_keys:
+            self._private_keys.difference_update(keys)
+
+        if self._owned_keys:
+            self._owned_keys.difference_update(keys)
+
+
+def _copy_value(value: Any) -> Any:
+    """Deep copy given value, faster than `copy.deepcopy()` for values parsed from JSON."""
+    value_type = type(value)
+
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+
+    if value_type is list:
+        return [_copy_value(item) for item in value]
+
+    if value_type is dict:
+        return {key: _copy_value(item) for key, item in value.items()}
+
+    return deepcopy(value)
@@ -1,8 +1,9 @@
 import asyncio
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import TYPE_CHECKING, Set
 
 from golem.resources import NewDebitNote, NewInvoice
+from golem.utils.clock import utc_now
 
 if TYPE_CHECKING:
     from golem.node import GolemNode
@@ -83,8 +84,8 @@ class DefaultPaymentHandler:
 
         :param timeout: Maximum wait time in seconds.
         """
-        stop = datetime.now() + timedelta(seconds=timeout)
-        while datetime.now() < stop and any(
+        stop = utc_now() + timedelta(seconds=timeout)
+        while utc_now() < stop and any(
             agreement.invoice is None or agreement.invoice.data.status == "RECEIVED"
             for agreement in self._agreements
         ):
@@ -1,9 +1,11 @@
 import asyncio
 import heapq
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import AsyncIterator, Awaitable, Callable, Generic, List, Optional, Tuple, TypeVar
 
+from golem.utils.clock import utc_now
+
 TElement = TypeVar("TElement")
 
 
@@ -88,11 +90,11 @@ class Sort:
         self._no_more_elements = True
 
     async def _wait_until_ready(self) -> None:
-        start = datetime.now()
+        start = utc_now()
 
         while True:
             await asyncio.sleep(0.1)
-            now = datetime.now()
+            now = utc_now()
             if self._min_wait is not None and now - start < self._min_wait:
                 # force wait until time exceeds `min_wait`
                 continue
@@ -16,6 +16,7 @@ from golem.resources.agreement import (
     Agreement,
     AgreementClosed,
     AgreementDataChanged,
+    AgreementNotApproved,
     NewAgreement,
     default_create_activity,
 )
@@ -84,6 +85,8 @@ from golem.resources.proposal import (
     ProposalData,
     ProposalDataChanged,
     ProposalId,
+    ProposalRejectedByProvider,
+    ProposalRejectedByRequestor,
     default_create_agreement,
     default_negotiate,
 )
@@ -106,6 +109,7 @@ __all__ = (
     "NewAgreement",
     "AgreementDataChanged",
     "AgreementClosed",
+    "AgreementNotApproved",
     "default_create_activity",
     "Allocation",
     "AllocationException",
@@ -150,6 +154,8 @@ __all__ = (
     "NewProposal",
     "ProposalDataChanged",
     "ProposalClosed",
+    "ProposalRejectedByProvider",
+    "ProposalRejectedByRequestor",
     "default_negotiate",
     "default_create_agreement",
     "LinearCoeffs",
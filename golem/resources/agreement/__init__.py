@@ -1,5 +1,10 @@
 from golem.resources.agreement.agreement import Agreement
-from golem.resources.agreement.events import AgreementClosed, AgreementDataChanged, NewAgreement
+from golem.resources.agreement.events import (
+    AgreementClosed,
+    AgreementDataChanged,
+    AgreementNotApproved,
+    NewAgreement,
+)
 from golem.resources.agreement.pipeline import default_create_activity
 
 __all__ = (
@@ -7,5 +12,6 @@ __all__ = (
     "NewAgreement",
     "AgreementDataChanged",
     "AgreementClosed",
+    "AgreementNotApproved",
     "default_create_activity",
 )
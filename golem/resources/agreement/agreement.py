@@ -1,5 +1,5 @@
 import asyncio
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, List, Optional
 
 from ya_market import RequestorApi
@@ -8,9 +8,10 @@ from ya_market.exceptions import ApiException
 
 from golem.resources.activity import Activity
 from golem.resources.agreement.data import AgreementData
-from golem.resources.agreement.events import AgreementClosed, NewAgreement
+from golem.resources.agreement.events import AgreementClosed, AgreementNotApproved, NewAgreement
 from golem.resources.base import _NULL, Resource, api_call_wrapper
 from golem.resources.invoice import Invoice
+from golem.utils.clock import utc_now
 
 if TYPE_CHECKING:
     from golem.node import GolemNode
@@ -52,12 +53,13 @@ class Agreement(Resource[RequestorApi, models.Agreement, "Proposal", Activity, _
         :returns: True if agreement was approved.
         """
         try:
-            approved_at = datetime.now(timezone.utc)
+            approved_at = utc_now()
             await self.api.wait_for_approval(self.id, timeout=15, _request_timeout=16)
             self._approved_at = approved_at
             return True
         except ApiException as e:
             if e.status == 410:
+                await self.node.event_bus.emit(AgreementNotApproved(self))
                 return False
             elif e.status == 408:
                 #   TODO: maybe this should be in api_call_wrapper?
@@ -169,9 +171,7 @@ class Agreement(Resource[RequestorApi, models.Agreement, "Proposal", Activity, _
 
     async def get_agreement_data(self, force=False) -> AgreementData:
         data = await self.get_data(force=force)
-        agreement_duration = (
-            datetime.now(timezone.utc) - self.approved_at if self.approved_at else None
-        )
+        agreement_duration = utc_now() - self.approved_at if self.approved_at else None
         return AgreementData(
             agreement_id=data.agreement_id,
             provider_id=data.offer.provider_id,
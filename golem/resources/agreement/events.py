@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from golem.resources.events import NewResource, ResourceClosed, ResourceDataChanged
+from golem.resources.events import NewResource, ResourceClosed, ResourceDataChanged, ResourceEvent
 
 if TYPE_CHECKING:
     from golem.resources.agreement.agreement import Agreement  # noqa
@@ -16,3 +16,7 @@ class AgreementDataChanged(ResourceDataChanged["Agreement"]):
 
 class AgreementClosed(ResourceClosed["Agreement"]):
     pass
+
+
+class AgreementNotApproved(ResourceEvent["Agreement"]):
+    """Emitted when the provider doesn't approve the :any:`Agreement`."""
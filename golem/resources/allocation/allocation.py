@@ -1,5 +1,5 @@
 import asyncio
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
@@ -10,6 +10,7 @@ from golem.resources.allocation.events import NewAllocation
 from golem.resources.allocation.exceptions import NoMatchingAccount
 from golem.resources.base import _NULL, Resource, api_call_wrapper
 from golem.resources.events import ResourceClosed
+from golem.utils.clock import utc_now
 
 if TYPE_CHECKING:
     from golem.node import GolemNode
@@ -61,7 +62,7 @@ class Allocation(Resource[RequestorApi, models.Allocation, _NULL, _NULL, _NULL])
         account: models.Account,
         amount: Decimal,
     ) -> "Allocation":
-        timestamp = datetime.now(timezone.utc)
+        timestamp = utc_now()
         timeout = timestamp + timedelta(days=365 * 10)
 
         data = models.Allocation(
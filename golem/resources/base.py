@@ -2,7 +2,7 @@ import asyncio
 import logging
 import re
 from abc import ABC, ABCMeta
-from datetime import datetime, timezone
+from datetime import datetime
 from functools import wraps
 from typing import (
     TYPE_CHECKING,
@@ -26,6 +26,7 @@ from ya_payment import ApiException as PaymentApiException
 
 from golem.resources.events import ResourceDataChanged
 from golem.resources.exceptions import ResourceNotFound
+from golem.utils.clock import utc_now
 from golem.utils.low import TRequestorApi, get_requestor_api
 
 if TYPE_CHECKING:
@@ -130,7 +131,7 @@ class Resource(
     """
 
     def __init__(self, node: "GolemNode", id_: str, data: Optional[TModel] = None):
-        self._created_at = datetime.now(timezone.utc)
+        self._created_at = utc_now()
         self._node = node
         self._id = id_
         self._data: Optional[TModel] = data
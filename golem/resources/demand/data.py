@@ -1,14 +1,39 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 
 from golem.payload import Constraints, Properties
+from golem.payload.parser import parse_constraints_lazily
 
 
-@dataclass
+@dataclass(init=False)
 class DemandData:
     properties: Properties
-    constraints: Constraints
+    _constraints: Union[Constraints, str]
     demand_id: Optional[str]
     requestor_id: Optional[str]
     timestamp: datetime
+
+    def __init__(
+        self,
+        properties: Properties,
+        constraints: Union[Constraints, str],
+        demand_id: Optional[str],
+        requestor_id: Optional[str],
+        timestamp: datetime,
+    ) -> None:
+        self.properties = properties
+        #   Syntax string is parsed on the first access of `constraints`
+        self._constraints = constraints
+        self.demand_id = demand_id
+        self.requestor_id = requestor_id
+        self.timestamp = timestamp
+
+    @property
+    def constraints(self) -> Constraints:
+        self._constraints = parse_constraints_lazily(self._constraints)
+        return self._constraints
+
+    @constraints.setter
+    def constraints(self, constraints: Constraints) -> None:
+        self._constraints = constraints
@@ -5,11 +5,11 @@ from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, List, Optional,
 from ya_market import RequestorApi
 from ya_market import models as models
 
-from golem.payload import Constraints, PayloadSyntaxParser, Properties
+from golem.payload import Constraints, Properties
 from golem.resources.base import _NULL, Resource, ResourceNotFound, api_call_wrapper
 from golem.resources.demand.data import DemandData
 from golem.resources.demand.events import DemandClosed, NewDemand
-from golem.resources.proposal import Proposal
+from golem.resources.proposal import Proposal, ProposalRejectedByProvider
 from golem.utils.low import YagnaEventCollector
 
 if TYPE_CHECKING:
@@ -83,6 +83,7 @@ class Demand(Resource[RequestorApi, models.Demand, _NULL, Proposal, _NULL], Yagn
             assert event.proposal_id is not None  # mypy
             proposal = self.proposal(event.proposal_id)
             proposal.add_event(event)
+            await self.node.event_bus.emit(ProposalRejectedByProvider(proposal))
 
     #################
     #   OTHER METHODS
@@ -129,12 +130,9 @@ class Demand(Resource[RequestorApi, models.Demand, _NULL, Proposal, _NULL], Yagn
         if not self._demand_data:
             data = await self.get_data()
 
-            # TODO: Make constraints parsing lazy
-            constraints = PayloadSyntaxParser.get_instance().parse_constraints(data.constraints)
-
-            return DemandData(
+            self._demand_data = DemandData(
                 properties=Properties(data.properties),
-                constraints=constraints,
+                constraints=data.constraints,
                 demand_id=data.demand_id,
                 requestor_id=data.requestor_id,
                 timestamp=cast(datetime, data.timestamp),
@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, Tuple, Union
 
 from ya_payment import models
 
 from golem.resources.base import Resource
+from golem.utils.clock import utc_now
 from golem.utils.low import YagnaEventCollector
 
 if TYPE_CHECKING:
@@ -32,7 +32,7 @@ DebitNoteEvent = Union[
 class PaymentEventCollector(YagnaEventCollector, ABC):
     def __init__(self, node: "GolemNode"):
         self.node = node
-        self.min_ts = datetime.now(timezone.utc)
+        self.min_ts = utc_now()
 
     def _collect_events_kwargs(self) -> Dict:
         return {"after_timestamp": self.min_ts, "app_session_id": self.node.app_session_id}
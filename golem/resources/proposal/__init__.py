@@ -1,5 +1,11 @@
 from golem.resources.proposal.data import ProposalData, ProposalId
-from golem.resources.proposal.events import NewProposal, ProposalClosed, ProposalDataChanged
+from golem.resources.proposal.events import (
+    NewProposal,
+    ProposalClosed,
+    ProposalDataChanged,
+    ProposalRejectedByProvider,
+    ProposalRejectedByRequestor,
+)
 from golem.resources.proposal.pipeline import default_create_agreement, default_negotiate
 from golem.resources.proposal.proposal import Proposal
 
@@ -10,6 +16,8 @@ __all__ = (
     "NewProposal",
     "ProposalDataChanged",
     "ProposalClosed",
+    "ProposalRejectedByProvider",
+    "ProposalRejectedByRequestor",
     "default_negotiate",
     "default_create_agreement",
 )
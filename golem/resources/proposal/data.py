@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Literal, Optional, Union
 
 from golem.payload import Constraints, Properties
+from golem.payload.parser import parse_constraints_lazily
 
 ProposalId = str
 
@@ -10,12 +11,40 @@ ProposalId = str
 ProposalState = Literal["Initial", "Draft", "Rejected", "Accepted", "Expired"]
 
 
-@dataclass
+@dataclass(init=False)
 class ProposalData:
     properties: Properties
-    constraints: Constraints
+    _constraints: Union[Constraints, str]
     proposal_id: Optional[ProposalId]
     issuer_id: Optional[str]
     state: ProposalState
     timestamp: datetime
     prev_proposal_id: Optional[str]
+
+    def __init__(
+        self,
+        properties: Properties,
+        constraints: Union[Constraints, str],
+        proposal_id: Optional[ProposalId],
+        issuer_id: Optional[str],
+        state: ProposalState,
+        timestamp: datetime,
+        prev_proposal_id: Optional[str],
+    ) -> None:
+        self.properties = properties
+        #   Syntax string is parsed on the first access of `constraints`
+        self._constraints = constraints
+        self.proposal_id = proposal_id
+        self.issuer_id = issuer_id
+        self.state = state
+        self.timestamp = timestamp
+        self.prev_proposal_id = prev_proposal_id
+
+    @property
+    def constraints(self) -> Constraints:
+        self._constraints = parse_constraints_lazily(self._constraints)
+        return self._constraints
+
+    @constraints.setter
+    def constraints(self, constraints: Constraints) -> None:
+        self._constraints = constraints
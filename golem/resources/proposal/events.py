@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from golem.resources.events import NewResource, ResourceClosed, ResourceDataChanged
+from golem.resources.events import NewResource, ResourceClosed, ResourceDataChanged, ResourceEvent
 
 if TYPE_CHECKING:
     from golem.resources.proposal.proposal import Proposal  # noqa
@@ -16,3 +16,11 @@ class ProposalDataChanged(ResourceDataChanged["Proposal"]):
 
 class ProposalClosed(ResourceClosed["Proposal"]):
     pass
+
+
+class ProposalRejectedByProvider(ResourceEvent["Proposal"]):
+    """Emitted when the provider rejects our :any:`Proposal`."""
+
+
+class ProposalRejectedByRequestor(ResourceEvent["Proposal"]):
+    """Emitted when we reject the provider's :any:`Proposal`."""
@@ -1,16 +1,17 @@
 import asyncio
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, AsyncIterator, Optional, Union, cast
 
 from ya_market import RequestorApi
 from ya_market import models as models
 
-from golem.payload import Constraints, NodeInfo, PayloadSyntaxParser, Properties
+from golem.payload import Constraints, NodeInfo, Properties
 from golem.resources.agreement import Agreement
 from golem.resources.base import Resource, api_call_wrapper
 from golem.resources.proposal.data import ProposalData
-from golem.resources.proposal.events import NewProposal
+from golem.resources.proposal.events import NewProposal, ProposalRejectedByRequestor
 from golem.resources.proposal.exceptions import ProposalRejected
+from golem.utils.clock import utc_now
 
 if TYPE_CHECKING:
     from golem.node import GolemNode
@@ -126,7 +127,7 @@ class Proposal(
         proposal = models.AgreementProposal(
             proposal_id=self.id,
             # TODO: what is AgreementValidTo?
-            valid_to=datetime.now(timezone.utc) + timeout,  # type: ignore
+            valid_to=utc_now() + timeout,  # type: ignore
         )
         agreement_id = await self.api.create_agreement(proposal)
         agreement = Agreement(self.node, agreement_id)
@@ -147,6 +148,7 @@ class Proposal(
         await self.api.reject_proposal_offer(
             self.demand.id, self.id, request_body={"message": reason}, _request_timeout=5
         )
+        await self.node.event_bus.emit(ProposalRejectedByRequestor(self))
 
     @api_call_wrapper()
     async def respond(
@@ -207,10 +209,9 @@ class Proposal(
     async def get_proposal_data(self) -> ProposalData:
         if not self._proposal_data:
             data = await self.get_data()
-            constraints = PayloadSyntaxParser.get_instance().parse_constraints(data.constraints)
             self._proposal_data = ProposalData(
                 properties=Properties(data.properties),
-                constraints=constraints,
+                constraints=data.constraints,
                 proposal_id=data.proposal_id,
                 issuer_id=data.issuer_id,
                 state=data.state,
@@ -3,6 +3,7 @@ from golem.utils.asyncio.buffer import (
     Buffer,
     ComposableBuffer,
     ExpirableBuffer,
+    HeapBuffer,
     SimpleBuffer,
 )
 from golem.utils.asyncio.queue import ErrorReportingQueue
@@ -11,7 +12,9 @@ from golem.utils.asyncio.tasks import (
     create_task_with_logging,
     ensure_cancelled,
     ensure_cancelled_many,
+    wait_for_event,
 )
+from golem.utils.asyncio.virtual_time import VirtualTimeEventLoop, run_in_virtual_time
 from golem.utils.asyncio.waiter import Waiter
 
 __all__ = (
@@ -19,11 +22,15 @@ __all__ = (
     "Buffer",
     "ComposableBuffer",
     "ExpirableBuffer",
+    "HeapBuffer",
     "SimpleBuffer",
     "ErrorReportingQueue",
     "SingleUseSemaphore",
     "ensure_cancelled",
     "ensure_cancelled_many",
     "create_task_with_logging",
+    "wait_for_event",
     "Waiter",
+    "VirtualTimeEventLoop",
+    "run_in_virtual_time",
 )
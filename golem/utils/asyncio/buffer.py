@@ -1,15 +1,19 @@
 import asyncio
+import heapq
 import itertools
 import logging
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
 from contextlib import asynccontextmanager
 from datetime import timedelta
 from typing import (
+    Any,
     Awaitable,
     Callable,
+    Deque,
     Dict,
     Generic,
+    Iterable,
     List,
     MutableSequence,
     Optional,
@@ -19,9 +23,7 @@ from typing import (
 
 from golem.utils.asyncio.semaphore import SingleUseSemaphore
 from golem.utils.asyncio.tasks import (
-    create_delayed_task_with_logging,
     create_task_with_logging,
-    ensure_cancelled,
     ensure_cancelled_many,
     resolve_maybe_awaitable,
 )
@@ -32,6 +34,17 @@ TItem = TypeVar("TItem")
 
 logger = logging.getLogger(__name__)
 
+_REMOVED = object()
+
+
+def _is_hashable(item: Any) -> bool:
+    try:
+        hash(item)
+    except TypeError:
+        return False
+
+    return True
+
 
 class Buffer(ABC, Generic[TItem]):
     """Interface class for object similar to `asyncio.Queue` but with more control over its \
@@ -146,18 +159,14 @@ class ComposableBuffer(Buffer[TItem]):
         self._buffer.reset_exception()
 
 
-class SimpleBuffer(Buffer[TItem]):
-    """Basic implementation of the Buffer interface."""
+class _ConditionBuffer(Buffer[TItem], ABC):
+    """Base of buffers that guard their items with a condition and can hold an exception."""
 
-    def __init__(self, items: Optional[Sequence[TItem]] = None):
-        self._items = list(items) if items else []
+    def __init__(self) -> None:
         self._error: Optional[BaseException] = None
 
         self.condition = asyncio.Condition()
 
-    def size(self) -> int:
-        return len(self._items)
-
     @asynccontextmanager
     async def _handle_lock(self, lock: bool):
         if lock:
@@ -176,54 +185,237 @@ class SimpleBuffer(Buffer[TItem]):
         if not self.size() and self._error:
             raise self._error
 
+    async def set_exception(self, exc: BaseException, *, lock=True) -> None:
+        async with self._handle_lock(lock):
+            self._error = exc
+            self.condition.notify()
+
+    def reset_exception(self) -> None:
+        self._error = None
+
+
+class SimpleBuffer(_ConditionBuffer[TItem]):
+    """Basic implementation of the Buffer interface.
+
+    Items are kept in insertion order together with index of their positions, so getting and
+    removing of hashable items costs `O(1)`. Unhashable items are supported, but they are removed
+    with linear search.
+    """
+
+    def __init__(self, items: Optional[Sequence[TItem]] = None):
+        super().__init__()
+
+        self._items: "OrderedDict[int, TItem]" = OrderedDict()
+        self._items_index: Dict[Any, Deque[int]] = defaultdict(deque)
+        self._items_counter = itertools.count()
+
+        if items:
+            self._add_items(items)
+
+    def size(self) -> int:
+        return len(self._items)
+
     async def get(self, *, lock=True) -> TItem:
         async with self._handle_lock(lock):
             await self.wait_for_any_items(lock=False)
 
-            return self._items.pop(0)
+            _, item = self._items.popitem(last=False)
+
+            if _is_hashable(item):
+                #   Oldest item is also the oldest of its equal items
+                positions = self._items_index[item]
+                positions.popleft()
+                if not positions:
+                    del self._items_index[item]
+
+            return item
 
     async def get_all(self, *, lock=True) -> MutableSequence[TItem]:
         async with self._handle_lock(lock):
             self._handle_error_if_empty()
 
-            items = self._items[:]
+            items = list(self._items.values())
             self._items.clear()
+            self._items_index.clear()
 
             return items
 
     async def put(self, item: TItem, *, lock=True) -> None:
         async with self._handle_lock(lock):
-            self._items.append(item)
+            self._add_item(item)
             self.condition.notify()
 
     async def put_all(self, items: Sequence[TItem], *, lock=True) -> None:
         async with self._handle_lock(lock):
             self._items.clear()
-            self._items.extend(items[:])
+            self._items_index.clear()
+            self._add_items(items)
 
             self.condition.notify(len(items))
 
     async def remove(self, item: TItem, *, lock=True) -> None:
         async with self._handle_lock(lock):
-            self._items.remove(item)
+            if not _is_hashable(item):
+                self._remove_unhashable_item(item)
+                return
 
-    async def set_exception(self, exc: BaseException, *, lock=True) -> None:
+            positions = self._items_index.get(item)
+            if not positions:
+                raise ValueError(f"{item!r} not in buffer")
+
+            del self._items[positions.popleft()]
+            if not positions:
+                del self._items_index[item]
+
+    def _add_items(self, items: Iterable[TItem]) -> None:
+        for item in items:
+            self._add_item(item)
+
+    def _add_item(self, item: TItem) -> None:
+        position = next(self._items_counter)
+        self._items[position] = item
+
+        if _is_hashable(item):
+            self._items_index[item].append(position)
+
+    def _remove_unhashable_item(self, item: TItem) -> None:
+        for position, buffered_item in self._items.items():
+            if buffered_item == item:
+                del self._items[position]
+                return
+
+        raise ValueError(f"{item!r} not in buffer")
+
+
+class HeapBuffer(_ConditionBuffer[TItem]):
+    """`Buffer` that keeps items in a heap, ordered by key calculated once on put.
+
+    Left-most item is the one with the lowest key, items with equal keys are kept in order of
+    addition. Adding, getting and removing single hashable item costs `O(log n)`, as removed items
+    are only marked in the heap and skipped when they reach its top.
+    """
+
+    def __init__(self, key: Callable[[TItem], Any], items: Optional[Sequence[TItem]] = None):
+        super().__init__()
+
+        self._key = key
+        self._counter = itertools.count()
+        #   Heap entries are `[key, sequence number, item]` lists, with item replaced by
+        #   `_REMOVED` marker when item is removed
+        self._heap: List[List[Any]] = []
+        self._entries: Dict[Any, Deque[List[Any]]] = defaultdict(deque)
+        self._removed_entries_count = 0
+
+        if items:
+            self._replace_items(items)
+
+    def size(self) -> int:
+        return len(self._heap) - self._removed_entries_count
+
+    async def get(self, *, lock=True) -> TItem:
         async with self._handle_lock(lock):
-            self._error = exc
+            await self.wait_for_any_items(lock=False)
+
+            while True:
+                entry = heapq.heappop(self._heap)
+                item = entry[-1]
+
+                if item is _REMOVED:
+                    self._removed_entries_count -= 1
+                    continue
+
+                self._forget_entry(entry)
+                return item
+
+    async def get_all(self, *, lock=True) -> MutableSequence[TItem]:
+        async with self._handle_lock(lock):
+            self._handle_error_if_empty()
+
+            items = [entry[-1] for entry in sorted(self._heap) if entry[-1] is not _REMOVED]
+            self._heap.clear()
+            self._entries.clear()
+            self._removed_entries_count = 0
+
+            return items
+
+    async def put(self, item: TItem, *, lock=True) -> None:
+        async with self._handle_lock(lock):
+            heapq.heappush(self._heap, self._create_entry(item))
             self.condition.notify()
 
-    def reset_exception(self) -> None:
-        self._error = None
+    async def put_all(self, items: Sequence[TItem], *, lock=True) -> None:
+        async with self._handle_lock(lock):
+            self._replace_items(items)
+
+            self.condition.notify(len(items))
+
+    async def remove(self, item: TItem, *, lock=True) -> None:
+        async with self._handle_lock(lock):
+            if _is_hashable(item):
+                entries = self._entries.get(item)
+                if not entries:
+                    raise ValueError(f"{item!r} not in buffer")
+
+                #   Oldest of equal items is removed, like in `SimpleBuffer`
+                entry = entries.popleft()
+                if not entries:
+                    del self._entries[item]
+            else:
+                entry = self._find_unhashable_entry(item)
+
+            entry[-1] = _REMOVED
+
+            self._removed_entries_count += 1
+            if len(self._heap) < 2 * self._removed_entries_count:
+                self._compact_heap()
+
+    def _create_entry(self, item: TItem) -> List[Any]:
+        entry = [self._key(item), next(self._counter), item]
+
+        if _is_hashable(item):
+            self._entries[item].append(entry)
+
+        return entry
+
+    def _forget_entry(self, entry: List[Any]) -> None:
+        item = entry[-1]
+
+        if not _is_hashable(item):
+            return
+
+        entries = self._entries[item]
+        entries.remove(entry)
+        if not entries:
+            del self._entries[item]
+
+    def _find_unhashable_entry(self, item: TItem) -> List[Any]:
+        entries = [e for e in self._heap if e[-1] is not _REMOVED and e[-1] == item]
+
+        if not entries:
+            raise ValueError(f"{item!r} not in buffer")
+
+        return min(entries, key=lambda e: e[1])
+
+    def _compact_heap(self) -> None:
+        self._heap = [entry for entry in self._heap if entry[-1] is not _REMOVED]
+        heapq.heapify(self._heap)
+        self._removed_entries_count = 0
+
+    def _replace_items(self, items: Sequence[TItem]) -> None:
+        self._entries.clear()
+        self._removed_entries_count = 0
+        self._heap = [self._create_entry(item) for item in items]
+        heapq.heapify(self._heap)
 
 
 class ExpirableBuffer(ComposableBuffer[TItem]):
     """Composable `Buffer` that adds option to expire item after some time.
 
     Items that are already in provided buffer will not expire.
-    """
 
-    # TODO: Optimisation options: Use single expiration task that wakes up to expire the earliest
-    #  item, then check next earliest item and sleep to it and repeat
+    Expiration times are kept in a min-heap, served by single timer scheduled at the earliest
+    expiration, so there are no background tasks per item.
+    """
 
     def __init__(
         self,
@@ -236,57 +428,139 @@ class ExpirableBuffer(ComposableBuffer[TItem]):
         self._get_expiration_func = get_expiration_func
         self._on_expired_func = on_expired_func
 
-        self._expiration_tasks: Dict[int, List[asyncio.Task]] = defaultdict(list)
+        #   Heap entries are `[expiration loop time, sequence number, item]` lists, with item
+        #   replaced by `_REMOVED` marker when expiration is cancelled
+        self._expiration_heap: List[List[Any]] = []
+        self._expiration_entries: Dict[int, Deque[List[Any]]] = defaultdict(deque)
+        self._expiration_counter = itertools.count()
+        self._removed_entries_count = 0
+        self._expiration_timer: Optional[asyncio.TimerHandle] = None
 
-    async def _add_expiration_task_for_item(self, item: TItem) -> None:
+    async def _add_expiration_for_item(self, item: TItem) -> None:
         expiration = await resolve_maybe_awaitable(self._get_expiration_func(item))
 
         if expiration is None:
             return
 
-        self._expiration_tasks[id(item)].append(
-            create_delayed_task_with_logging(
-                expiration,
-                self._expire_item_shielded(item),
-                trace_id=get_trace_id_name(self, f"item-expire-{item}"),
-            )
-        )
+        loop = asyncio.get_running_loop()
+        entry = [
+            loop.time() + expiration.total_seconds(),
+            next(self._expiration_counter),
+            item,
+        ]
+
+        self._expiration_entries[id(item)].append(entry)
+        heapq.heappush(self._expiration_heap, entry)
 
-    async def _remove_expiration_task_for_item(self, item: TItem) -> None:
+        if self._expiration_heap[0] is entry:
+            self._schedule_expiration_timer()
+
+    def _remove_expiration_for_item(self, item: TItem) -> None:
         item_id = id(item)
+        entries = self._expiration_entries.get(item_id)
 
-        if item_id not in self._expiration_tasks or not len(self._expiration_tasks[item_id]):
+        if not entries:
             return
 
-        await ensure_cancelled(self._expiration_tasks[item_id].pop(0))
+        entries.popleft()[-1] = _REMOVED
 
-        if not self._expiration_tasks[item_id]:
-            del self._expiration_tasks[item_id]
+        if not entries:
+            del self._expiration_entries[item_id]
 
-    async def _remove_all_expiration_handlers(self) -> None:
-        await ensure_cancelled_many(itertools.chain.from_iterable(self._expiration_tasks.values()))
+        self._removed_entries_count += 1
+        if len(self._expiration_heap) < 2 * self._removed_entries_count:
+            self._compact_expiration_heap()
 
-        self._expiration_tasks.clear()
+    def _remove_all_expirations(self) -> None:
+        self._expiration_heap.clear()
+        self._expiration_entries.clear()
+        self._removed_entries_count = 0
 
-    async def _expire_item_shielded(self, item: TItem) -> None:
-        # We need to shield this function as by self.remove it will try to cancel itself
-        await asyncio.shield(self._expire_item(item))
+        self._schedule_expiration_timer()
 
-    async def _expire_item(self, item: TItem) -> None:
-        try:
-            await self.remove(item)
-        except ValueError:
-            # Item was removed in the meantime
+    def _compact_expiration_heap(self) -> None:
+        self._expiration_heap = [
+            entry for entry in self._expiration_heap if entry[-1] is not _REMOVED
+        ]
+        heapq.heapify(self._expiration_heap)
+        self._removed_entries_count = 0
+
+    def _schedule_expiration_timer(self) -> None:
+        if self._expiration_timer is not None:
+            self._expiration_timer.cancel()
+            self._expiration_timer = None
+
+        if not self._expiration_heap:
             return
 
-        if self._on_expired_func:
-            await resolve_maybe_awaitable(self._on_expired_func(item))
+        self._expiration_timer = asyncio.get_running_loop().call_at(
+            self._expiration_heap[0][0], self._on_expiration_timer
+        )
+
+    def _on_expiration_timer(self) -> None:
+        self._expiration_timer = None
+
+        loop = asyncio.get_running_loop()
+        expired_items = []
+
+        while self._expiration_heap and self._expiration_heap[0][0] <= loop.time():
+            entry = heapq.heappop(self._expiration_heap)
+            item = entry[-1]
+
+            if item is _REMOVED:
+                self._removed_entries_count -= 1
+                continue
+
+            item_entries = self._expiration_entries[id(item)]
+            item_entries.remove(entry)
+            if not item_entries:
+                del self._expiration_entries[id(item)]
+
+            expired_items.append(item)
+
+        self._schedule_expiration_timer()
+
+        if expired_items:
+            create_task_with_logging(
+                self._expire_items(expired_items),
+                trace_id=get_trace_id_name(self, "items-expire"),
+            )
+
+    async def _expire_items(self, items: Sequence[TItem]) -> None:
+        removed_items = []
+
+        async with self._handle_lock(True):
+            for item in items:
+                try:
+                    await self._buffer.remove(item, lock=False)
+                except ValueError:
+                    # Item was removed in the meantime
+                    continue
+
+                removed_items.append(item)
+
+        if self._on_expired_func is None:
+            return
+
+        results = await asyncio.gather(
+            *[self._call_on_expired_func(item) for item in removed_items],
+            return_exceptions=True,
+        )
+
+        for item, result in zip(removed_items, results):
+            if isinstance(result, Exception):
+                logger.error("Handling expiration of `%r` failed!", item, exc_info=result)
+
+    async def _call_on_expired_func(self, item: TItem) -> None:
+        assert self._on_expired_func is not None  # mypy
+
+        await resolve_maybe_awaitable(self._on_expired_func(item))
 
     async def get(self, *, lock=True) -> TItem:
         async with self._handle_lock(lock):
             item = await super().get(lock=False)
 
-            await self._remove_expiration_task_for_item(item)
+            self._remove_expiration_for_item(item)
 
             return item
 
@@ -294,7 +568,7 @@ class ExpirableBuffer(ComposableBuffer[TItem]):
         async with self._handle_lock(lock):
             items = await super().get_all(lock=False)
 
-            await self._remove_all_expiration_handlers()
+            self._remove_all_expirations()
 
             return items
 
@@ -302,16 +576,16 @@ class ExpirableBuffer(ComposableBuffer[TItem]):
         async with self._handle_lock(lock):
             await super().put(item, lock=False)
 
-            await self._add_expiration_task_for_item(item)
+            await self._add_expiration_for_item(item)
 
     async def put_all(self, items: Sequence[TItem], *, lock=True) -> None:
         async with self._handle_lock(lock):
             await super().put_all(items, lock=False)
 
-            await self._remove_all_expiration_handlers()
+            self._remove_all_expirations()
 
             await asyncio.gather(
-                *[self._add_expiration_task_for_item(item) for item in items],
+                *[self._add_expiration_for_item(item) for item in items],
                 return_exceptions=True,
             )
 
@@ -319,7 +593,7 @@ class ExpirableBuffer(ComposableBuffer[TItem]):
         async with self._handle_lock(lock):
             await super().remove(item, lock=False)
 
-            await self._remove_expiration_task_for_item(item)
+            self._remove_expiration_for_item(item)
 
 
 class BackgroundFillBuffer(ComposableBuffer[TItem]):
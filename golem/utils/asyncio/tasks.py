@@ -95,6 +95,26 @@ async def ensure_cancelled_many(tasks: Iterable[asyncio.Task]) -> None:
     await asyncio.gather(*[ensure_cancelled(task) for task in tasks])
 
 
+async def wait_for_event(event: asyncio.Event, timeout: Optional[float] = None) -> bool:
+    """Wait until given event is set or timeout passes, return if the event is set.
+
+    Unlike `asyncio.wait_for(event.wait(), timeout)` before Python 3.12, cancellation is not
+    swallowed when the event is set at the same time.
+    """
+
+    if event.is_set():
+        return True
+
+    wait_task = asyncio.ensure_future(event.wait())
+
+    try:
+        await asyncio.wait([wait_task], timeout=timeout)
+    finally:
+        wait_task.cancel()
+
+    return event.is_set()
+
+
 async def resolve_maybe_awaitable(value: MaybeAwaitable[T]) -> T:
     """Return given value or await for it results if value is awaitable."""
 
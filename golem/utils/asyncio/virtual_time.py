@@ -0,0 +1,124 @@
+import asyncio
+import selectors
+from datetime import datetime, timedelta
+from typing import Any, Coroutine, List, Mapping, Optional, Tuple, TypeVar
+
+from golem.utils.clock import LoopClock, use_clock
+
+TResult = TypeVar("TResult")
+
+
+class _VirtualTimeSelector(selectors.BaseSelector):
+    """Selector that instead of waiting for the next timer, advances virtual time of the loop.
+
+    Real I/O is still handled, but it's awaited only for `io_grace` seconds of real time before
+    moving to the next timer.
+    """
+
+    def __init__(self, loop: "VirtualTimeEventLoop", io_grace: float) -> None:
+        self._loop = loop
+        self._io_grace = io_grace
+        self._selector = selectors.DefaultSelector()
+
+    def register(self, fileobj: Any, events: int, data: Any = None) -> selectors.SelectorKey:
+        return self._selector.register(fileobj, events, data)
+
+    def unregister(self, fileobj: Any) -> selectors.SelectorKey:
+        return self._selector.unregister(fileobj)
+
+    def modify(self, fileobj: Any, events: int, data: Any = None) -> selectors.SelectorKey:
+        return self._selector.modify(fileobj, events, data)
+
+    def select(self, timeout: Optional[float] = None) -> List[Tuple[selectors.SelectorKey, int]]:
+        if timeout is None:
+            #   Nothing is scheduled, only I/O can wake the loop up
+            return self._selector.select(None)
+
+        ready = self._selector.select(min(timeout, self._io_grace))
+        if ready or timeout == 0:
+            return ready
+
+        self._loop.advance_time(timeout)
+        return []
+
+    def get_key(self, fileobj: Any) -> selectors.SelectorKey:
+        return self._selector.get_key(fileobj)
+
+    def get_map(self) -> Mapping[Any, selectors.SelectorKey]:
+        return self._selector.get_map()
+
+    def close(self) -> None:
+        self._selector.close()
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """Event loop with virtual time, that jumps to the next scheduled timer when idle.
+
+    All timers (`asyncio.sleep()`, `asyncio.wait_for()`, `loop.call_later()` etc.) are scheduled
+    in virtual time, so hours of time-driven behaviour can be simulated in seconds. Dates
+    consistent with loop time are available via :any:`VirtualTimeEventLoop.clock`.
+
+    Real I/O is still handled, but it's awaited only for `io_grace` of real time before virtual
+    time moves to the next timer. Default of no grace is enough for I/O within the same loop
+    (e.g. with local HTTP server like `yagna` simulator), `io_grace` should be increased if loop
+    communicates with other threads or processes.
+
+    Usage::
+
+        result = run_in_virtual_time(main())
+    """
+
+    def __init__(
+        self,
+        start: Optional[datetime] = None,
+        io_grace: timedelta = timedelta(),
+    ) -> None:
+        self._virtual_time = 0.0
+
+        super().__init__(_VirtualTimeSelector(self, io_grace.total_seconds()))
+
+        self.clock = LoopClock(self, start)
+
+    def time(self) -> float:
+        return self._virtual_time
+
+    def advance_time(self, seconds: float) -> None:
+        """Move virtual time forward by given amount of seconds."""
+        if seconds < 0:
+            raise ValueError("Virtual time can't go back!")
+
+        self._virtual_time += seconds
+
+
+def run_in_virtual_time(
+    main: Coroutine[Any, Any, TResult],
+    start: Optional[datetime] = None,
+    io_grace: timedelta = timedelta(),
+) -> TResult:
+    """Run given coroutine like `asyncio.run()`, but in :any:`VirtualTimeEventLoop`.
+
+    Loop clock is used as golem clock for the run, so dates are consistent with loop time.
+    """
+    loop = VirtualTimeEventLoop(start, io_grace)
+    try:
+        asyncio.set_event_loop(loop)
+        with use_clock(loop.clock):
+            try:
+                return loop.run_until_complete(main)
+            finally:
+                _cancel_all_tasks(loop)
+                loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    tasks = [task for task in asyncio.all_tasks(loop) if not task.done()]
+    if not tasks:
+        return
+
+    for task in tasks:
+        task.cancel()
+
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
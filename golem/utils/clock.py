@@ -0,0 +1,65 @@
+import asyncio
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
+
+
+class Clock(ABC):
+    """Source of the current date and time for golem."""
+
+    @abstractmethod
+    def now(self) -> datetime:
+        """Return current timezone aware UTC datetime."""
+
+
+class SystemClock(Clock):
+    """Clock based on the system time."""
+
+    def now(self) -> datetime:
+        return datetime.now(timezone.utc)
+
+
+class LoopClock(Clock):
+    """Clock that follows `time()` of given event loop, starting from given date.
+
+    Useful together with event loop with virtual time, as dates are consistent with
+    `asyncio.sleep()` and other loop timers.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, start: Optional[datetime] = None) -> None:
+        self._loop = loop
+        self._start = start or datetime.now(timezone.utc)
+        self._start_loop_time = loop.time()
+
+    def now(self) -> datetime:
+        return self._start + timedelta(seconds=self._loop.time() - self._start_loop_time)
+
+
+_clock: Clock = SystemClock()
+
+
+def get_clock() -> Clock:
+    return _clock
+
+
+def set_clock(clock: Clock) -> None:
+    """Set clock used by golem as a source of current date and time."""
+    global _clock
+    _clock = clock
+
+
+@contextmanager
+def use_clock(clock: Clock) -> Iterator[Clock]:
+    """Use given clock as a source of current date and time inside of context."""
+    previous_clock = get_clock()
+    set_clock(clock)
+    try:
+        yield clock
+    finally:
+        set_clock(previous_clock)
+
+
+def utc_now() -> datetime:
+    """Return current timezone aware UTC datetime according to the current clock."""
+    return _clock.now()
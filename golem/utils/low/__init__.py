@@ -1,5 +1,6 @@
 from golem.utils.low.api import ActivityApi, ApiConfig, ApiFactory, TRequestorApi, get_requestor_api
 from golem.utils.low.event_collector import YagnaEventCollector
+from golem.utils.low.recording import ApiRecorder, RecordedExchange, load_recording
 
 __all__ = (
     "YagnaEventCollector",
@@ -8,4 +9,7 @@ __all__ = (
     "ApiConfig",
     "ApiFactory",
     "get_requestor_api",
+    "ApiRecorder",
+    "RecordedExchange",
+    "load_recording",
 )
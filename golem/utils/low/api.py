@@ -13,6 +13,7 @@ from golem.exceptions import MissingConfiguration
 if TYPE_CHECKING:
     from golem.node import GolemNode
     from golem.resources import Resource
+    from golem.utils.low.recording import ApiRecorder
 
 
 TRequestorApi = TypeVar("TRequestorApi")
@@ -85,43 +86,58 @@ class ApiFactory(object):
     def __init__(
         self,
         api_config: ApiConfig,
+        api_recorder: Optional["ApiRecorder"] = None,
     ):
         self.__api_config: ApiConfig = api_config
+        self.__api_recorder = api_recorder
+
+    def __maybe_record(self, api_client: TRequestorApi) -> TRequestorApi:
+        if self.__api_recorder is None:
+            return api_client
+        return self.__api_recorder.wrap(api_client)
 
     def create_market_api_client(self) -> ya_market.ApiClient:
         """Return a REST client for the Market API."""
         cfg = ya_market.Configuration(host=self.__api_config.market_url)
-        return ya_market.ApiClient(
-            configuration=cfg,
-            header_name="authorization",
-            header_value=f"Bearer {self.__api_config.app_key}",
+        return self.__maybe_record(
+            ya_market.ApiClient(
+                configuration=cfg,
+                header_name="authorization",
+                header_value=f"Bearer {self.__api_config.app_key}",
+            )
         )
 
     def create_payment_api_client(self) -> ya_payment.ApiClient:
         """Return a REST client for the Payment API."""
         cfg = ya_payment.Configuration(host=self.__api_config.payment_url)
-        return ya_payment.ApiClient(
-            configuration=cfg,
-            header_name="authorization",
-            header_value=f"Bearer {self.__api_config.app_key}",
+        return self.__maybe_record(
+            ya_payment.ApiClient(
+                configuration=cfg,
+                header_name="authorization",
+                header_value=f"Bearer {self.__api_config.app_key}",
+            )
         )
 
     def create_activity_api_client(self) -> ya_activity.ApiClient:
         """Return a REST client for the Activity API."""
         cfg = ya_activity.Configuration(host=self.__api_config.activity_url)
-        return ya_activity.ApiClient(
-            configuration=cfg,
-            header_name="authorization",
-            header_value=f"Bearer {self.__api_config.app_key}",
+        return self.__maybe_record(
+            ya_activity.ApiClient(
+                configuration=cfg,
+                header_name="authorization",
+                header_value=f"Bearer {self.__api_config.app_key}",
+            )
         )
 
     def create_net_api_client(self) -> ya_net.ApiClient:
         """Return a REST client for the Net API."""
         cfg = ya_net.Configuration(host=self.__api_config.net_url)
-        return ya_net.ApiClient(
-            configuration=cfg,
-            header_name="authorization",
-            header_value=f"Bearer {self.__api_config.app_key}",
+        return self.__maybe_record(
+            ya_net.ApiClient(
+                configuration=cfg,
+                header_name="authorization",
+                header_value=f"Bearer {self.__api_config.app_key}",
+            )
         )
 
 
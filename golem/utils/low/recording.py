@@ -0,0 +1,251 @@
+import gzip
+import json
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, Optional, Union
+from urllib.parse import urlencode, urlsplit
+
+from ya_activity import ApiException as ActivityApiException
+from ya_market import ApiException as MarketApiException
+from ya_net import ApiException as NetApiException
+from ya_payment import ApiException as PaymentApiException
+
+logger = logging.getLogger(__name__)
+
+RECORDING_FORMAT_VERSION = 1
+
+_API_EXCEPTIONS = (
+    PaymentApiException,
+    MarketApiException,
+    ActivityApiException,
+    NetApiException,
+)
+
+
+@dataclass
+class RecordedExchange:
+    """Single request/response pair captured from `yagna` REST APIs.
+
+    Attributes:
+        started_at: Seconds since recording start when request was sent.
+        duration: Seconds it took `yagna` to respond.
+        method: HTTP method.
+        path: Url path, e.g. `/market-api/v1/demands`.
+        query: Url query string, without leading `?`.
+        request_body: Request body as sent to `yagna`.
+        status: Response HTTP status.
+        content_type: Response `Content-Type` header.
+        response_body: Response body decoded as text.
+    """
+
+    started_at: float
+    duration: float
+    method: str
+    path: str
+    query: str
+    request_body: Optional[str]
+    status: int
+    content_type: Optional[str]
+    response_body: str
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "t": round(self.started_at, 6),
+            "d": round(self.duration, 6),
+            "m": self.method,
+            "p": self.path,
+            "q": self.query,
+            "b": self.request_body,
+            "s": self.status,
+            "c": self.content_type,
+            "r": self.response_body,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "RecordedExchange":
+        return cls(
+            started_at=data["t"],
+            duration=data["d"],
+            method=data["m"],
+            path=data["p"],
+            query=data["q"],
+            request_body=data["b"],
+            status=data["s"],
+            content_type=data["c"],
+            response_body=data["r"],
+        )
+
+
+class ApiRecorder:
+    """Records `yagna` REST API traffic of :any:`GolemNode` to a gzipped JSON lines file.
+
+    Authorization headers are never recorded.
+
+    Usage::
+
+        with ApiRecorder("session.jsonl.gz") as recorder:
+            async with GolemNode(api_recorder=recorder) as golem:
+                ...
+
+    Lines are compressed and written to the file by a background thread, so recording doesn't
+    block the event loop. Recorded session can be served back with :any:`ApiReplayServer` from
+    `golem.utils.low.replay`.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self._path = Path(path)
+
+        self._file: Optional[IO[str]] = None
+        #   Lines to write, `None` stops the writer thread
+        self._lines: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._start_time: Optional[float] = None
+        self._exchanges_count = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def exchanges_count(self) -> int:
+        return self._exchanges_count
+
+    def __enter__(self) -> "ApiRecorder":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def open(self) -> None:
+        if self._file is not None:
+            return
+
+        self._file = gzip.open(self._path, "wt", encoding="utf-8")
+        self._start_time = time.monotonic()
+        self._writer_thread = threading.Thread(
+            target=self._write_lines, args=(self._file,), name="api-recorder-writer", daemon=True
+        )
+        self._writer_thread.start()
+        self._write_line({"version": RECORDING_FORMAT_VERSION})
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+
+        assert self._writer_thread is not None
+
+        self._lines.put(None)
+        self._writer_thread.join()
+        self._writer_thread = None
+        self._file = None
+
+        logger.info(f"Recorded {self._exchanges_count} api exchanges to `{self._path}`")
+
+    def wrap(self, api_client: Any) -> Any:
+        """Make given `ya_*.ApiClient` record all its requests, return the same client."""
+        rest_client = api_client.rest_client
+        request = rest_client.request
+
+        async def _recording_request(method: str, url: str, *args, **kwargs) -> Any:
+            body = kwargs.get("body")
+            started_at = time.monotonic()
+
+            try:
+                response = await request(method, url, *args, **kwargs)
+            except _API_EXCEPTIONS as e:
+                #   Other exceptions, e.g. connection errors, have no response to record
+                if e.status:
+                    self._record(method, url, kwargs, body, started_at, e.status, e.headers, e.body)
+                raise
+
+            self._record(
+                method,
+                url,
+                kwargs,
+                body,
+                started_at,
+                response.status,
+                response.getheaders(),
+                response.data,
+            )
+            return response
+
+        rest_client.request = _recording_request
+        return api_client
+
+    def _record(
+        self,
+        method: str,
+        url: str,
+        request_kwargs: Dict[str, Any],
+        request_body: Any,
+        started_at: float,
+        status: int,
+        headers: Optional[Any],
+        response_body: Union[bytes, str, None],
+    ) -> None:
+        if self._file is None:
+            self.open()
+
+        assert self._start_time is not None
+
+        duration = time.monotonic() - started_at
+        split_url = urlsplit(url)
+        query = split_url.query
+        query_params = request_kwargs.get("query_params")
+        if query_params:
+            query = urlencode(query_params)
+
+        if isinstance(response_body, bytes):
+            response_body = response_body.decode("utf-8", errors="replace")
+
+        exchange = RecordedExchange(
+            started_at=started_at - self._start_time,
+            duration=duration,
+            method=method.upper(),
+            path=split_url.path,
+            query=query,
+            request_body=None if request_body is None else json.dumps(request_body, default=str),
+            status=status,
+            content_type=headers.get("Content-Type") if headers else None,
+            response_body=response_body or "",
+        )
+
+        self._write_line(exchange.to_json())
+        self._exchanges_count += 1
+
+    def _write_line(self, data: Dict[str, Any]) -> None:
+        assert self._file is not None
+
+        self._lines.put(json.dumps(data, separators=(",", ":")) + "\n")
+
+    def _write_lines(self, file: IO[str]) -> None:
+        try:
+            while True:
+                line = self._lines.get()
+
+                if line is None:
+                    return
+
+                file.write(line)
+        finally:
+            file.close()
+
+
+def load_recording(path: Union[str, Path]) -> Iterator[RecordedExchange]:
+    """Yield exchanges stored by :any:`ApiRecorder` in recording order."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("version") != RECORDING_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported recording format version `{header.get('version')}` in `{path}`!"
+            )
+
+        for line in f:
+            if line.strip():
+                yield RecordedExchange.from_json(json.loads(line))
@@ -0,0 +1,197 @@
+import asyncio
+import bisect
+import logging
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, DefaultDict, Deque, List, Optional, Tuple, Union
+
+from aiohttp import web
+
+from golem.utils.logging import trace_span
+from golem.utils.low.recording import RecordedExchange, load_recording
+
+if TYPE_CHECKING:
+    from golem.node import GolemNode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXHAUSTED_POLL_TIMEOUT = 5.0
+
+
+@dataclass
+class ApiReplayStats:
+    replayed: int = 0
+    exhausted: int = 0
+    missing: int = 0
+    out_of_sync: int = 0
+
+
+class ApiReplayServer:
+    """Local HTTP server that serves `yagna` API responses recorded by :any:`ApiRecorder`.
+
+    Requests are matched by method and url path, responses for the same method and path are
+    served in recording order. Each response is delayed by its recorded duration multiplied by
+    `time_scale`, so `time_scale=0` replays the session as fast as possible.
+
+    To preserve causality regardless of `time_scale`, response is served only after all the
+    requests that were sent before it was received in the recorded session arrive. If they don't
+    arrive within `sync_timeout` (e.g. replayed application diverged from the recorded one),
+    response is served anyway.
+
+    When there are no more recorded responses for long polling request, it is held for its
+    `timeout` and answered with empty list, just like `yagna` would do when no events are
+    available.
+
+    Usage::
+
+        async with ApiReplayServer("session.jsonl.gz", time_scale=0.5) as server:
+            async with server.create_node() as golem:
+                ...
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        time_scale: float = 1.0,
+        sync_timeout: timedelta = timedelta(seconds=5),
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        if time_scale < 0:
+            raise ValueError("Argument `time_scale` can't be negative!")
+
+        self._path = Path(path)
+        self._time_scale = time_scale
+        self._sync_timeout = sync_timeout
+        self._host = host
+        self._port = port
+
+        self._exchanges: DefaultDict[Tuple[str, str], Deque[int]] = defaultdict(deque)
+        self._recorded: List[RecordedExchange] = []
+        self._recorded_starts: List[float] = []
+        self._received: List[bool] = []
+        self._received_prefix = 0
+        self._received_changed = asyncio.Event()
+        self._runner: Optional[web.AppRunner] = None
+        self._stats = ApiReplayStats()
+
+    @property
+    def api_url(self) -> str:
+        return f"http://{self._host}:{self._port}"
+
+    @property
+    def stats(self) -> ApiReplayStats:
+        return self._stats
+
+    def create_node(self, **kwargs: Any) -> "GolemNode":
+        """Return a :any:`GolemNode` connected to this server."""
+        #   Imported here to avoid circular import
+        from golem.node import GolemNode
+
+        return GolemNode(app_key="replay", api_url=self.api_url, **kwargs)
+
+    async def __aenter__(self) -> "ApiReplayServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    @trace_span()
+    async def start(self) -> None:
+        self._recorded = sorted(load_recording(self._path), key=lambda e: e.started_at)
+        self._recorded_starts = [exchange.started_at for exchange in self._recorded]
+        self._received = [False] * len(self._recorded)
+        self._received_prefix = 0
+        self._received_changed = asyncio.Event()
+        self._stats = ApiReplayStats()
+
+        self._exchanges.clear()
+        for index, exchange in enumerate(self._recorded):
+            self._exchanges[(exchange.method, exchange.path)].append(index)
+
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle_request)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        self._port = self._runner.addresses[0][1]
+
+    @trace_span()
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_request(self, request: web.Request) -> web.StreamResponse:
+        indexes = self._exchanges.get((request.method, request.path))
+
+        if indexes:
+            index = indexes.popleft()
+            exchange = self._recorded[index]
+            self._mark_received(index)
+            self._stats.replayed += 1
+
+            if self._time_scale:
+                await asyncio.sleep(exchange.duration * self._time_scale)
+
+            await self._wait_for_preceding_requests(exchange)
+
+            return self._build_response(exchange)
+
+        if "timeout" in request.query or request.path.lower().endswith("events"):
+            self._stats.exhausted += 1
+            await asyncio.sleep(self._get_poll_timeout(request))
+            return web.json_response([])
+
+        self._stats.missing += 1
+        logger.warning(f"No recorded response for `{request.method} {request.path_qs}`")
+        return web.json_response(
+            {"message": f"No recorded response for `{request.method} {request.path}`"},
+            status=404,
+        )
+
+    def _mark_received(self, index: int) -> None:
+        self._received[index] = True
+
+        while self._received_prefix < len(self._received) and self._received[self._received_prefix]:
+            self._received_prefix += 1
+
+        self._received_changed.set()
+        self._received_changed = asyncio.Event()
+
+    async def _wait_for_preceding_requests(self, exchange: RecordedExchange) -> None:
+        #   All requests sent before the response was received in recorded session
+        preceding_count = bisect.bisect_left(
+            self._recorded_starts, exchange.started_at + exchange.duration
+        )
+
+        try:
+            await asyncio.wait_for(
+                self._wait_for_received_prefix(preceding_count),
+                self._sync_timeout.total_seconds(),
+            )
+        except asyncio.TimeoutError:
+            self._stats.out_of_sync += 1
+            logger.debug(
+                f"Replay is out of sync, serving `{exchange.method} {exchange.path}` anyway"
+            )
+
+    async def _wait_for_received_prefix(self, count: int) -> None:
+        while self._received_prefix < count:
+            await self._received_changed.wait()
+
+    @staticmethod
+    def _build_response(exchange: RecordedExchange) -> web.Response:
+        headers = {"Content-Type": exchange.content_type} if exchange.content_type else None
+        return web.Response(
+            status=exchange.status, body=exchange.response_body.encode("utf-8"), headers=headers
+        )
+
+    @staticmethod
+    def _get_poll_timeout(request: web.Request) -> float:
+        return float(request.query.get("timeout", DEFAULT_EXHAUSTED_POLL_TIMEOUT))
@@ -0,0 +1,11 @@
+from tests.simulator.config import SimulatedProvider, SimulatorConfig, generate_providers
+from tests.simulator.server import YagnaSimulator
+from tests.simulator.state import SimulatorStats
+
+__all__ = (
+    "SimulatedProvider",
+    "SimulatorConfig",
+    "SimulatorStats",
+    "YagnaSimulator",
+    "generate_providers",
+)
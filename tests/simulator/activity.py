@@ -0,0 +1,199 @@
+import asyncio
+import json
+import shlex
+from typing import TYPE_CHECKING, Coroutine, Dict, List, Optional
+
+from aiohttp import web
+
+from tests.simulator.state import (
+    DEFAULT_POLL_TIMEOUT,
+    ActivityRecord,
+    AgreementRecord,
+    BatchRecord,
+    SimulatorState,
+    json_error,
+    new_id,
+    to_iso,
+    utc_now,
+)
+
+if TYPE_CHECKING:
+    from tests.simulator.payment import PaymentApi
+
+
+class ActivityApi:
+    """Simulated `/activity-api/v1` endpoints.
+
+    Commands are not executed, each one just takes the time configured for its provider.
+    `echo` run in a shell is the only command producing an output.
+    """
+
+    def __init__(self, state: SimulatorState, payment_api: "PaymentApi") -> None:
+        self._state = state
+        self._payment_api = payment_api
+
+    def add_routes(self, app: web.Application, prefix: str = "/activity-api/v1") -> None:
+        app.router.add_post(f"{prefix}/activity", self.create_activity)
+        app.router.add_delete(f"{prefix}/activity/{{activity_id}}", self.destroy_activity)
+        app.router.add_get(f"{prefix}/activity/{{activity_id}}/state", self.get_activity_state)
+        app.router.add_post(f"{prefix}/activity/{{activity_id}}/exec", self.call_exec)
+        app.router.add_get(
+            f"{prefix}/activity/{{activity_id}}/exec/{{batch_id}}", self.get_exec_batch_results
+        )
+
+    async def create_activity(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        agreement_id = body if isinstance(body, str) else body["agreementId"]
+        agreement = self._state.agreements.get(agreement_id)
+        if agreement is None:
+            raise json_error(web.HTTPNotFound, f"Agreement {agreement_id} not found")
+        if agreement.state != "Approved":
+            raise json_error(
+                web.HTTPInternalServerError,
+                f"Agreement {agreement_id} is in {agreement.state} state",
+            )
+        if not agreement.provider.multi_activity and agreement.activity_ids:
+            raise json_error(
+                web.HTTPInternalServerError,
+                f"Provider doesn't support multiple activities for agreement {agreement_id}",
+            )
+        if self._state.chance(self._state.config.activity_failure_rate):
+            self._state.stats.failed_activities += 1
+            raise json_error(web.HTTPInternalServerError, "Simulated activity creation failure")
+
+        activity = ActivityRecord(activity_id=new_id(), agreement=agreement)
+        self._state.activities[activity.activity_id] = activity
+        agreement.activity_ids.append(activity.activity_id)
+        self._state.stats.activities += 1
+
+        if self._state.config.debit_note_interval is not None:
+            self._add_activity_task(activity, self._send_debit_notes(activity))
+
+        return web.json_response(activity.activity_id, status=201)
+
+    async def destroy_activity(self, request: web.Request) -> web.Response:
+        activity = self._get_activity(request)
+        self._destroy(activity)
+        return web.Response(status=200)
+
+    async def get_activity_state(self, request: web.Request) -> web.Response:
+        activity = self._get_activity(request)
+        state = "Terminated" if activity.destroyed else "Ready"
+        return web.json_response({"state": [state, None], "reason": None, "errorMessage": None})
+
+    async def call_exec(self, request: web.Request) -> web.Response:
+        activity = self._get_activity(request)
+        if activity.destroyed:
+            raise json_error(web.HTTPGone, f"Activity {activity.activity_id} is terminated")
+
+        body = await request.json()
+        commands = json.loads(body["text"])
+        batch = BatchRecord(
+            batch_id=new_id(),
+            activity_id=activity.activity_id,
+            notifier=self._state.create_notifier(),
+        )
+        self._state.batches[batch.batch_id] = batch
+        self._state.stats.batches += 1
+        self._add_activity_task(activity, self._run_batch(activity, batch, commands))
+        return web.json_response(batch.batch_id)
+
+    async def get_exec_batch_results(self, request: web.Request) -> web.Response:
+        activity = self._get_activity(request)
+        batch = self._state.batches.get(request.match_info["batch_id"])
+        if batch is None or batch.activity_id != activity.activity_id:
+            raise json_error(web.HTTPNotFound, f"Batch {request.match_info['batch_id']} not found")
+
+        timeout = float(request.query.get("timeout", DEFAULT_POLL_TIMEOUT))
+        results = await batch.notifier.wait_for(batch.undelivered_results, timeout)
+        if not results and activity.destroyed and not batch.finished:
+            raise json_error(web.HTTPGone, f"Activity {activity.activity_id} is terminated")
+        return web.json_response(results)
+
+    def destroy_agreement_activities(self, agreement: AgreementRecord) -> None:
+        for activity_id in agreement.activity_ids:
+            self._destroy(self._state.activities[activity_id])
+
+    def _destroy(self, activity: ActivityRecord) -> None:
+        if activity.destroyed:
+            return
+
+        activity.destroyed_at = utc_now()
+        for task in activity.tasks:
+            task.cancel()
+        for batch in self._state.batches.values():
+            if batch.activity_id == activity.activity_id:
+                batch.notifier.notify()
+
+    async def _run_batch(
+        self, activity: ActivityRecord, batch: BatchRecord, commands: List[Dict]
+    ) -> None:
+        provider = activity.agreement.provider
+
+        for index, command in enumerate(commands):
+            command_name, args = next(iter(command.items()))
+            if command_name == "deploy":
+                duration = provider.deploy_time.total_seconds()
+            elif command_name == "run":
+                duration = provider.command_time.total_seconds()
+            else:
+                duration = 0.0
+
+            await asyncio.sleep(duration)
+            activity.busy_seconds += duration
+            self._state.stats.commands += 1
+
+            failed = command_name == "run" and self._state.chance(
+                self._state.config.command_failure_rate
+            )
+            if failed:
+                self._state.stats.failed_commands += 1
+
+            batch.add_result(
+                {
+                    "index": index,
+                    "eventDate": to_iso(utc_now()),
+                    "result": "Error" if failed else "Ok",
+                    "stdout": None if failed else self._simulated_stdout(command_name, args),
+                    "stderr": None,
+                    "message": "Simulated command failure" if failed else None,
+                    "isBatchFinished": failed or index == len(commands) - 1,
+                }
+            )
+
+            if failed:
+                return
+
+    @staticmethod
+    def _simulated_stdout(command_name: str, args: Dict) -> Optional[str]:
+        if command_name != "run":
+            return None
+
+        run_args = args.get("args") or []
+        argv = shlex.split(run_args[1]) if run_args[:1] == ["-c"] and len(run_args) > 1 else []
+        if not argv or argv[0] != "echo":
+            return ""
+
+        if argv[1:2] == ["-n"]:
+            return " ".join(argv[2:])
+        return " ".join(argv[1:]) + "\n"
+
+    async def _send_debit_notes(self, activity: ActivityRecord) -> None:
+        assert self._state.config.debit_note_interval is not None
+        interval = self._state.config.debit_note_interval.total_seconds()
+
+        while not activity.destroyed:
+            await asyncio.sleep(interval)
+            self._payment_api.issue_debit_note(activity)
+
+    def _add_activity_task(self, activity: ActivityRecord, coro: Coroutine) -> None:
+        task = self._state.spawn(coro)
+        activity.tasks.add(task)
+        task.add_done_callback(activity.tasks.discard)
+
+    def _get_activity(self, request: web.Request) -> ActivityRecord:
+        activity_id = request.match_info["activity_id"]
+        try:
+            return self._state.activities[activity_id]
+        except KeyError:
+            raise json_error(web.HTTPNotFound, f"Activity {activity_id} not found")
@@ -0,0 +1,149 @@
+import random
+from dataclasses import dataclass, field
+from datetime import timedelta
+from decimal import ROUND_FLOOR, Decimal
+from typing import Any, Dict, List, Optional, Sequence
+
+from golem.payload import defaults
+from golem.utils.clock import utc_now
+
+NEGOTIABLE_PROPS = (
+    defaults.PROP_DEBIT_NOTES_INTERVAL,
+    defaults.PROP_PAYMENT_TIMEOUT,
+)
+
+USAGE_VECTOR = ["golem.usage.duration_sec", "golem.usage.cpu_sec"]
+
+ETH_EXPONENT = Decimal(10) ** -18
+
+
+@dataclass
+class SimulatedProvider:
+    """Description of a single provider node served by the simulator."""
+
+    provider_id: str
+    name: str
+    cpu_threads: int = 4
+    memory_gib: float = 8.0
+    storage_gib: float = 40.0
+    price_duration_sec: float = 0.00005
+    price_cpu_sec: float = 0.0001
+    price_initial: float = 0.0
+    debit_note_interval_sec: int = 120
+    payment_timeout_sec: int = 120
+    deploy_time: timedelta = timedelta()
+    command_time: timedelta = timedelta()
+    multi_activity: bool = True
+
+    def offer_properties(self, payment_platform: str) -> Dict[str, Any]:
+        return {
+            "golem.activity.caps.transfer.protocol": ["http", "https", "gftp"],
+            defaults.PROP_DEBIT_NOTES_ACCEPT_TIMEOUT: 240,
+            f"golem.com.payment.platform.{payment_platform}.address": self.provider_id,
+            "golem.com.payment.protocol.version": 2,
+            defaults.PROP_PRICING_MODEL: "linear",
+            defaults.PROP_PRICING_LINEAR_COEFFS: [
+                self.price_duration_sec,
+                self.price_cpu_sec,
+                self.price_initial,
+            ],
+            "golem.com.scheme": "payu",
+            defaults.PROP_DEBIT_NOTES_INTERVAL: self.debit_note_interval_sec,
+            defaults.PROP_PAYMENT_TIMEOUT: self.payment_timeout_sec,
+            defaults.PROP_USAGE_VECTOR: USAGE_VECTOR,
+            "golem.inf.cpu.architecture": "x86_64",
+            "golem.inf.cpu.cores": max(1, self.cpu_threads // 2),
+            defaults.PROP_INF_CPU_THREADS: self.cpu_threads,
+            defaults.PROP_INF_MEM: self.memory_gib,
+            defaults.PROP_INF_STORAGE: self.storage_gib,
+            "golem.node.debug.subnet": defaults.DEFAULT_SUBNET,
+            "golem.node.id.name": self.name,
+            defaults.PROP_RUNTIME_NAME: "vm",
+            "golem.runtime.version": "0.3.0",
+            "golem.srv.caps.multi-activity": self.multi_activity,
+        }
+
+    def offer_constraints(self) -> str:
+        expiration = utc_now() + timedelta(hours=1)
+        return (
+            "(&\n"
+            f"  (golem.srv.comp.expiration>{int(expiration.timestamp() * 1000)})\n"
+            f"  (golem.node.debug.subnet={defaults.DEFAULT_SUBNET})\n"
+            ")"
+        )
+
+    def negotiate(self, demand_properties: Dict[str, Any]) -> Dict[str, Any]:
+        """Return offer properties updated to the values requested by the demand.
+
+        Provider accepts any mid-agreement payment terms proposed by the requestor.
+        """
+        return {key: demand_properties[key] for key in NEGOTIABLE_PROPS if key in demand_properties}
+
+    def cost(self, duration_sec: float, cpu_sec: float, include_initial: bool = True) -> Decimal:
+        cost = Decimal(self.price_duration_sec) * Decimal(duration_sec) + Decimal(
+            self.price_cpu_sec
+        ) * Decimal(cpu_sec)
+        if include_initial:
+            cost += Decimal(self.price_initial)
+        return cost.quantize(ETH_EXPONENT, ROUND_FLOOR)
+
+
+def generate_providers(
+    count: int,
+    seed: Optional[int] = None,
+    deploy_time: timedelta = timedelta(),
+    command_time: timedelta = timedelta(),
+) -> List[SimulatedProvider]:
+    """Generate `count` providers with randomized hardware and pricing."""
+    rng = random.Random(seed)
+    providers = []
+
+    for i in range(count):
+        cpu_threads = rng.choice([1, 2, 4, 8, 16])
+        providers.append(
+            SimulatedProvider(
+                provider_id="0x" + rng.getrandbits(160).to_bytes(20, "big").hex(),
+                name=f"simulated-provider-{i}",
+                cpu_threads=cpu_threads,
+                memory_gib=float(rng.choice([1, 2, 4, 8, 16, 32])),
+                storage_gib=float(rng.choice([10, 20, 40, 80])),
+                price_duration_sec=round(rng.uniform(0.00001, 0.0001), 8),
+                price_cpu_sec=round(rng.uniform(0.00002, 0.0002), 8),
+                deploy_time=deploy_time,
+                command_time=command_time,
+            )
+        )
+
+    return providers
+
+
+@dataclass
+class SimulatorConfig:
+    """Behaviour of the simulated `yagna` and its providers.
+
+    All `*_rate` fields are probabilities in the `[0, 1]` range.
+    """
+
+    providers: Sequence[SimulatedProvider] = field(default_factory=lambda: generate_providers(10))
+    offers_per_provider: int = 1
+    """How many initial proposals each provider sends to every subscribed demand."""
+    offer_interval: timedelta = timedelta()
+    """Delay between two consecutive initial proposals sent to a demand."""
+    negotiation_delay: timedelta = timedelta()
+    """Time provider takes to answer a counter proposal."""
+    agreement_approval_delay: timedelta = timedelta()
+    latency: timedelta = timedelta()
+    """Delay added to every API call."""
+    latency_jitter: timedelta = timedelta()
+    """Upper bound of random delay added on top of `latency`."""
+    api_error_rate: float = 0.0
+    api_error_status: int = 504
+    proposal_rejection_rate: float = 0.0
+    agreement_rejection_rate: float = 0.0
+    activity_failure_rate: float = 0.0
+    command_failure_rate: float = 0.0
+    debit_note_interval: Optional[timedelta] = None
+    """How often running activities send debit notes, `None` disables debit notes."""
+    invoice_delay: timedelta = timedelta()
+    """Delay between agreement termination and invoice arrival."""
+    seed: Optional[int] = None
@@ -0,0 +1,318 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+
+from tests.simulator.config import SimulatedProvider
+from tests.simulator.state import (
+    DEFAULT_POLL_TIMEOUT,
+    AgreementRecord,
+    DemandRecord,
+    ProposalRecord,
+    SimulatorState,
+    json_error,
+    new_id,
+    to_iso,
+    utc_now,
+)
+
+if TYPE_CHECKING:
+    from tests.simulator.activity import ActivityApi
+    from tests.simulator.payment import PaymentApi
+
+
+class MarketApi:
+    """Simulated `/market-api/v1` endpoints.
+
+    Every subscribed demand receives initial proposals from all configured providers. Offers are
+    not matched against demand constraints.
+    """
+
+    def __init__(
+        self, state: SimulatorState, activity_api: "ActivityApi", payment_api: "PaymentApi"
+    ) -> None:
+        self._state = state
+        self._activity_api = activity_api
+        self._payment_api = payment_api
+
+    def add_routes(self, app: web.Application, prefix: str = "/market-api/v1") -> None:
+        app.router.add_post(f"{prefix}/demands", self.subscribe_demand)
+        app.router.add_get(f"{prefix}/demands", self.get_demands)
+        app.router.add_delete(f"{prefix}/demands/{{demand_id}}", self.unsubscribe_demand)
+        app.router.add_get(f"{prefix}/demands/{{demand_id}}/events", self.collect_offers)
+        app.router.add_get(
+            f"{prefix}/demands/{{demand_id}}/proposals/{{proposal_id}}", self.get_proposal_offer
+        )
+        app.router.add_post(
+            f"{prefix}/demands/{{demand_id}}/proposals/{{proposal_id}}",
+            self.counter_proposal_demand,
+        )
+        app.router.add_post(
+            f"{prefix}/demands/{{demand_id}}/proposals/{{proposal_id}}/reject",
+            self.reject_proposal_offer,
+        )
+        app.router.add_post(f"{prefix}/agreements", self.create_agreement)
+        app.router.add_get(f"{prefix}/agreements/{{agreement_id}}", self.get_agreement)
+        app.router.add_post(f"{prefix}/agreements/{{agreement_id}}/confirm", self.confirm_agreement)
+        app.router.add_post(f"{prefix}/agreements/{{agreement_id}}/wait", self.wait_for_approval)
+        app.router.add_post(
+            f"{prefix}/agreements/{{agreement_id}}/terminate", self.terminate_agreement
+        )
+
+    ###########
+    #   Demands
+    async def subscribe_demand(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        demand = DemandRecord(
+            demand_id=new_id(),
+            properties=body["properties"],
+            constraints=body["constraints"],
+            timestamp=utc_now(),
+            notifier=self._state.create_notifier(),
+        )
+        self._state.demands[demand.demand_id] = demand
+        self._state.stats.demands += 1
+        self._state.spawn(self._publish_offers(demand))
+        return web.json_response(demand.demand_id, status=201)
+
+    async def get_demands(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            [demand.to_json(self._state.requestor_id) for demand in self._state.demands.values()]
+        )
+
+    async def unsubscribe_demand(self, request: web.Request) -> web.Response:
+        demand = self._get_demand(request)
+        del self._state.demands[demand.demand_id]
+        demand.notifier.notify()
+        return web.Response(status=204)
+
+    async def collect_offers(self, request: web.Request) -> web.Response:
+        demand = self._get_demand(request)
+        timeout = float(request.query.get("timeout", DEFAULT_POLL_TIMEOUT))
+        max_events = int(request.query.get("maxEvents", 10))
+
+        events = await demand.notifier.wait_for(lambda: demand.pop_events(max_events), timeout)
+        return web.json_response(events)
+
+    async def _publish_offers(self, demand: DemandRecord) -> None:
+        interval = self._state.config.offer_interval.total_seconds()
+
+        for _ in range(self._state.config.offers_per_provider):
+            for provider in self._state.config.providers:
+                if demand.demand_id not in self._state.demands:
+                    return
+
+                self._publish_offer(demand, provider)
+                await asyncio.sleep(interval)
+
+    def _publish_offer(self, demand: DemandRecord, provider: SimulatedProvider) -> None:
+        proposal = ProposalRecord(
+            proposal_id=new_id(),
+            demand_id=demand.demand_id,
+            issuer_id=provider.provider_id,
+            provider=provider,
+            properties=provider.offer_properties(self._state.payment_platform),
+            constraints=provider.offer_constraints(),
+            state="Initial",
+        )
+        self._state.proposals[proposal.proposal_id] = proposal
+        self._state.stats.offers += 1
+        demand.push_event(self._proposal_event(proposal))
+
+    #############
+    #   Proposals
+    async def get_proposal_offer(self, request: web.Request) -> web.Response:
+        demand = self._get_demand(request)
+        proposal = self._get_proposal(request, demand)
+        return web.json_response(proposal.to_json())
+
+    async def counter_proposal_demand(self, request: web.Request) -> web.Response:
+        demand = self._get_demand(request)
+        offer = self._get_proposal(request, demand)
+        if offer.issuer_id == self._state.requestor_id:
+            raise json_error(web.HTTPBadRequest, "Can't counter own proposal")
+        if offer.state == "Rejected":
+            raise json_error(web.HTTPGone, f"Proposal {offer.proposal_id} was rejected")
+
+        body = await request.json()
+        counter = ProposalRecord(
+            proposal_id=new_id(),
+            demand_id=demand.demand_id,
+            issuer_id=self._state.requestor_id,
+            provider=offer.provider,
+            properties=body["properties"],
+            constraints=body["constraints"],
+            state="Draft",
+            prev_proposal_id=offer.proposal_id,
+        )
+        self._state.proposals[counter.proposal_id] = counter
+        self._state.stats.counter_proposals += 1
+        self._state.spawn(self._respond_to_counter_proposal(demand, counter))
+        return web.json_response(counter.proposal_id)
+
+    async def reject_proposal_offer(self, request: web.Request) -> web.Response:
+        demand = self._get_demand(request)
+        proposal = self._get_proposal(request, demand)
+        proposal.state = "Rejected"
+        return web.Response(status=204)
+
+    async def _respond_to_counter_proposal(
+        self, demand: DemandRecord, counter: ProposalRecord
+    ) -> None:
+        await asyncio.sleep(self._state.config.negotiation_delay.total_seconds())
+        if demand.demand_id not in self._state.demands:
+            return
+
+        if self._state.chance(self._state.config.proposal_rejection_rate):
+            counter.state = "Rejected"
+            self._state.stats.rejected_proposals += 1
+            demand.push_event(
+                {
+                    "eventType": "ProposalRejectedEvent",
+                    "eventDate": to_iso(utc_now()),
+                    "proposalId": counter.proposal_id,
+                    "reason": {"message": "Simulated proposal rejection"},
+                }
+            )
+            return
+
+        provider = counter.provider
+        properties = provider.offer_properties(self._state.payment_platform)
+        properties.update(provider.negotiate(counter.properties))
+        draft = ProposalRecord(
+            proposal_id=new_id(),
+            demand_id=demand.demand_id,
+            issuer_id=provider.provider_id,
+            provider=provider,
+            properties=properties,
+            constraints=provider.offer_constraints(),
+            state="Draft",
+            prev_proposal_id=counter.proposal_id,
+        )
+        self._state.proposals[draft.proposal_id] = draft
+        demand.push_event(self._proposal_event(draft))
+
+    ##############
+    #   Agreements
+    async def create_agreement(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        offer = self._state.proposals.get(body["proposalId"])
+        if offer is None:
+            raise json_error(web.HTTPNotFound, f"Proposal {body['proposalId']} not found")
+        if offer.issuer_id == self._state.requestor_id or offer.state != "Draft":
+            raise json_error(
+                web.HTTPBadRequest, f"Proposal {offer.proposal_id} is not a provider draft"
+            )
+
+        demand = self._state.demands.get(offer.demand_id)
+        if demand is None:
+            raise json_error(web.HTTPNotFound, f"Subscription {offer.demand_id} not found")
+
+        assert offer.prev_proposal_id is not None
+        agreement = AgreementRecord(
+            agreement_id=new_id(),
+            demand=demand,
+            demand_proposal=self._state.proposals[offer.prev_proposal_id],
+            offer_proposal=offer,
+            valid_to=body.get("validTo"),
+            will_approve=not self._state.chance(self._state.config.agreement_rejection_rate),
+            notifier=self._state.create_notifier(),
+        )
+        offer.state = "Accepted"
+        self._state.agreements[agreement.agreement_id] = agreement
+        self._state.stats.agreements += 1
+        return web.json_response(agreement.agreement_id, status=201)
+
+    async def get_agreement(self, request: web.Request) -> web.Response:
+        agreement = self._get_agreement(request)
+        return web.json_response(agreement.to_json(self._state.requestor_id))
+
+    async def confirm_agreement(self, request: web.Request) -> web.Response:
+        agreement = self._get_agreement(request)
+        if agreement.state != "Proposal":
+            raise json_error(
+                web.HTTPGone,
+                f"Can't confirm agreement {agreement.agreement_id} from {agreement.state}",
+            )
+
+        agreement.state = "Pending"
+        agreement.app_session_id = request.query.get("appSessionId")
+        self._state.spawn(self._approve_agreement(agreement))
+        return web.Response(status=204)
+
+    async def wait_for_approval(self, request: web.Request) -> web.Response:
+        agreement = self._get_agreement(request)
+        timeout = float(request.query.get("timeout", DEFAULT_POLL_TIMEOUT))
+
+        await agreement.notifier.wait_for(
+            lambda: [agreement.state] if agreement.state != "Pending" else [], timeout
+        )
+
+        if agreement.state == "Approved":
+            return web.Response(status=204)
+        elif agreement.state == "Pending":
+            raise json_error(web.HTTPRequestTimeout, "Timeout while waiting for approval")
+        raise json_error(
+            web.HTTPGone, f"Agreement {agreement.agreement_id} is in {agreement.state} state"
+        )
+
+    async def terminate_agreement(self, request: web.Request) -> web.Response:
+        agreement = self._get_agreement(request)
+        if agreement.state in ("Terminated", "Rejected"):
+            raise json_error(
+                web.HTTPGone, f"Agreement {agreement.agreement_id} is already {agreement.state}"
+            )
+
+        was_approved = agreement.state == "Approved"
+        agreement.state = "Terminated"
+        agreement.notifier.notify()
+        self._state.stats.terminated_agreements += 1
+        self._activity_api.destroy_agreement_activities(agreement)
+        if was_approved:
+            self._state.spawn(self._payment_api.issue_invoice(agreement))
+        return web.Response(status=200)
+
+    async def _approve_agreement(self, agreement: AgreementRecord) -> None:
+        await asyncio.sleep(self._state.config.agreement_approval_delay.total_seconds())
+        if agreement.state != "Pending":
+            return
+
+        if agreement.will_approve:
+            agreement.state = "Approved"
+            agreement.approved_date = utc_now()
+            self._state.stats.approved_agreements += 1
+        else:
+            agreement.state = "Rejected"
+            self._state.stats.rejected_agreements += 1
+        agreement.notifier.notify()
+
+    ###########
+    #   Helpers
+    def _get_demand(self, request: web.Request) -> DemandRecord:
+        demand_id = request.match_info["demand_id"]
+        try:
+            return self._state.demands[demand_id]
+        except KeyError:
+            raise json_error(web.HTTPNotFound, f"Subscription {demand_id} not found")
+
+    def _get_proposal(self, request: web.Request, demand: DemandRecord) -> ProposalRecord:
+        proposal_id = request.match_info["proposal_id"]
+        proposal = self._state.proposals.get(proposal_id)
+        if proposal is None or proposal.demand_id != demand.demand_id:
+            raise json_error(web.HTTPNotFound, f"Proposal {proposal_id} not found")
+        return proposal
+
+    def _get_agreement(self, request: web.Request) -> AgreementRecord:
+        agreement_id = request.match_info["agreement_id"]
+        try:
+            return self._state.agreements[agreement_id]
+        except KeyError:
+            raise json_error(web.HTTPNotFound, f"Agreement {agreement_id} not found")
+
+    @staticmethod
+    def _proposal_event(proposal: ProposalRecord) -> dict:
+        return {
+            "eventType": "ProposalEvent",
+            "eventDate": to_iso(utc_now()),
+            "proposal": proposal.to_json(),
+        }
@@ -0,0 +1,245 @@
+import asyncio
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+from tests.simulator.state import (
+    DEFAULT_POLL_TIMEOUT,
+    ActivityRecord,
+    AgreementRecord,
+    PaymentDocumentRecord,
+    PaymentEventRecord,
+    SimulatorState,
+    from_iso,
+    json_error,
+    new_id,
+    to_iso,
+    utc_now,
+)
+
+
+class PaymentApi:
+    """Simulated `/payment-api/v1` endpoints.
+
+    Providers send debit notes for running activities (when enabled in the config) and an invoice
+    for every approved agreement once it is terminated.
+    """
+
+    def __init__(self, state: SimulatorState) -> None:
+        self._state = state
+
+    def add_routes(self, app: web.Application, prefix: str = "/payment-api/v1") -> None:
+        app.router.add_get(f"{prefix}/requestorAccounts", self.get_requestor_accounts)
+        app.router.add_post(f"{prefix}/allocations", self.create_allocation)
+        app.router.add_get(f"{prefix}/allocations/{{allocation_id}}", self.get_allocation)
+        app.router.add_delete(f"{prefix}/allocations/{{allocation_id}}", self.release_allocation)
+        app.router.add_get(f"{prefix}/demandDecorations", self.get_demand_decorations)
+        app.router.add_get(f"{prefix}/debitNoteEvents", self.get_debit_note_events)
+        app.router.add_get(f"{prefix}/debitNotes/{{document_id}}", self.get_debit_note)
+        app.router.add_post(f"{prefix}/debitNotes/{{document_id}}/accept", self.accept_debit_note)
+        app.router.add_get(f"{prefix}/invoiceEvents", self.get_invoice_events)
+        app.router.add_get(f"{prefix}/invoices/{{document_id}}", self.get_invoice)
+        app.router.add_post(f"{prefix}/invoices/{{document_id}}/accept", self.accept_invoice)
+
+    ###############
+    #   Allocations
+    async def get_requestor_accounts(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            [
+                {
+                    "platform": self._state.payment_platform,
+                    "address": self._state.requestor_id,
+                    "driver": self._state.payment_driver,
+                    "network": self._state.payment_network,
+                    "token": "tGLM",
+                    "send": True,
+                    "receive": False,
+                }
+            ]
+        )
+
+    async def create_allocation(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        allocation = {
+            **body,
+            "allocationId": new_id(),
+            "spentAmount": "0",
+            "remainingAmount": body["totalAmount"],
+            "timestamp": to_iso(utc_now()),
+        }
+        self._state.allocations[allocation["allocationId"]] = allocation
+        return web.json_response(allocation, status=201)
+
+    async def get_allocation(self, request: web.Request) -> web.Response:
+        return web.json_response(self._get_allocation(request.match_info["allocation_id"]))
+
+    async def release_allocation(self, request: web.Request) -> web.Response:
+        allocation = self._get_allocation(request.match_info["allocation_id"])
+        del self._state.allocations[allocation["allocationId"]]
+        return web.Response(status=200)
+
+    async def get_demand_decorations(self, request: web.Request) -> web.Response:
+        for allocation_id in request.query.get("allocationIds", "").split(","):
+            self._get_allocation(allocation_id)
+
+        platform_property = f"golem.com.payment.platform.{self._state.payment_platform}.address"
+        return web.json_response(
+            {
+                "properties": [
+                    {"key": platform_property, "value": self._state.requestor_id},
+                    {"key": "golem.com.payment.protocol.version", "value": "2"},
+                ],
+                "constraints": [f"({platform_property}=*)"],
+            }
+        )
+
+    ###############
+    #   Debit notes
+    def issue_debit_note(self, activity: ActivityRecord) -> None:
+        provider = activity.agreement.provider
+        usage = activity.usage()
+        duration_sec, cpu_sec = usage
+        debit_note = PaymentDocumentRecord(
+            document_id=new_id(),
+            agreement=activity.agreement,
+            amount=provider.cost(duration_sec, cpu_sec),
+            timestamp=utc_now(),
+            activity=activity,
+            usage=usage,
+            previous_id=activity.last_debit_note_id,
+        )
+        activity.last_debit_note_id = debit_note.document_id
+        self._state.debit_notes[debit_note.document_id] = debit_note
+        self._state.stats.debit_notes += 1
+        self._add_event(
+            self._state.debit_note_events,
+            activity.agreement,
+            {"eventType": "DebitNoteReceivedEvent", "debitNoteId": debit_note.document_id},
+        )
+        self._state.debit_note_events_notifier.notify()
+
+    async def get_debit_note_events(self, request: web.Request) -> web.Response:
+        events = await self._state.debit_note_events_notifier.wait_for(
+            lambda: self._collect_events(self._state.debit_note_events, request),
+            float(request.query.get("timeout", DEFAULT_POLL_TIMEOUT)),
+        )
+        return web.json_response(events)
+
+    async def get_debit_note(self, request: web.Request) -> web.Response:
+        debit_note = self._get_document(self._state.debit_notes, request)
+        return web.json_response(
+            debit_note.debit_note_json(self._state.requestor_id, self._state.payment_platform)
+        )
+
+    async def accept_debit_note(self, request: web.Request) -> web.Response:
+        debit_note = self._get_document(self._state.debit_notes, request)
+        #   Debit notes without due date are not paid, so allocation is not charged
+        await self._accept(debit_note, request, charge_allocation=False)
+        self._state.stats.accepted_debit_notes += 1
+        return web.Response(status=200)
+
+    ############
+    #   Invoices
+    async def issue_invoice(self, agreement: AgreementRecord) -> None:
+        await asyncio.sleep(self._state.config.invoice_delay.total_seconds())
+
+        provider = agreement.provider
+        amount = provider.cost(0, 0)
+        for activity_id in agreement.activity_ids:
+            duration_sec, cpu_sec = self._state.activities[activity_id].usage()
+            amount += provider.cost(duration_sec, cpu_sec, include_initial=False)
+
+        invoice = PaymentDocumentRecord(
+            document_id=new_id(),
+            agreement=agreement,
+            amount=amount,
+            timestamp=utc_now(),
+        )
+        self._state.invoices[invoice.document_id] = invoice
+        self._state.stats.invoices += 1
+        self._add_event(
+            self._state.invoice_events,
+            agreement,
+            {"eventType": "InvoiceReceivedEvent", "invoiceId": invoice.document_id},
+        )
+        self._state.invoice_events_notifier.notify()
+
+    async def get_invoice_events(self, request: web.Request) -> web.Response:
+        events = await self._state.invoice_events_notifier.wait_for(
+            lambda: self._collect_events(self._state.invoice_events, request),
+            float(request.query.get("timeout", DEFAULT_POLL_TIMEOUT)),
+        )
+        return web.json_response(events)
+
+    async def get_invoice(self, request: web.Request) -> web.Response:
+        invoice = self._get_document(self._state.invoices, request)
+        return web.json_response(
+            invoice.invoice_json(self._state.requestor_id, self._state.payment_platform)
+        )
+
+    async def accept_invoice(self, request: web.Request) -> web.Response:
+        invoice = self._get_document(self._state.invoices, request)
+        await self._accept(invoice, request, charge_allocation=True)
+        self._state.stats.accepted_invoices += 1
+        return web.Response(status=200)
+
+    ###########
+    #   Helpers
+    def _add_event(
+        self, events: List[PaymentEventRecord], agreement: AgreementRecord, data: Dict
+    ) -> None:
+        event_date = self._state.next_payment_event_date()
+        events.append(
+            PaymentEventRecord(
+                event_date=event_date,
+                app_session_id=agreement.app_session_id,
+                data={**data, "eventDate": to_iso(event_date)},
+            )
+        )
+
+    @staticmethod
+    def _collect_events(events: List[PaymentEventRecord], request: web.Request) -> List[Dict]:
+        after_timestamp = request.query.get("afterTimestamp")
+        app_session_id = request.query.get("appSessionId")
+        max_events = int(request.query.get("maxEvents", 100))
+        after = from_iso(after_timestamp) if after_timestamp else None
+
+        return [
+            event.data
+            for event in events
+            if (after is None or event.event_date > after)
+            and (app_session_id is None or event.app_session_id == app_session_id)
+        ][:max_events]
+
+    async def _accept(
+        self, document: PaymentDocumentRecord, request: web.Request, charge_allocation: bool
+    ) -> None:
+        body = await request.json()
+        allocation = self._get_allocation(body["allocationId"], web.HTTPBadRequest)
+        amount = Decimal(body["totalAmountAccepted"])
+        if amount > Decimal(allocation["remainingAmount"]):
+            raise json_error(web.HTTPBadRequest, "Not enough funds in the allocation")
+
+        document.status = "ACCEPTED"
+        if not charge_allocation:
+            return
+
+        allocation["spentAmount"] = str(Decimal(allocation["spentAmount"]) + amount)
+        allocation["remainingAmount"] = str(Decimal(allocation["remainingAmount"]) - amount)
+
+    def _get_allocation(self, allocation_id: str, error_cls: Optional[type] = None) -> Dict:
+        try:
+            return self._state.allocations[allocation_id]
+        except KeyError:
+            raise json_error(error_cls or web.HTTPNotFound, f"Allocation {allocation_id} not found")
+
+    @staticmethod
+    def _get_document(
+        documents: Dict[str, PaymentDocumentRecord], request: web.Request
+    ) -> PaymentDocumentRecord:
+        document_id = request.match_info["document_id"]
+        try:
+            return documents[document_id]
+        except KeyError:
+            raise json_error(web.HTTPNotFound, f"Document {document_id} not found")
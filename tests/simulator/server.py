@@ -0,0 +1,115 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+from aiohttp import web
+
+from golem.node import GolemNode
+from tests.simulator.activity import ActivityApi
+from tests.simulator.config import SimulatorConfig
+from tests.simulator.market import MarketApi
+from tests.simulator.payment import PaymentApi
+from tests.simulator.state import SimulatorState, SimulatorStats
+
+SIMULATOR_APP_KEY = "simulator"
+
+
+class YagnaSimulator:
+    """In-process stand-in for the `yagna` REST APIs used by golem.
+
+    Serves market, activity and payment endpoints on a local port, so unmodified
+    :any:`GolemNode` (and any managers stack built on top of it) can run against simulated
+    providers without a network.
+
+    Usage::
+
+        async with YagnaSimulator(SimulatorConfig(providers=generate_providers(1000))) as yagna:
+            async with yagna.create_node() as golem:
+                ...
+
+            print(yagna.stats)
+    """
+
+    def __init__(
+        self,
+        config: Optional[SimulatorConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self._config = config or SimulatorConfig()
+        self._host = host
+        self._port = port
+
+        self._state: Optional[SimulatorState] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def api_url(self) -> str:
+        return f"http://{self._host}:{self._port}"
+
+    @property
+    def config(self) -> SimulatorConfig:
+        return self._config
+
+    @property
+    def stats(self) -> SimulatorStats:
+        assert self._state is not None, "Simulator is not started"
+        return self._state.stats
+
+    def create_node(self, **kwargs: Any) -> GolemNode:
+        """Return a :any:`GolemNode` connected to this simulator."""
+        return GolemNode(app_key=SIMULATOR_APP_KEY, api_url=self.api_url, **kwargs)
+
+    async def __aenter__(self) -> "YagnaSimulator":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        self._state = SimulatorState(self._config)
+
+        payment_api = PaymentApi(self._state)
+        activity_api = ActivityApi(self._state, payment_api)
+        market_api = MarketApi(self._state, activity_api, payment_api)
+
+        app = web.Application(middlewares=[self._simulate_network])
+        market_api.add_routes(app)
+        activity_api.add_routes(app)
+        payment_api.add_routes(app)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+        self._port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        if self._state is not None:
+            await self._state.close()
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _simulate_network(
+        self, request: web.Request, handler: Callable[[web.Request], Awaitable[web.StreamResponse]]
+    ) -> web.StreamResponse:
+        assert self._state is not None
+        self._state.stats.requests += 1
+
+        latency = self._config.latency.total_seconds()
+        jitter = self._config.latency_jitter.total_seconds()
+        if jitter:
+            latency += self._state.rng.uniform(0, jitter)
+        if latency:
+            await asyncio.sleep(latency)
+
+        if self._state.chance(self._config.api_error_rate):
+            self._state.stats.injected_errors += 1
+            return web.json_response(
+                {"message": "Simulated API error"}, status=self._config.api_error_status
+            )
+
+        return await handler(request)
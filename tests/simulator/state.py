@@ -0,0 +1,346 @@
+import asyncio
+import json
+import random
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Coroutine, Deque, Dict, List, Optional, Set, TypeVar
+from uuid import uuid4
+
+from aiohttp import web
+
+from golem.payload import defaults
+from golem.utils.clock import utc_now
+from tests.simulator.config import SimulatedProvider, SimulatorConfig
+
+T = TypeVar("T")
+
+DEFAULT_POLL_TIMEOUT = 5.0
+
+
+def to_iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def from_iso(value: str) -> datetime:
+    #   `+` in the timezone offset might be decoded to a space when not escaped by the client
+    return datetime.fromisoformat(value.replace(" ", "+").replace("Z", "+00:00"))
+
+
+def new_id() -> str:
+    return uuid4().hex
+
+
+def json_error(response_cls: Callable[..., web.HTTPException], message: str) -> web.HTTPException:
+    return response_cls(text=json.dumps({"message": message}), content_type="application/json")
+
+
+class Notifier:
+    """Wakes up long-polling requests waiting for new data."""
+
+    def __init__(self) -> None:
+        self._event = asyncio.Event()
+        self._closed = False
+
+    def notify(self) -> None:
+        self._event.set()
+        self._event = asyncio.Event()
+
+    def close(self) -> None:
+        self._closed = True
+        self.notify()
+
+    async def wait_for(self, collect: Callable[[], List[T]], timeout: float) -> List[T]:
+        """Return result of `collect` once it is not empty or `timeout` elapses."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        while True:
+            items = collect()
+            remaining = deadline - loop.time()
+            if items or remaining <= 0 or self._closed:
+                return items
+
+            try:
+                await asyncio.wait_for(self._event.wait(), remaining)
+            except asyncio.TimeoutError:
+                return collect()
+
+
+@dataclass
+class DemandRecord:
+    demand_id: str
+    properties: Dict[str, Any]
+    constraints: str
+    timestamp: datetime
+    notifier: Notifier
+    events: Deque[Dict] = field(default_factory=deque)
+
+    def push_event(self, event: Dict) -> None:
+        self.events.append(event)
+        self.notifier.notify()
+
+    def pop_events(self, max_events: int) -> List[Dict]:
+        return [self.events.popleft() for _ in range(min(max_events, len(self.events)))]
+
+    def to_json(self, requestor_id: str) -> Dict:
+        return {
+            "properties": self.properties,
+            "constraints": self.constraints,
+            "demandId": self.demand_id,
+            "requestorId": requestor_id,
+            "timestamp": to_iso(self.timestamp),
+        }
+
+
+@dataclass
+class ProposalRecord:
+    proposal_id: str
+    demand_id: str
+    issuer_id: str
+    provider: SimulatedProvider
+    properties: Dict[str, Any]
+    constraints: str
+    state: str
+    timestamp: datetime = field(default_factory=utc_now)
+    prev_proposal_id: Optional[str] = None
+
+    def to_json(self) -> Dict:
+        return {
+            "properties": self.properties,
+            "constraints": self.constraints,
+            "proposalId": self.proposal_id,
+            "issuerId": self.issuer_id,
+            "state": self.state,
+            "timestamp": to_iso(self.timestamp),
+            "prevProposalId": self.prev_proposal_id,
+        }
+
+
+@dataclass
+class AgreementRecord:
+    agreement_id: str
+    demand: DemandRecord
+    demand_proposal: ProposalRecord
+    offer_proposal: ProposalRecord
+    valid_to: Optional[str]
+    will_approve: bool
+    notifier: Notifier
+    state: str = "Proposal"
+    timestamp: datetime = field(default_factory=utc_now)
+    app_session_id: Optional[str] = None
+    approved_date: Optional[datetime] = None
+    activity_ids: List[str] = field(default_factory=list)
+
+    @property
+    def provider(self) -> SimulatedProvider:
+        return self.offer_proposal.provider
+
+    def to_json(self, requestor_id: str) -> Dict:
+        return {
+            "agreementId": self.agreement_id,
+            "demand": {
+                "properties": self.demand_proposal.properties,
+                "constraints": self.demand_proposal.constraints,
+                "demandId": self.demand.demand_id,
+                "requestorId": requestor_id,
+                "timestamp": to_iso(self.demand.timestamp),
+            },
+            "offer": {
+                "properties": self.offer_proposal.properties,
+                "constraints": self.offer_proposal.constraints,
+                "offerId": self.offer_proposal.proposal_id,
+                "providerId": self.provider.provider_id,
+                "timestamp": to_iso(self.offer_proposal.timestamp),
+            },
+            "validTo": self.valid_to,
+            "approvedDate": to_iso(self.approved_date),
+            "state": self.state,
+            "timestamp": to_iso(self.timestamp),
+            "appSessionId": self.app_session_id,
+        }
+
+
+@dataclass
+class BatchRecord:
+    batch_id: str
+    activity_id: str
+    notifier: Notifier
+    results: List[Dict] = field(default_factory=list)
+    finished: bool = False
+    delivered: int = 0
+
+    def add_result(self, result: Dict) -> None:
+        self.results.append(result)
+        self.finished = result["isBatchFinished"]
+        self.notifier.notify()
+
+    def undelivered_results(self) -> List[Dict]:
+        #   Results are always returned from the start, but only when there is something new
+        #   for the client, so polling does not spin on already known results.
+        if len(self.results) > self.delivered or (self.finished and self.results):
+            self.delivered = len(self.results)
+            return list(self.results)
+        return []
+
+
+@dataclass
+class ActivityRecord:
+    activity_id: str
+    agreement: AgreementRecord
+    created_at: datetime = field(default_factory=utc_now)
+    destroyed_at: Optional[datetime] = None
+    busy_seconds: float = 0.0
+    last_debit_note_id: Optional[str] = None
+    tasks: Set[asyncio.Task] = field(default_factory=set)
+
+    @property
+    def destroyed(self) -> bool:
+        return self.destroyed_at is not None
+
+    def usage(self) -> List[float]:
+        """Return usage counters matching provider's usage vector."""
+        end = self.destroyed_at or utc_now()
+        duration = max((end - self.created_at).total_seconds(), self.busy_seconds)
+        return [round(duration, 3), round(self.busy_seconds, 3)]
+
+
+@dataclass
+class PaymentDocumentRecord:
+    document_id: str
+    agreement: AgreementRecord
+    amount: Decimal
+    timestamp: datetime
+    activity: Optional[ActivityRecord] = None
+    usage: Optional[List[float]] = None
+    previous_id: Optional[str] = None
+    status: str = "RECEIVED"
+
+    def _common_json(self, requestor_id: str, payment_platform: str) -> Dict:
+        provider = self.agreement.provider
+        return {
+            "issuerId": provider.provider_id,
+            "recipientId": requestor_id,
+            "payeeAddr": provider.provider_id,
+            "payerAddr": requestor_id,
+            "paymentPlatform": payment_platform,
+            "timestamp": to_iso(self.timestamp),
+            "agreementId": self.agreement.agreement_id,
+            "paymentDueDate": None,
+            "status": self.status,
+        }
+
+    def debit_note_json(self, requestor_id: str, payment_platform: str) -> Dict:
+        assert self.activity is not None
+        return {
+            **self._common_json(requestor_id, payment_platform),
+            "debitNoteId": self.document_id,
+            "previousDebitNoteId": self.previous_id,
+            "activityId": self.activity.activity_id,
+            "totalAmountDue": str(self.amount),
+            "usageCounterVector": self.usage,
+        }
+
+    def invoice_json(self, requestor_id: str, payment_platform: str) -> Dict:
+        return {
+            **self._common_json(requestor_id, payment_platform),
+            "invoiceId": self.document_id,
+            "activityIds": list(self.agreement.activity_ids),
+            "amount": str(self.amount),
+            #   Unlike debit notes, invoice model requires the due date
+            "paymentDueDate": to_iso(self.timestamp + timedelta(days=1)),
+        }
+
+
+@dataclass
+class PaymentEventRecord:
+    event_date: datetime
+    app_session_id: Optional[str]
+    data: Dict
+
+
+@dataclass
+class SimulatorStats:
+    """Counters of what happened in the simulated network."""
+
+    requests: int = 0
+    injected_errors: int = 0
+    demands: int = 0
+    offers: int = 0
+    counter_proposals: int = 0
+    rejected_proposals: int = 0
+    agreements: int = 0
+    approved_agreements: int = 0
+    rejected_agreements: int = 0
+    terminated_agreements: int = 0
+    activities: int = 0
+    failed_activities: int = 0
+    batches: int = 0
+    commands: int = 0
+    failed_commands: int = 0
+    debit_notes: int = 0
+    accepted_debit_notes: int = 0
+    invoices: int = 0
+    accepted_invoices: int = 0
+
+
+class SimulatorState:
+    """Everything the simulated `yagna` knows, shared by all simulated APIs."""
+
+    def __init__(self, config: SimulatorConfig) -> None:
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.stats = SimulatorStats()
+
+        self.requestor_id = "0x" + self.rng.getrandbits(160).to_bytes(20, "big").hex()
+        self.payment_driver = defaults.DEFAULT_PAYMENT_DRIVER
+        self.payment_network = defaults.DEFAULT_PAYMENT_NETWORK
+        self.payment_platform = f"{self.payment_driver}-{self.payment_network}-tglm"
+
+        self.demands: Dict[str, DemandRecord] = {}
+        self.proposals: Dict[str, ProposalRecord] = {}
+        self.agreements: Dict[str, AgreementRecord] = {}
+        self.activities: Dict[str, ActivityRecord] = {}
+        self.batches: Dict[str, BatchRecord] = {}
+        self.allocations: Dict[str, Dict] = {}
+        self.debit_notes: Dict[str, PaymentDocumentRecord] = {}
+        self.invoices: Dict[str, PaymentDocumentRecord] = {}
+
+        self._notifiers: List[Notifier] = []
+        self._tasks: Set[asyncio.Task] = set()
+        self._last_payment_event_date = utc_now()
+
+        self.debit_note_events: List[PaymentEventRecord] = []
+        self.debit_note_events_notifier = self.create_notifier()
+        self.invoice_events: List[PaymentEventRecord] = []
+        self.invoice_events_notifier = self.create_notifier()
+
+    def create_notifier(self) -> Notifier:
+        notifier = Notifier()
+        self._notifiers.append(notifier)
+        return notifier
+
+    def spawn(self, coro: Coroutine) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def chance(self, rate: float) -> bool:
+        return rate > 0 and self.rng.random() < rate
+
+    def next_payment_event_date(self) -> datetime:
+        #   Clients ask for events strictly after the last seen one, so dates must be unique
+        self._last_payment_event_date = max(
+            utc_now(), self._last_payment_event_date + timedelta(microseconds=1)
+        )
+        return self._last_payment_event_date
+
+    async def close(self) -> None:
+        for notifier in self._notifiers:
+            notifier.close()
+
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
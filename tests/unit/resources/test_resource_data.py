@@ -0,0 +1,78 @@
+from collections import defaultdict
+from copy import deepcopy
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from ya_market import models
+
+from golem.payload import Constraint, ConstraintGroup, Constraints, PayloadSyntaxParser, Properties
+from golem.resources import Demand, Proposal, ProposalData
+
+
+@pytest.fixture
+def golem():
+    golem = AsyncMock()
+    golem._resources = defaultdict(dict)
+    return golem
+
+
+def test_proposal_data_constraints_parsed_lazily(mocker):
+    parse_constraints_spy = mocker.spy(PayloadSyntaxParser.get_instance(), "parse_constraints")
+    proposal_data = ProposalData(
+        properties=Properties(),
+        constraints="(& (foo=1) (bar=2))",
+        proposal_id=None,
+        issuer_id=None,
+        state="Initial",
+        timestamp=datetime.now(timezone.utc),
+        prev_proposal_id=None,
+    )
+    copied_proposal_data = deepcopy(proposal_data)
+
+    assert parse_constraints_spy.call_count == 0
+
+    expected_constraints = ConstraintGroup(
+        [Constraint("foo", "=", "1"), Constraint("bar", "=", "2")]
+    )
+    assert proposal_data.constraints == expected_constraints
+    assert proposal_data.constraints is proposal_data.constraints
+    assert parse_constraints_spy.call_count == 1
+    assert copied_proposal_data.constraints == proposal_data.constraints
+
+    proposal_data.constraints = Constraints()
+
+    assert proposal_data.constraints == Constraints()
+
+
+async def test_demand_data_cached(mocker, golem):
+    parse_constraints_spy = mocker.spy(PayloadSyntaxParser.get_instance(), "parse_constraints")
+    demand = Demand(
+        golem,
+        "demand-id",
+        models.Demand(
+            properties={"foo": "bar"},
+            constraints="(foo=1)",
+            demand_id="demand-id",
+            requestor_id="requestor-id",
+            #   According to ya_client spec, this should be ya_market.models.Timestamp
+            timestamp=datetime.now(timezone.utc),  # type: ignore[arg-type]
+        ),
+    )
+
+    demand_data = await demand.get_demand_data()
+
+    assert await demand.get_demand_data() is demand_data
+    assert demand_data.properties == {"foo": "bar"}
+    assert parse_constraints_spy.call_count == 0
+    assert demand_data.constraints == Constraint("foo", "=", "1")
+    assert parse_constraints_spy.call_count == 1
+
+
+async def test_proposal_data_cached(golem, yagna_proposal):
+    proposal = Proposal(golem, "proposal-id", yagna_proposal())
+
+    proposal_data = await proposal.get_proposal_data()
+
+    assert await proposal.get_proposal_data() is proposal_data
+    assert proposal_data.issuer_id == "0xf97cdecb935fc970ed1bd3da6eacc7a325e582dc"
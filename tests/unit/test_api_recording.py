@@ -0,0 +1,71 @@
+import gzip
+import json
+import subprocess
+import sys
+
+import pytest
+
+from golem.node import GolemNode
+from golem.payload import VmPayload
+from golem.utils.low import ApiRecorder, load_recording
+from golem.utils.low.replay import ApiReplayServer
+from tests.simulator import SimulatorConfig, YagnaSimulator, generate_providers
+
+PAYLOAD = VmPayload(package_url="hash:sha3:0123456789abcdef:http://127.0.0.1/image.gvmi")
+
+
+async def _negotiate_agreement(golem: GolemNode) -> str:
+    async with golem:
+        allocation = await golem.create_allocation(1)
+        demand = await golem.create_demand(PAYLOAD, allocations=[allocation])
+        proposal = await demand.initial_proposals().__anext__()
+        our_response = await proposal.respond()
+        draft = await our_response.responses().__anext__()
+
+        agreement = await draft.create_agreement()
+        await agreement.confirm()
+        assert await agreement.wait_for_approval()
+        await agreement.terminate()
+
+        return agreement.id
+
+
+async def test_record_and_replay(tmp_path):
+    path = tmp_path / "session.jsonl.gz"
+    config = SimulatorConfig(providers=generate_providers(5, seed=1), seed=1)
+
+    with ApiRecorder(path) as recorder:
+        async with YagnaSimulator(config) as yagna:
+            recorded_agreement_id = await _negotiate_agreement(
+                yagna.create_node(api_recorder=recorder, collect_payment_events=False)
+            )
+
+    exchanges = list(load_recording(path))
+    assert len(exchanges) == recorder.exchanges_count
+    assert ("POST", "/market-api/v1/agreements") in {(e.method, e.path) for e in exchanges}
+    assert all("Bearer" not in json.dumps(e.to_json()) for e in exchanges)
+
+    async with ApiReplayServer(path, time_scale=0) as server:
+        replayed_agreement_id = await _negotiate_agreement(
+            server.create_node(collect_payment_events=False)
+        )
+
+    assert replayed_agreement_id == recorded_agreement_id
+    assert server.stats.replayed == len(exchanges)
+    assert server.stats.missing == 0
+
+
+def test_load_recording_unsupported_version(tmp_path):
+    path = tmp_path / "session.jsonl.gz"
+    with gzip.open(path, "wt") as f:
+        f.write(json.dumps({"version": 0}) + "\n")
+
+    with pytest.raises(ValueError, match="Unsupported recording format version"):
+        list(load_recording(path))
+
+
+def test_replay_server_is_not_imported_with_golem():
+    code = "import sys, golem, golem.utils.low; print('aiohttp.web' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True).stdout
+
+    assert output.strip() == b"False"
@@ -0,0 +1,161 @@
+import asyncio
+from datetime import timedelta
+from functools import partial
+from typing import Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from golem.managers import MultiPayloadPoolActivityManager
+from golem.managers.base import ManagerException
+
+
+def create_activities_source(key, activities):
+    async def create_activity():
+        activity = MagicMock(id=f"{key}-activity-{len(activities)}")
+        activities.append(activity)
+        return activity
+
+    async def get_agreement():
+        agreement = MagicMock()
+        agreement.create_activity = create_activity
+        return agreement
+
+    return get_agreement
+
+
+async def test_multi_payload_pool_activity_manager_rebalances_between_keys():
+    activities: Dict[str, List[MagicMock]] = {"a": [], "b": []}
+    on_activity_stop = AsyncMock()
+    manager = MultiPayloadPoolActivityManager(
+        MagicMock(),
+        {
+            key: create_activities_source(key, key_activities)
+            for key, key_activities in activities.items()
+        },
+        max_size=2,
+        prepare_concurrency=2,
+        idle_timeout=None,
+        on_activity_start=None,
+        on_activity_stop=on_activity_stop,
+    )
+
+    async with manager:
+        a_activities = await asyncio.gather(*[manager.get_activity("a") for _ in range(2)])
+        for activity in a_activities:
+            await activity.destroy()
+
+        assert manager.metrics["a"].idle_count == 2
+
+        #   Warm activity is reused for the same key
+        activity = await manager.get_activity("a")
+        assert activity._activity is activities["a"][1]
+        await activity.destroy()
+        assert len(activities["a"]) == 2
+
+        #   Idle activity of the other key makes room for the waiting request
+        b_activity = await manager.get_activity("b")
+        assert b_activity._activity is activities["b"][0]
+        assert on_activity_stop.call_count == 1
+        assert manager.metrics["a"].size == 1
+        assert manager.metrics["b"].in_use_count == 1
+
+        #   Budget is shared, so another request waits for an activity to be returned
+        get_task = asyncio.create_task(manager.get_activity("b"))
+        a_activity = await manager.get_activity("a")
+        await asyncio.sleep(0.01)
+        assert not get_task.done()
+        assert manager.metrics["b"].waiters_count == 1
+
+        await a_activity.destroy()
+        assert (await get_task)._activity is activities["b"][1]
+        assert on_activity_stop.call_count == 2
+
+        with pytest.raises(ManagerException):
+            await manager.get_activity("c")
+
+    assert on_activity_stop.call_count == 2
+
+
+async def test_multi_payload_pool_activity_manager_releases_idle_activities():
+    activities: Dict[str, List[MagicMock]] = {"a": []}
+    on_activity_stop = AsyncMock()
+    manager = MultiPayloadPoolActivityManager(
+        MagicMock(),
+        {"a": create_activities_source("a", activities["a"])},
+        max_size=2,
+        min_size_per_key=1,
+        idle_timeout=timedelta(seconds=0.05),
+        on_activity_start=None,
+        on_activity_stop=on_activity_stop,
+    )
+    get_activity = partial(manager.get_activity, "a")
+
+    async with manager:
+        await asyncio.sleep(0.01)
+        assert manager.metrics["a"].idle_count == 1
+
+        given_activities = await asyncio.gather(get_activity(), get_activity())
+        for activity in given_activities:
+            await activity.destroy()
+        assert manager.metrics["a"].size == 2
+
+        await asyncio.sleep(0.1)
+        #   Pool shrinks back to its minimum size
+        assert manager.metrics["a"].size == 1
+        assert on_activity_stop.call_count == 1
+
+    assert on_activity_stop.call_count == 2
+
+
+async def test_multi_payload_pool_activity_manager_releases_activities_returned_after_stop():
+    activities: List[MagicMock] = []
+    on_activity_stop = AsyncMock()
+    manager = MultiPayloadPoolActivityManager(
+        MagicMock(),
+        {"a": create_activities_source("a", activities)},
+        on_activity_start=None,
+        on_activity_stop=on_activity_stop,
+    )
+
+    async with manager:
+        activity = await manager.get_activity("a")
+
+    on_activity_stop.assert_not_called()
+    await activity.destroy()
+    on_activity_stop.assert_called_once()
+    assert manager.metrics["a"].size == 0
+
+
+async def test_multi_payload_pool_activity_manager_doesnt_starve_keys_of_failing_key():
+    activities: List[MagicMock] = []
+    failing_get_agreement = AsyncMock(side_effect=Exception("No agreement"))
+    manager = MultiPayloadPoolActivityManager(
+        MagicMock(),
+        {"a": failing_get_agreement, "b": create_activities_source("b", activities)},
+        max_size=2,
+        base_prepare_retry_delay=timedelta(seconds=0.05),
+        on_activity_start=None,
+        on_activity_stop=None,
+    )
+
+    async with manager:
+        #   Requests for the failing key wait the longest, so they are served first
+        a_tasks = [asyncio.create_task(manager.get_activity("a")) for _ in range(10)]
+        await asyncio.sleep(0.01)
+
+        b_activity = await asyncio.wait_for(manager.get_activity("b"), timeout=0.1)
+        assert b_activity._activity is activities[0]
+        await asyncio.sleep(0.2)
+
+        #   Preparations for the failing key are retried after 0.05s, 0.1s and 0.2s
+        assert failing_get_agreement.call_count <= 4
+
+        for a_task in a_tasks:
+            a_task.cancel()
+        await asyncio.gather(*a_tasks, return_exceptions=True)
+
+        #   Cancelled requests are not waiting anymore
+        assert manager.metrics["a"].waiters_count == 0
+
+        await b_activity.destroy()
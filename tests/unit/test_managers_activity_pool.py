@@ -0,0 +1,197 @@
+import asyncio
+from datetime import timedelta
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+from golem.managers import PoolActivityManager
+
+
+def create_activities_source():
+    activities: List[MagicMock] = []
+
+    async def create_activity():
+        activity = MagicMock(id=f"activity-{len(activities)}")
+        activities.append(activity)
+        return activity
+
+    async def get_agreement():
+        agreement = MagicMock()
+        agreement.create_activity = create_activity
+        return agreement
+
+    return activities, get_agreement
+
+
+async def test_pool_activity_manager_keeps_fixed_size():
+    activities, get_agreement = create_activities_source()
+    on_activity_stop = AsyncMock()
+    manager = PoolActivityManager(
+        MagicMock(),
+        get_agreement,
+        pool_size=2,
+        prepare_concurrency=2,
+        on_activity_start=None,
+        on_activity_stop=on_activity_stop,
+    )
+
+    async with manager:
+        await asyncio.sleep(0.01)
+        assert len(activities) == 2
+        assert manager.metrics.idle_count == 2
+
+        activity = await manager.get_activity()
+        assert manager.metrics.in_use_count == 1
+
+        await activity.destroy()
+        assert manager.metrics.idle_count == 2
+
+    assert len(activities) == 2
+    assert on_activity_stop.call_count == 2
+
+
+async def test_pool_activity_manager_scales_with_waiting_requests():
+    activities, get_agreement = create_activities_source()
+    on_activity_stop = AsyncMock()
+    manager = PoolActivityManager(
+        MagicMock(),
+        get_agreement,
+        min_size=0,
+        max_size=2,
+        idle_timeout=timedelta(seconds=0.05),
+        on_activity_start=None,
+        on_activity_stop=on_activity_stop,
+    )
+
+    async with manager:
+        await asyncio.sleep(0.01)
+        assert manager.metrics.size == 0
+
+        get_tasks = [asyncio.create_task(manager.get_activity()) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        #   Pool grows up to its maximum size
+        assert len(activities) == 2
+        assert manager.metrics.waiters_count == 1
+        first_activity = await get_tasks[0]
+        await first_activity.destroy()
+
+        #   Returned activity is given to the waiting request
+        assert (await get_tasks[2])._activity is first_activity._activity
+        for get_task in get_tasks[1:]:
+            await (await get_task).destroy()
+
+        assert manager.metrics.idle_count == 2
+        assert manager.metrics.average_prepare_time is not None
+
+        #   Idle activities are released after the timeout
+        await asyncio.sleep(0.1)
+        assert manager.metrics.size == 0
+        assert on_activity_stop.call_count == 2
+
+
+async def test_pool_activity_manager_doesnt_leak_activities():
+    activities, get_agreement = create_activities_source()
+    on_activity_stop = AsyncMock()
+    manager = PoolActivityManager(
+        MagicMock(),
+        get_agreement,
+        pool_size=1,
+        on_activity_start=None,
+        on_activity_stop=on_activity_stop,
+    )
+
+    async with manager:
+        activity = await manager.get_activity()
+        get_task = asyncio.create_task(manager.get_activity())
+        await asyncio.sleep(0.01)
+
+        #   Request is cancelled after the activity was given to it, but before it took it
+        await activity.destroy()
+        get_task.cancel()
+        await asyncio.sleep(0.01)
+
+        assert get_task.cancelled()
+        assert manager.metrics.idle_count == 1
+
+        activity = await manager.get_activity()
+
+    #   Activity returned after the pool is stopped is released
+    on_activity_stop.assert_not_called()
+    await activity.destroy()
+    on_activity_stop.assert_called_once()
+    assert manager.metrics.size == 0
+
+
+async def test_pool_activity_manager_backs_off_after_failed_preparations():
+    get_agreement = AsyncMock(side_effect=Exception("No agreement"))
+    manager = PoolActivityManager(
+        MagicMock(),
+        get_agreement,
+        pool_size=2,
+        prepare_concurrency=2,
+        base_prepare_retry_delay=timedelta(seconds=0.05),
+        on_activity_start=None,
+        on_activity_stop=None,
+    )
+
+    async with manager:
+        await asyncio.sleep(0.3)
+
+    #   Two at once, then retried after 0.05s, 0.1s and 0.2s
+    assert get_agreement.call_count <= 8
+
+
+async def test_pool_activity_manager_scales_with_wait_time_of_requests():
+    activities, get_agreement = create_activities_source()
+    manager = PoolActivityManager(
+        MagicMock(),
+        get_agreement,
+        min_size=0,
+        max_size=3,
+        prepare_concurrency=3,
+        scale_up_wait_time=timedelta(seconds=0.05),
+        on_activity_start=None,
+        on_activity_stop=None,
+    )
+
+    async with manager:
+        get_tasks = [asyncio.create_task(manager.get_activity()) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        #   Cancelled requests don't make the pool grow
+        for get_task in get_tasks[1:]:
+            get_task.cancel()
+        await asyncio.sleep(0.01)
+
+        assert manager.metrics.waiters_count == 1
+        assert not activities
+
+        await get_tasks[0]
+        assert len(activities) == 1
+
+
+async def test_pool_activity_manager_scales_with_utilization():
+    activities, get_agreement = create_activities_source()
+    manager = PoolActivityManager(
+        MagicMock(),
+        get_agreement,
+        min_size=1,
+        max_size=3,
+        scale_up_utilization=0.8,
+        on_activity_start=None,
+        on_activity_stop=None,
+    )
+
+    async with manager:
+        await asyncio.sleep(0.01)
+        assert len(activities) == 1
+
+        activity = await manager.get_activity()
+        await asyncio.sleep(0.01)
+
+        #   Activity is prepared before any request waits for it
+        assert len(activities) == 2
+        assert manager.metrics.idle_count == 1
+        assert manager.metrics.waiters_count == 0
+
+        await activity.destroy()
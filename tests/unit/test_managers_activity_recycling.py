@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from golem.managers import DefaultAgreementManager, RecyclingActivityManager
+from golem.managers.base import ManagerException
+from golem.payload import Properties
+
+
+def create_agreements_source():
+    agreements: List[MagicMock] = []
+
+    async def get_agreement():
+        expiration = datetime.now(timezone.utc) + timedelta(hours=1)
+        agreement = MagicMock(id=f"agreement-{len(agreements)}")
+        agreement.get_data = AsyncMock(
+            return_value=MagicMock(
+                offer=MagicMock(properties=Properties({"golem.srv.caps.multi-activity": True})),
+                demand=MagicMock(
+                    properties=Properties(
+                        {"golem.srv.comp.expiration": int(expiration.timestamp() * 1000)}
+                    )
+                ),
+            )
+        )
+        agreement.close_all = AsyncMock()
+
+        async def create_activity():
+            activity = MagicMock(destroyed=True)
+            activity.agreement = agreement
+            return activity
+
+        agreement.create_activity = create_activity
+        agreements.append(agreement)
+        return agreement
+
+    return agreements, get_agreement
+
+
+def create_manager(get_agreement, **kwargs):
+    return RecyclingActivityManager(
+        MagicMock(), get_agreement, on_activity_start=None, on_activity_stop=None, **kwargs
+    )
+
+
+async def test_recycling_activity_manager_reuses_agreements():
+    agreements, get_agreement = create_agreements_source()
+    manager = create_manager(get_agreement, max_activities_per_agreement=2)
+
+    async with manager:
+        for _ in range(3):
+            activity = await manager.get_activity()
+            await activity.destroy()
+
+        assert len(agreements) == 2
+        #   Agreement with maximum number of activities is not reused
+        agreements[0].close_all.assert_called_once()
+        agreements[1].close_all.assert_not_called()
+
+    agreements[1].close_all.assert_called_once()
+
+
+async def test_recycling_activity_manager_closes_agreements_released_after_stop():
+    agreements, get_agreement = create_agreements_source()
+    manager = create_manager(get_agreement)
+
+    async with manager:
+        activity = await manager.get_activity()
+
+    await activity.destroy()
+
+    agreements[0].close_all.assert_called_once()
+    assert not manager._idle_agreements
+
+
+def test_recycling_activity_manager_rejects_agreement_manager_terminating_agreements():
+    agreement_manager = DefaultAgreementManager(MagicMock(), AsyncMock())
+
+    with pytest.raises(ManagerException, match="terminate_on_activity_closed=False"):
+        create_manager(agreement_manager.get_agreement, agreement_manager=agreement_manager)
+
+    agreement_manager = DefaultAgreementManager(
+        MagicMock(), AsyncMock(), terminate_on_activity_closed=False
+    )
+    create_manager(agreement_manager.get_agreement, agreement_manager=agreement_manager)
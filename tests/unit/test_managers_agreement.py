@@ -0,0 +1,115 @@
+import asyncio
+from datetime import timedelta
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from golem.managers import DefaultAgreementManager
+from golem.resources import Agreement
+
+
+def create_draft_proposals_source(approvals):
+    """Return agreements and draft proposals source, approvals are `(delay, approved)` pairs."""
+    agreements: List[MagicMock] = []
+    approvals = list(approvals)
+
+    async def get_draft_proposal():
+        if not approvals:
+            await asyncio.Event().wait()
+
+        delay, approved = approvals.pop(0)
+
+        async def wait_for_approval():
+            await asyncio.sleep(delay)
+            return approved
+
+        agreement = MagicMock(spec=Agreement, id=f"agreement-{len(agreements)}")
+        agreement.confirm = AsyncMock()
+        agreement.wait_for_approval = wait_for_approval
+        agreement.close_all = AsyncMock()
+        agreements.append(agreement)
+
+        proposal = MagicMock()
+        proposal.create_agreement = AsyncMock(return_value=agreement)
+        return proposal
+
+    return agreements, get_draft_proposal
+
+
+async def wait_for_closed(agreements, *indexes):
+    while not all(
+        index < len(agreements) and agreements[index].close_all.called for index in indexes
+    ):
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.parametrize("max_surplus_agreements", (0, 1))
+async def test_default_agreement_manager_races_agreements(max_surplus_agreements):
+    agreements, get_draft_proposal = create_draft_proposals_source(
+        [(0.3, True), (0.01, False), (0.02, True), (0.03, True)]
+    )
+    manager = DefaultAgreementManager(
+        MagicMock(event_bus=AsyncMock()),
+        get_draft_proposal,
+        agreement_concurrency=3,
+        max_surplus_agreements=max_surplus_agreements,
+    )
+
+    async with manager:
+        #   Not approved agreement is replaced with the next one, which wins the race
+        assert await manager.get_agreement() is agreements[2]
+
+        #   Mocks are slow to create, so losing agreements are awaited instead of a fixed delay
+        closed_indexes = (0,) if max_surplus_agreements else (0, 3)
+        await asyncio.wait_for(wait_for_closed(agreements, *closed_indexes), timeout=1)
+        assert len(agreements) == 4
+
+        if max_surplus_agreements:
+            assert await manager.get_agreement() is agreements[3]
+            agreements[0].close_all.assert_called_once()
+        else:
+            agreements[0].close_all.assert_called_once()
+            agreements[3].close_all.assert_called_once()
+
+        agreements[2].close_all.assert_not_called()
+
+    agreements[2].close_all.assert_called_once()
+
+
+async def test_default_agreement_manager_terminates_agreements_waiting_for_approval_on_stop():
+    agreements, get_draft_proposal = create_draft_proposals_source([(0.01, True), (10, True)])
+    manager = DefaultAgreementManager(
+        MagicMock(event_bus=AsyncMock()), get_draft_proposal, agreement_concurrency=2
+    )
+
+    async with manager:
+        assert await manager.get_agreement() is agreements[0]
+
+        #   Second agreement is already confirmed, but not approved yet
+        await asyncio.sleep(0.01)
+        agreements[1].confirm.assert_called_once()
+        agreements[1].close_all.assert_not_called()
+
+    agreements[1].close_all.assert_called_once()
+
+
+async def test_default_agreement_manager_terminates_expired_surplus_agreements():
+    agreements, get_draft_proposal = create_draft_proposals_source(
+        [(0.01, True), (0.02, True), (0.03, True)]
+    )
+    manager = DefaultAgreementManager(
+        MagicMock(event_bus=AsyncMock()),
+        get_draft_proposal,
+        agreement_concurrency=2,
+        max_surplus_agreements=1,
+        surplus_agreement_timeout=timedelta(milliseconds=50),
+    )
+
+    async with manager:
+        assert await manager.get_agreement() is agreements[0]
+
+        await asyncio.sleep(0.1)
+        agreements[1].close_all.assert_called_once()
+
+        assert await manager.get_agreement() is agreements[2]
@@ -0,0 +1,160 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from golem.managers import PoolAgreementManager
+from golem.managers.base import ManagerException
+
+
+def create_agreements_source(
+    expiration: Optional[datetime] = None, approval_delay: Optional[float] = None
+):
+    agreements: List[MagicMock] = []
+
+    async def wait_for_approval():
+        if approval_delay is not None:
+            await asyncio.sleep(approval_delay)
+
+        return True
+
+    async def get_draft_proposal():
+        properties = {}
+        if expiration is not None:
+            properties["golem.srv.comp.expiration"] = int(expiration.timestamp() * 1000)
+
+        agreement = MagicMock(id=f"agreement-{len(agreements)}")
+        agreement.get_data = AsyncMock(
+            return_value=MagicMock(demand=MagicMock(properties=properties))
+        )
+        agreement.confirm = AsyncMock()
+        agreement.wait_for_approval = wait_for_approval
+        agreement.close_all = AsyncMock()
+        agreements.append(agreement)
+
+        proposal = MagicMock()
+        proposal.create_agreement = AsyncMock(return_value=agreement)
+        return proposal
+
+    return agreements, get_draft_proposal
+
+
+async def wait_for_agreements_count(agreements, count):
+    while len(agreements) < count:
+        await asyncio.sleep(0.01)
+
+
+async def test_pool_agreement_manager_keeps_agreements_ready():
+    agreements, get_draft_proposal = create_agreements_source()
+    manager = PoolAgreementManager(
+        MagicMock(event_bus=AsyncMock()), get_draft_proposal, min_size=1, max_size=2
+    )
+
+    async with manager:
+        await asyncio.sleep(0.01)
+        assert len(agreements) == 2
+
+        assert await manager.get_agreement() is agreements[0]
+        await asyncio.sleep(0.01)
+        #   Pool is still above its minimum size
+        assert len(agreements) == 2
+
+        assert await manager.get_agreement() is agreements[1]
+        await asyncio.sleep(0.01)
+        assert len(agreements) == 4
+
+        assert (manager.hits_count, manager.misses_count) == (2, 0)
+
+        given_agreements = await asyncio.gather(*[manager.get_agreement() for _ in range(3)])
+        assert given_agreements == agreements[2:5]
+        assert (manager.hits_count, manager.misses_count) == (4, 1)
+
+        await asyncio.sleep(0.01)
+        pooled_agreements = agreements[5:]
+        #   Pool is refilled only when it drops below its minimum size
+        assert len(pooled_agreements) == 1
+
+    for agreement in pooled_agreements:
+        agreement.close_all.assert_called_once()
+
+
+async def test_pool_agreement_manager_replaces_idle_agreements():
+    agreements, get_draft_proposal = create_agreements_source()
+    manager = PoolAgreementManager(
+        MagicMock(event_bus=AsyncMock()),
+        get_draft_proposal,
+        max_idle_time=timedelta(seconds=0.1),
+    )
+
+    async with manager:
+        await asyncio.wait_for(wait_for_agreements_count(agreements, 2), timeout=1)
+        agreements[0].close_all.assert_called_once()
+
+        assert await manager.get_agreement() is agreements[1]
+
+    agreements[1].close_all.assert_called_once()
+
+
+async def test_pool_agreement_manager_replaces_agreements_before_their_expiration(mocker):
+    expiration = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    mocker.patch(
+        "golem.managers.agreement.pool.utc_now",
+        return_value=expiration - timedelta(minutes=1, seconds=0.1),
+    )
+    agreements, get_draft_proposal = create_agreements_source(expiration)
+    manager = PoolAgreementManager(
+        MagicMock(event_bus=AsyncMock()),
+        get_draft_proposal,
+        min_remaining_time=timedelta(minutes=1),
+    )
+
+    async with manager:
+        await asyncio.wait_for(wait_for_agreements_count(agreements, 2), timeout=1)
+        agreements[0].close_all.assert_called_once()
+
+        assert await manager.get_agreement() is agreements[1]
+
+
+async def test_pool_agreement_manager_terminates_agreements_waiting_for_approval_on_stop():
+    agreements, get_draft_proposal = create_agreements_source(approval_delay=10)
+    manager = PoolAgreementManager(MagicMock(event_bus=AsyncMock()), get_draft_proposal)
+
+    async with manager:
+        await asyncio.sleep(0.01)
+
+        assert len(agreements) == 1
+        agreements[0].confirm.assert_called_once()
+
+    agreements[0].close_all.assert_called_once()
+
+
+async def test_pool_agreement_manager_stops_after_fill_failure():
+    agreements, get_draft_proposal = create_agreements_source()
+
+    async def get_draft_proposal_or_fail():
+        if agreements:
+            raise RuntimeError("no more proposals")
+
+        return await get_draft_proposal()
+
+    manager = PoolAgreementManager(
+        MagicMock(event_bus=AsyncMock()), get_draft_proposal_or_fail, max_size=2
+    )
+
+    async with manager:
+        await asyncio.sleep(0.01)
+
+        assert await manager.get_agreement() is agreements[0]
+
+        with pytest.raises(RuntimeError, match="no more proposals"):
+            await manager.get_agreement()
+
+    #   Stored fill error is not raised on stop
+    agreements[0].close_all.assert_called_once()
+
+
+def test_pool_agreement_manager_rejects_agreement_concurrency():
+    with pytest.raises(ManagerException, match="fill_concurrency_size"):
+        PoolAgreementManager(MagicMock(), AsyncMock(), agreement_concurrency=2)
@@ -1,8 +1,19 @@
 import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict
 
 import pytest
 
-from golem.managers import AggregatingDemandManager
+from golem.managers import AggregatingDemandManager, DefaultPaymentManager, RefreshingDemandManager
+from golem.managers.base import ManagerException
+from golem.payload import VmPayload
+from golem.resources import Demand
+from golem.utils.asyncio import run_in_virtual_time
+from golem.utils.clock import utc_now
+from tests.simulator import SimulatorConfig, YagnaSimulator, generate_providers
+
+PAYLOAD = VmPayload(package_url="hash:sha3:0123456789abcdef:http://127.0.0.1/image.gvmi")
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
 
 
 async def test_aggregating_demand_manager_should_block_until_proposal_arrives(mocker):
@@ -178,3 +189,66 @@ async def test_aggregating_demand_manager_should_keep_completion_order(mocker):
     mocked_get_initial_proposal1.mock_calls = [mocker.call()]
     mocked_get_initial_proposal2.mock_calls = [mocker.call()]
     mocked_get_initial_proposal3.mock_calls = [mocker.call()]
+
+
+def test_refreshing_demand_manager_rejects_rollover_lead_time_not_shorter_than_lifetime(mocker):
+    with pytest.raises(ManagerException):
+        RefreshingDemandManager(
+            mocker.Mock(),
+            mocker.AsyncMock(),
+            [PAYLOAD],
+            demand_lifetime=timedelta(minutes=30),
+            rollover_lead_time=timedelta(minutes=30),
+        )
+
+
+def test_refreshing_demand_manager_rollover():
+    config = SimulatorConfig(providers=generate_providers(3, seed=1), seed=1)
+
+    async def main():
+        proposals_received_at: Dict[Demand, datetime] = {}
+        subscribed_demands_counts = []
+
+        async with YagnaSimulator(config) as yagna:
+            golem = yagna.create_node()
+            payment_manager = DefaultPaymentManager(golem, budget=10.0)
+            demand_manager = RefreshingDemandManager(
+                golem,
+                payment_manager.get_allocation,
+                [PAYLOAD],
+                rollover_lead_time=timedelta(minutes=5),
+            )
+
+            async def consume_proposals():
+                while True:
+                    proposal = await demand_manager.get_initial_proposal()
+                    proposals_received_at.setdefault(proposal.demand, utc_now())
+                    #   Proposals are never given out from an unsubscribed demand
+                    assert any(d.demand is proposal.demand for d in demand_manager._demands)
+
+            async with golem:
+                async with payment_manager, demand_manager:
+                    consumer_task = asyncio.create_task(consume_proposals())
+
+                    for minutes in (50, 57, 61):
+                        await asyncio.sleep(
+                            (START + timedelta(minutes=minutes) - utc_now()).total_seconds()
+                        )
+                        subscribed_demands_counts.append(len(demand_manager._demands))
+
+                    await asyncio.sleep(timedelta(hours=1, minutes=30).total_seconds())
+                    consumer_task.cancel()
+
+                    assert len(demand_manager._demands) == 1
+
+        return proposals_received_at, subscribed_demands_counts
+
+    proposals_received_at, subscribed_demands_counts = run_in_virtual_time(main(), start=START)
+
+    #   Each demand is replaced before it expires, an hour after its creation
+    assert [
+        (received_at - START) // timedelta(minutes=1)
+        for received_at in proposals_received_at.values()
+    ] == [0, 55, 110]
+    #   Replaced demand stays subscribed until it expires
+    assert subscribed_demands_counts == [1, 2, 1]
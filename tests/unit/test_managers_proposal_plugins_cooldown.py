@@ -0,0 +1,189 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from golem.event_bus.in_memory import InMemoryEventBus
+from golem.managers import PoolAgreementManager, ProviderCooldownPlugin
+from golem.resources import (
+    ActivityClosed,
+    AgreementClosed,
+    AgreementNotApproved,
+    BatchFinished,
+    Proposal,
+    ProposalRejectedByProvider,
+)
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def golem():
+    golem = MagicMock()
+    golem.event_bus = AsyncMock()
+    return golem
+
+
+@pytest.fixture
+def now(mocker):
+    return mocker.patch("golem.managers.proposal.plugins.cooldown.utc_now", return_value=START)
+
+
+def create_proposal(provider_id, initial=True):
+    proposal = MagicMock(spec=Proposal, initial=initial)
+    proposal.get_provider_id = AsyncMock(return_value=provider_id)
+    proposal.reject = AsyncMock()
+    return proposal
+
+
+def test_cooldown_grows_exponentially_and_expires(golem, now):
+    plugin = ProviderCooldownPlugin(
+        golem,
+        base_cooldown=timedelta(seconds=10),
+        max_cooldown=timedelta(seconds=30),
+        failures_ttl=timedelta(minutes=5),
+    )
+
+    assert plugin.get_cooldown_until("a") is None
+
+    plugin.record_failure("a", "some_failure")
+    assert plugin.get_cooldown_until("a") == START + timedelta(seconds=10)
+
+    plugin.record_failure("a", "some_failure")
+    assert plugin.get_cooldown_until("a") == START + timedelta(seconds=20)
+
+    plugin.record_failure("a", "some_failure")
+    plugin.record_failure("a", "some_failure")
+    assert plugin.get_cooldown_until("a") == START + timedelta(seconds=30)
+
+    now.return_value = START + timedelta(seconds=30)
+    assert plugin.get_cooldown_until("a") is None
+
+    #   Failures are still remembered, until their ttl passes
+    plugin.record_failure("a", "some_failure")
+    assert plugin.get_cooldown_until("a") == now.return_value + timedelta(seconds=30)
+
+    now.return_value = START + timedelta(minutes=10)
+    plugin.record_failure("a", "some_failure")
+    assert plugin.get_cooldown_until("a") == now.return_value + timedelta(seconds=10)
+
+    plugin.record_success("a")
+    assert plugin.get_cooldown_until("a") is None
+
+    assert plugin.failures_counts == {"some_failure": 6}
+
+
+async def test_proposals_from_providers_on_cooldown_are_skipped(golem, now):
+    plugin = ProviderCooldownPlugin(golem, base_cooldown=timedelta(seconds=10))
+    proposals = [
+        create_proposal("a"),
+        create_proposal("a", initial=False),
+        create_proposal("b"),
+    ]
+    plugin.set_proposal_callback(AsyncMock(side_effect=proposals))
+
+    plugin.record_failure("a", "some_failure")
+
+    assert await plugin.get_proposal() is proposals[2]
+    assert plugin.skipped_proposals_count == 2
+    proposals[0].reject.assert_not_called()
+    proposals[1].reject.assert_called_once()
+
+
+async def test_failures_are_recorded_from_events(golem, now):
+    plugin = ProviderCooldownPlugin(golem)
+
+    offer_proposal = create_proposal("rejecting")
+    counter_proposal = MagicMock(has_parent=True)
+    counter_proposal.parent = offer_proposal
+    await plugin._handle_proposal_rejected(ProposalRejectedByProvider(counter_proposal))
+
+    agreement = MagicMock(has_parent=True)
+    agreement.proposal.get_provider_id = AsyncMock(return_value="not_approving")
+    await plugin._handle_agreement_not_approved(AgreementNotApproved(agreement))
+
+    for provider_id, success in (("failing", False), ("working", True)):
+        activity = MagicMock(id=f"{provider_id}-activity", has_parent=True)
+        activity.agreement.has_parent = True
+        activity.agreement.proposal.get_provider_id = AsyncMock(return_value=provider_id)
+        plugin.record_failure(provider_id, "some_failure")
+
+        for batch_success in (success, not success):
+            batch = MagicMock(has_parent=True, success=batch_success)
+            batch.parent = activity
+            await plugin._handle_batch_finished(BatchFinished(batch))
+
+    assert plugin.get_cooldown_until("rejecting") is not None
+    assert plugin.get_cooldown_until("not_approving") is not None
+    assert plugin.get_cooldown_until("failing") is not None
+    #   Only the first batch of the activity is taken into account
+    assert plugin.get_cooldown_until("working") is None
+    assert plugin.failures_counts == {
+        "proposal_rejected": 1,
+        "agreement_not_approved": 1,
+        "activity_failed": 1,
+        "some_failure": 2,
+    }
+
+
+async def test_activities_closed_before_first_batch_are_failures(golem, now):
+    plugin = ProviderCooldownPlugin(golem)
+
+    for provider_id, batch_success in (("not_deploying", None), ("working", True)):
+        activity = MagicMock(id=f"{provider_id}-activity", has_parent=True)
+        activity.agreement.has_parent = True
+        activity.agreement.proposal.get_provider_id = AsyncMock(return_value=provider_id)
+
+        if batch_success is not None:
+            batch = MagicMock(has_parent=True, success=batch_success)
+            batch.parent = activity
+            await plugin._handle_batch_finished(BatchFinished(batch))
+
+        await plugin._handle_activity_closed(ActivityClosed(activity))
+
+    assert plugin.get_cooldown_until("not_deploying") is not None
+    assert plugin.get_cooldown_until("working") is None
+    assert plugin.failures_counts == {"activity_failed": 1}
+    assert not plugin._started_activities_ids
+
+
+async def test_agreements_expired_in_pool_are_no_failures(now):
+    event_bus = InMemoryEventBus()
+    golem = MagicMock(event_bus=event_bus)
+    plugin = ProviderCooldownPlugin(golem)
+    agreements: List[MagicMock] = []
+
+    async def get_draft_proposal():
+        agreement = MagicMock(id=f"agreement-{len(agreements)}", has_parent=True)
+        agreement.proposal.get_provider_id = AsyncMock(return_value="idle")
+        agreement.confirm = AsyncMock()
+        agreement.wait_for_approval = AsyncMock(return_value=True)
+        agreement.get_data = AsyncMock(return_value=MagicMock(demand=MagicMock(properties={})))
+
+        async def close_all():
+            await event_bus.emit(AgreementClosed(agreement))
+
+        agreement.close_all = AsyncMock(side_effect=close_all)
+        agreements.append(agreement)
+
+        proposal = MagicMock()
+        proposal.create_agreement = AsyncMock(return_value=agreement)
+        return proposal
+
+    manager = PoolAgreementManager(golem, get_draft_proposal, max_idle_time=timedelta(seconds=0.05))
+
+    await event_bus.start()
+    await plugin.start()
+
+    async with manager:
+        await asyncio.sleep(0.08)
+
+    await plugin.stop()
+    await event_bus.stop()
+
+    #   Agreements terminated by the pool itself don't put the provider on cooldown
+    agreements[0].close_all.assert_called_once()
+    assert plugin.get_cooldown_until("idle") is None
+    assert plugin.failures_counts == {}
@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from golem.managers import DeduplicateProposalsPlugin
+from golem.payload import Properties
+from golem.resources import (
+    NewAgreement,
+    Proposal,
+    ProposalRejectedByProvider,
+    ProposalRejectedByRequestor,
+)
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def golem():
+    golem = MagicMock()
+    golem.event_bus = AsyncMock()
+    return golem
+
+
+def create_demand(expiration_date=START):
+    demand = MagicMock()
+    demand.get_expiration_date = AsyncMock(return_value=expiration_date)
+    return demand
+
+
+def create_proposal(issuer_id, properties, initial=True, demand=None):
+    proposal = MagicMock(spec=Proposal, initial=initial, has_parent=True)
+    proposal.parent = proposal.demand = demand or create_demand()
+    proposal.get_proposal_data = AsyncMock(
+        return_value=MagicMock(issuer_id=issuer_id, properties=Properties(properties))
+    )
+    return proposal
+
+
+async def test_deduplicate_proposals_plugin(mocker, golem):
+    now = mocker.patch("golem.managers.proposal.plugins.deduplicate.utc_now", return_value=START)
+    proposals = [
+        create_proposal("a", {"some.property": [1, 2]}),
+        create_proposal("a", {"some.property": [1, 2]}),
+        create_proposal("a", {"some.property": [1, 3]}),
+        create_proposal("b", {"some.property": [1, 2]}),
+        create_proposal("a", {"some.property": [1, 2]}, initial=False),
+        create_proposal("a", {"some.property": [1, 2]}),
+        create_proposal("a", {"some.property": [1, 2]}),
+    ]
+    plugin = DeduplicateProposalsPlugin(golem, window=timedelta(minutes=1))
+    plugin.set_proposal_callback(AsyncMock(side_effect=proposals))
+
+    assert await plugin.get_proposal() is proposals[0]
+    assert await plugin.get_proposal() is proposals[2]
+    assert await plugin.get_proposal() is proposals[3]
+    assert await plugin.get_proposal() is proposals[4]
+    assert plugin.dropped_proposals_count == 1
+
+    now.return_value = START + timedelta(minutes=1)
+
+    assert await plugin.get_proposal() is proposals[5]
+    assert plugin.dropped_proposals_count == 1
+
+
+async def test_deduplicate_proposals_plugin_prefers_newer_demands(mocker, golem):
+    mocker.patch("golem.managers.proposal.plugins.deduplicate.utc_now", return_value=START)
+    old_demand = create_demand(START + timedelta(minutes=10))
+    new_demand = create_demand(START + timedelta(minutes=20))
+    proposals = [
+        create_proposal("a", {}, demand=old_demand),
+        create_proposal("a", {}, demand=new_demand),
+        create_proposal("a", {}, demand=old_demand),
+        create_proposal("a", {}, demand=new_demand),
+        create_proposal("b", {}),
+    ]
+    plugin = DeduplicateProposalsPlugin(golem)
+    plugin.set_proposal_callback(AsyncMock(side_effect=proposals))
+
+    assert await plugin.get_proposal() is proposals[0]
+    assert await plugin.get_proposal() is proposals[1]
+    assert await plugin.get_proposal() is proposals[4]
+    assert plugin.dropped_proposals_count == 2
+
+
+async def test_deduplicate_proposals_plugin_forgets_finished_proposals(mocker, golem):
+    mocker.patch("golem.managers.proposal.plugins.deduplicate.utc_now", return_value=START)
+    proposals = [create_proposal("a", {}) for _ in range(4)]
+    plugin = DeduplicateProposalsPlugin(golem)
+    plugin.set_proposal_callback(AsyncMock(side_effect=proposals))
+
+    assert await plugin.get_proposal() is proposals[0]
+
+    #   Provider rejected our counter proposal
+    counter_proposal = MagicMock(has_parent=True)
+    counter_proposal.parent = proposals[0]
+    await plugin._handle_proposal_done(ProposalRejectedByProvider(counter_proposal))
+
+    assert await plugin.get_proposal() is proposals[1]
+
+    #   We rejected the proposal
+    await plugin._handle_proposal_done(ProposalRejectedByRequestor(proposals[1]))
+
+    assert await plugin.get_proposal() is proposals[2]
+
+    agreement = MagicMock(has_parent=True, proposal=proposals[2])
+    await plugin._handle_new_agreement(NewAgreement(agreement))
+
+    assert await plugin.get_proposal() is proposals[3]
+    assert plugin.dropped_proposals_count == 0
@@ -0,0 +1,166 @@
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from golem.managers import NegotiatingPlugin
+from golem.utils.clock import utc_now
+
+
+def create_proposal(name: str) -> MagicMock:
+    proposal = MagicMock(name=name)
+    proposal.demand.get_demand_data = AsyncMock(return_value={})
+    proposal.get_proposal_data = AsyncMock()
+    proposal.get_provider_name = AsyncMock(return_value=name)
+    proposal.get_expiration_date = AsyncMock(return_value=utc_now() + timedelta(minutes=5))
+    return proposal
+
+
+@pytest.fixture
+def proposals():
+    return [create_proposal(f"provider-{i}") for i in range(10)]
+
+
+def create_plugin(mocker, proposals, negotiation_delays, **kwargs) -> NegotiatingPlugin:
+    plugin = NegotiatingPlugin(**kwargs)
+    plugin.set_proposal_callback(AsyncMock(side_effect=proposals))
+
+    async def negotiate_proposal(demand_data, proposal):
+        await asyncio.sleep(negotiation_delays[proposals.index(proposal)])
+        return proposal
+
+    mocker.patch.object(plugin, "_negotiate_proposal", side_effect=negotiate_proposal)
+    return plugin
+
+
+async def test_negotiating_plugin_sequential(mocker, proposals):
+    plugin = create_plugin(mocker, proposals, [0.2, 0.01, 0.01])
+
+    assert await plugin.get_proposal() is proposals[0]
+    assert await plugin.get_proposal() is proposals[1]
+
+
+async def test_negotiating_plugin_concurrent_skips_slow_negotiations(mocker, proposals):
+    plugin = create_plugin(
+        mocker, proposals, [10, 10, 0.02, 10, 0.01, 0.03, 0.01], negotiation_concurrency=5
+    )
+    await plugin.start()
+
+    received = await asyncio.wait_for(
+        asyncio.gather(plugin.get_proposal(), plugin.get_proposal(), plugin.get_proposal()),
+        timeout=1,
+    )
+
+    assert set(received) == {proposals[2], proposals[4], proposals[6]}
+    #   Remaining negotiations are surplus once all the requests are served
+    await asyncio.sleep(0)
+    assert not plugin._negotiation_tasks
+
+    await plugin.stop()
+
+
+async def test_negotiating_plugin_concurrent_propagates_errors(mocker, proposals):
+    plugin = create_plugin(
+        mocker, [proposals[0], RuntimeError("no more proposals")], [10], negotiation_concurrency=2
+    )
+
+    with pytest.raises(RuntimeError, match="no more proposals"):
+        await asyncio.wait_for(plugin.get_proposal(), timeout=1)
+
+    await plugin.stop()
+
+    assert not plugin._negotiation_tasks
+
+
+async def test_negotiating_plugin_caps_pending_counter_proposals(mocker, proposals):
+    plugin = NegotiatingPlugin(negotiation_concurrency=4, max_pending_counter_proposals=2)
+    plugin.set_proposal_callback(AsyncMock(side_effect=proposals))
+    pending_counter_proposals = []
+    max_pending_counter_proposals = 0
+
+    async def send_demand_proposal(offer_proposal, demand_data):
+        nonlocal max_pending_counter_proposals
+        pending_counter_proposals.append(offer_proposal)
+        max_pending_counter_proposals = max(
+            max_pending_counter_proposals, len(pending_counter_proposals)
+        )
+        return offer_proposal
+
+    async def wait_for_proposal_response(demand_proposal):
+        await asyncio.sleep(0.01)
+        pending_counter_proposals.remove(demand_proposal)
+        demand_proposal.initial = False
+        return demand_proposal
+
+    mocker.patch.object(plugin, "_send_demand_proposal", side_effect=send_demand_proposal)
+    mocker.patch.object(
+        plugin, "_wait_for_proposal_response", side_effect=wait_for_proposal_response
+    )
+
+    received = await asyncio.wait_for(
+        asyncio.gather(*[plugin.get_proposal() for _ in range(4)]), timeout=1
+    )
+
+    assert len(set(received)) == 4
+    assert max_pending_counter_proposals == 2
+
+    await plugin.stop()
+
+
+async def test_negotiating_plugin_concurrent_ignores_surplus_errors(mocker, proposals):
+    async def get_proposal():
+        if get_proposal_mock.await_count == 1:
+            return proposals[0]
+
+        await asyncio.sleep(0.05)
+        raise RuntimeError("no more proposals")
+
+    get_proposal_mock = AsyncMock(side_effect=get_proposal)
+    plugin = create_plugin(mocker, proposals, [10], negotiation_concurrency=2)
+    plugin.set_proposal_callback(get_proposal_mock)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(plugin.get_proposal(), timeout=0.01)
+
+    await asyncio.sleep(0.1)
+
+    #   Error of negotiation nobody waits for is not raised to the next request
+    assert plugin._negotiated_proposals.empty()
+
+    await plugin.stop()
+
+
+async def test_negotiating_plugin_concurrent_skips_expired_proposals(mocker, proposals):
+    proposals[0].get_expiration_date.return_value = utc_now() - timedelta(seconds=1)
+    plugin = create_plugin(mocker, proposals, [0, 10] + [0] * 8, negotiation_concurrency=2)
+
+    assert await asyncio.wait_for(plugin.get_proposal(), timeout=1) is proposals[2]
+
+    await plugin.stop()
+
+
+async def test_negotiating_plugin_rejects_responses_to_cancelled_negotiations(mocker, proposals):
+    plugin = NegotiatingPlugin(negotiation_concurrency=2)
+    plugin.set_proposal_callback(AsyncMock(side_effect=proposals))
+    responses = {}
+
+    async def wait_for_proposal_response(demand_proposal):
+        await asyncio.sleep(0.01 if demand_proposal is proposals[0] else 0.05)
+        response = responses[demand_proposal] = create_proposal(f"response-{demand_proposal}")
+        response.initial = False
+        return response
+
+    mocker.patch.object(plugin, "_send_demand_proposal", AsyncMock(side_effect=lambda p, _: p))
+    mocker.patch.object(
+        plugin, "_wait_for_proposal_response", side_effect=wait_for_proposal_response
+    )
+    reject_proposal_mock = mocker.patch.object(plugin, "_reject_proposal", AsyncMock())
+
+    assert await asyncio.wait_for(plugin.get_proposal(), timeout=1) is responses[proposals[0]]
+
+    await asyncio.sleep(0.1)
+
+    reject_proposal_mock.assert_awaited_once_with(responses[proposals[1]])
+
+    await plugin.stop()
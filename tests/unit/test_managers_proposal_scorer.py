@@ -1,3 +1,5 @@
+import asyncio
+from collections import defaultdict
 from datetime import timedelta
 from typing import Dict, Iterable, Sequence, Tuple
 from unittest.mock import AsyncMock
@@ -6,18 +8,30 @@ import pytest
 
 from golem.managers import (
     LinearAverageCostPricing,
+    LinearCoeffsCost,
+    LinearPerCpuAverageCostPricing,
     MapScore,
     PropertyValueLerpScore,
     ProposalScorer,
+    ProposalScoringBuffer,
     ProposalScoringMixin,
+    ProposalTable,
 )
-from golem.payload import defaults
+from golem.payload import PayloadSyntaxParser, defaults
+from golem.resources import Proposal
 
 
 class FooBarProposalScorer(ProposalScoringMixin):
     ...
 
 
+@pytest.fixture
+def golem():
+    golem = AsyncMock()
+    golem._resources = defaultdict(dict)
+    return golem
+
+
 @pytest.mark.parametrize(
     "given_plugins, properties, expected_weights",
     (
@@ -92,16 +106,16 @@ class FooBarProposalScorer(ProposalScoringMixin):
     ),
 )
 async def test_weight_proposal_scoring_plugins_mixin_ok(
+    golem,
     yagna_proposal,
     given_plugins: Sequence[Tuple[float, ProposalScorer]],
     properties: Iterable[Dict],
     expected_weights: Sequence[float],
 ):
     given_proposals = []
-    for props in properties:
-        proposal = AsyncMock()
-        proposal.get_data.return_value = yagna_proposal(properties=props)
-        given_proposals.append(proposal)
+    for i, props in enumerate(properties):
+        data = yagna_proposal(properties=props)
+        given_proposals.append(Proposal(golem, f"proposal-{i}", data))
 
     scorer = FooBarProposalScorer(proposal_scorers=given_plugins)
     received_proposals = await scorer.do_scoring(given_proposals)
@@ -111,3 +125,228 @@ async def test_weight_proposal_scoring_plugins_mixin_ok(
         assert (
             abs(expected_weight - received_weight) <= 0.000000001
         ), f"{expected_weight} != {received_weight}"
+
+
+async def test_proposal_scoring_mixin_reuses_proposal_data(mocker, golem, yagna_proposal):
+    given_proposals = [
+        Proposal(golem, f"proposal-{i}", yagna_proposal(properties={defaults.PROP_INF_MEM: i}))
+        for i in range(20)
+    ]
+    get_data_spy = mocker.spy(Proposal, "get_data")
+    parse_constraints_spy = mocker.spy(PayloadSyntaxParser.get_instance(), "parse_constraints")
+
+    scorer = FooBarProposalScorer(
+        proposal_scorers=[PropertyValueLerpScore(defaults.PROP_INF_MEM, zero_at=0, one_at=19)],
+        proposal_data_fetch_concurrency=3,
+    )
+    first_scoring = await scorer.do_scoring(given_proposals)
+    second_scoring = await scorer.do_scoring(given_proposals)
+
+    assert get_data_spy.call_count == len(given_proposals)
+    #   Scorers don't read constraints, so they are never parsed
+    assert parse_constraints_spy.call_count == 0
+    assert [proposal for _, proposal in first_scoring] == given_proposals[::-1]
+    assert first_scoring == second_scoring
+
+
+def _get_vectorized_scoring_plugins(with_regular_scorer: bool):
+    plugins = [
+        (0.5, PropertyValueLerpScore(defaults.PROP_INF_MEM, zero_at=1, one_at=5)),
+        (
+            1.0,
+            MapScore(
+                LinearAverageCostPricing(
+                    average_cpu_load=1, average_duration=timedelta(seconds=60)
+                ),
+                normalize=True,
+                normalize_flip=True,
+            ),
+        ),
+        (
+            2.0,
+            MapScore(
+                LinearPerCpuAverageCostPricing(
+                    average_cpu_load=1, average_duration=timedelta(seconds=60)
+                ),
+                normalize=True,
+            ),
+        ),
+        (0.7, MapScore(LinearCoeffsCost("price_cpu_sec"))),
+    ]
+
+    if with_regular_scorer:
+        plugins.append((0.3, MapScore(lambda proposal_data: 1.0)))
+
+    return plugins
+
+
+def _get_vectorized_scoring_properties():
+    properties = []
+    for i in range(8):
+        props = {
+            defaults.PROP_INF_MEM: i,
+            defaults.PROP_INF_CPU_THREADS: i % 3,
+            "golem.com.usage.vector": ["golem.usage.cpu_sec", "golem.usage.duration_sec"],
+            "golem.com.pricing.model.linear.coeffs": [0.1 * i, 0.2, 0.3 * (i % 4)],
+        }
+        if i == 3:
+            props[defaults.PROP_INF_MEM] = "bad value"
+        if i == 5:
+            props["golem.com.pricing.model"] = "fixed"
+        properties.append(props)
+
+    return properties
+
+
+@pytest.mark.parametrize("with_regular_scorer", (True, False))
+async def test_proposal_scoring_mixin_vectorized_scoring_matches_regular(
+    mocker, golem, yagna_proposal, with_regular_scorer
+):
+    pytest.importorskip("numpy")
+
+    given_proposals = [
+        Proposal(golem, f"proposal-{i}", yagna_proposal(properties=props))
+        for i, props in enumerate(_get_vectorized_scoring_properties())
+    ]
+    scorer = FooBarProposalScorer(
+        proposal_scorers=_get_vectorized_scoring_plugins(with_regular_scorer)
+    )
+
+    vectorized_scoring = await scorer.do_scoring(given_proposals)
+
+    mocker.patch(
+        "golem.managers.proposal.plugins.scoring.mixins.is_numpy_available", return_value=False
+    )
+    regular_scoring = await scorer.do_scoring(given_proposals)
+
+    assert [proposal for _, proposal in vectorized_scoring] == [
+        proposal for _, proposal in regular_scoring
+    ]
+    for (vectorized_score, _), (regular_score, _) in zip(vectorized_scoring, regular_scoring):
+        assert vectorized_score == pytest.approx(regular_score)
+
+
+async def test_proposal_scoring_mixin_without_numpy_uses_regular_scoring(
+    mocker, golem, yagna_proposal
+):
+    mocker.patch(
+        "golem.managers.proposal.plugins.scoring.mixins.is_numpy_available", return_value=False
+    )
+    score_table_spy = mocker.spy(PropertyValueLerpScore, "score_table")
+    given_proposals = [
+        Proposal(golem, f"proposal-{i}", yagna_proposal(properties={defaults.PROP_INF_MEM: i}))
+        for i in range(3)
+    ]
+
+    scorer = FooBarProposalScorer(
+        proposal_scorers=[PropertyValueLerpScore(defaults.PROP_INF_MEM, zero_at=0, one_at=2)]
+    )
+    received_proposals = await scorer.do_scoring(given_proposals)
+
+    assert score_table_spy.call_count == 0
+    assert received_proposals == [
+        (1.0, given_proposals[2]),
+        (0.5, given_proposals[1]),
+        (0.0, given_proposals[0]),
+    ]
+
+
+async def test_proposal_table_columns(golem, yagna_proposal):
+    np = pytest.importorskip("numpy")
+
+    proposals_data = [
+        await Proposal(golem, f"proposal-{i}", yagna_proposal(properties=props)).get_proposal_data()
+        for i, props in enumerate(_get_vectorized_scoring_properties())
+    ]
+    table = ProposalTable(proposals_data)
+
+    assert len(table) == 8
+    mem_column = table.get_property_column(defaults.PROP_INF_MEM)
+    assert np.isnan(mem_column[3])
+    assert mem_column[4] == 4.0
+    assert table.get_property_column(defaults.PROP_INF_MEM) is mem_column
+
+    cpu_sec_column = table.get_linear_coeffs_column("price_cpu_sec")
+    assert np.isnan(cpu_sec_column[5])
+    assert cpu_sec_column[4] == pytest.approx(0.4)
+
+
+def _create_proposal_scoring_buffer(golem, yagna_proposal, proposal_scorers, max_size):
+    proposals: asyncio.Queue[Proposal] = asyncio.Queue()
+
+    def put_proposals(mems):
+        for mem in mems:
+            proposals.put_nowait(
+                Proposal(
+                    golem,
+                    f"proposal-{mem}",
+                    yagna_proposal(properties={defaults.PROP_INF_MEM: mem}),
+                )
+            )
+
+    buffer = ProposalScoringBuffer(
+        min_size=0,
+        max_size=max_size,
+        fill_at_start=True,
+        scoring_debounce=timedelta(seconds=60),
+        proposal_scorers=proposal_scorers,
+    )
+    buffer.set_proposal_callback(proposals.get)
+    return buffer, put_proposals
+
+
+async def test_proposal_scoring_buffer_scores_new_proposals_incrementally(golem, yagna_proposal):
+    buffer, put_proposals = _create_proposal_scoring_buffer(
+        golem,
+        yagna_proposal,
+        [PropertyValueLerpScore(defaults.PROP_INF_MEM, zero_at=0, one_at=10)],
+        max_size=4,
+    )
+    assert buffer.is_incremental_scoring_possible()
+
+    await buffer.start()
+    try:
+        #   No debounce is applied, as new proposals don't affect already scored ones
+        put_proposals([2])
+        first_proposal = await asyncio.wait_for(buffer.get_proposal(), timeout=1)
+
+        put_proposals([4, 8])
+        await asyncio.sleep(0.01)
+        put_proposals([6])
+        await asyncio.sleep(0.01)
+
+        proposals = [await asyncio.wait_for(buffer.get_proposal(), timeout=1) for _ in range(3)]
+    finally:
+        await buffer.stop()
+
+    assert first_proposal.id == "proposal-2"
+    assert [proposal.id for proposal in proposals] == ["proposal-8", "proposal-6", "proposal-4"]
+
+
+async def test_proposal_scoring_buffer_rescores_all_proposals_with_stateful_scorer(
+    golem, yagna_proposal
+):
+    scorers = [
+        MapScore(
+            lambda proposal_data: proposal_data.properties[defaults.PROP_INF_MEM], normalize=True
+        )
+    ]
+    buffer, put_proposals = _create_proposal_scoring_buffer(
+        golem, yagna_proposal, scorers, max_size=4
+    )
+    assert not buffer.is_incremental_scoring_possible()
+
+    await buffer.start()
+    try:
+        #   All the requested proposals are collected before scoring
+        put_proposals([2, 8, 4, 6])
+        proposals = [await asyncio.wait_for(buffer.get_proposal(), timeout=1) for _ in range(4)]
+    finally:
+        await buffer.stop()
+
+    assert [proposal.id for proposal in proposals] == [
+        "proposal-8",
+        "proposal-6",
+        "proposal-4",
+        "proposal-2",
+    ]
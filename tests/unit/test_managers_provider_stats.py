@@ -0,0 +1,200 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from golem.managers import (
+    ProviderStats,
+    ProviderStatsManager,
+    ProviderStatsScore,
+    SqliteProviderStatsStore,
+)
+from golem.managers.base import WorkResult
+from golem.resources import BatchFinished, NewActivity, NewAgreement, NewInvoice, ProposalData
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def golem():
+    golem = MagicMock()
+    golem.event_bus = AsyncMock()
+    return golem
+
+
+def test_sqlite_provider_stats_store(tmp_path):
+    store = SqliteProviderStatsStore(tmp_path / "stats.db")
+    assert store.load() == {}
+
+    store.add([ProviderStats("a", works_count=2, works_seconds=3.0), ProviderStats("b", cost=1.5)])
+    store.add([ProviderStats("a", works_count=1, works_failed_count=1, cost=0.5)])
+    store.close()
+
+    assert SqliteProviderStatsStore(tmp_path / "stats.db").load() == {
+        "a": ProviderStats("a", works_count=3, works_failed_count=1, works_seconds=3.0, cost=0.5),
+        "b": ProviderStats("b", cost=1.5),
+    }
+
+
+def test_provider_stats_averages():
+    stats = ProviderStats("a")
+    assert stats.deploy_time is None
+    assert stats.work_duration is None
+    assert stats.failure_rate is None
+    assert stats.cost_per_work is None
+
+    stats.add(
+        ProviderStats(
+            "a",
+            deploys_count=2,
+            deploys_failed_count=1,
+            deploys_seconds=10.0,
+            works_count=3,
+            works_failed_count=1,
+            works_seconds=30.0,
+            cost=4.0,
+        )
+    )
+
+    assert stats.deploy_time == timedelta(seconds=10)
+    assert stats.work_duration == timedelta(seconds=15)
+    assert stats.failure_rate == 2 / 5
+    assert stats.cost_per_work == 2.0
+
+
+async def test_provider_stats_manager_collects_stats_from_events(mocker, golem, tmp_path):
+    now = mocker.patch("golem.managers.provider_stats.manager.utc_now", return_value=START)
+
+    agreement = MagicMock(id="agreement", has_parent=True)
+    agreement.proposal.get_provider_id = AsyncMock(return_value="provider")
+    activity = MagicMock(id="activity", has_parent=True, agreement=agreement)
+    deploy_batch = MagicMock(id="batch", has_parent=True, success=True)
+    #   `parent` can't be given to mock constructor
+    deploy_batch.parent = activity
+    invoice = MagicMock()
+    invoice.get_data = AsyncMock(return_value=MagicMock(issuer_id="provider", amount="0.3"))
+
+    manager = ProviderStatsManager(golem, SqliteProviderStatsStore(tmp_path / "stats.db"))
+    await manager.start()
+    try:
+        await manager._handle_new_agreement(NewAgreement(agreement))
+        await manager._handle_new_activity(NewActivity(activity))
+
+        now.return_value = START + timedelta(seconds=5)
+        await manager._handle_batch_finished(BatchFinished(deploy_batch))
+
+        #   Batches after the deploy are not works, work manager reports them instead
+        await manager._handle_batch_finished(BatchFinished(deploy_batch))
+
+        async def succeeding_work(context):
+            await asyncio.sleep(0.01)
+
+        async def failing_work(context):
+            raise RuntimeError()
+
+        async def work_with_failed_result(context):
+            return WorkResult(exception=RuntimeError())
+
+        async def do_work(work):
+            try:
+                return WorkResult(result=await work(MagicMock(activity=activity)))
+            except Exception as e:
+                return WorkResult(exception=e)
+
+        do_work_with_plugin = manager.work_plugin(do_work)
+        for work in (succeeding_work, failing_work, work_with_failed_result):
+            await do_work_with_plugin(work)
+
+        await manager._handle_new_invoice(NewInvoice(invoice))
+    finally:
+        await manager.stop()
+
+    expected_stats = ProviderStats(
+        "provider",
+        deploys_count=1,
+        deploys_seconds=5.0,
+        works_count=3,
+        works_failed_count=2,
+        works_seconds=0.0,
+        cost=0.3,
+    )
+    stats = manager.get_provider_stats("provider")
+    assert stats is not None
+    #   Only successful works are measured
+    assert 0.01 <= stats.works_seconds < 0.1
+    expected_stats.works_seconds = stats.works_seconds
+    assert stats == expected_stats
+
+    #   Statistics are saved on stop and loaded by the next run
+    next_manager = ProviderStatsManager(golem, SqliteProviderStatsStore(tmp_path / "stats.db"))
+    await next_manager.start()
+    try:
+        assert next_manager.get_provider_stats("provider") == expected_stats
+
+        next_manager.record_cost("provider", Decimal("0.1"))
+        next_stats = next_manager.get_provider_stats("provider")
+        assert next_stats is not None
+        assert next_stats.cost == pytest.approx(0.4)
+    finally:
+        await next_manager.stop()
+
+    assert SqliteProviderStatsStore(tmp_path / "stats.db").load()["provider"].cost == pytest.approx(
+        0.4
+    )
+
+
+def test_provider_stats_score():
+    stats = {
+        #   1 work per 10s, for 1 GLM each
+        "slow": ProviderStats("slow", works_count=2, works_seconds=20.0, cost=2.0),
+        #   1 work per 5s with half of them failed, for 1 GLM each
+        "failing": ProviderStats(
+            "failing", works_count=4, works_failed_count=2, works_seconds=10.0, cost=2.0
+        ),
+        #   1 work per 5s, for 0.5 GLM each
+        "best": ProviderStats("best", works_count=2, works_seconds=10.0, cost=1.0),
+        "unpaid": ProviderStats("unpaid", works_count=2, works_seconds=10.0),
+    }
+    provider_stats = MagicMock()
+    provider_stats.get_provider_stats.side_effect = stats.get
+
+    proposals_data = [
+        MagicMock(spec=ProposalData, issuer_id=issuer_id)
+        for issuer_id in ("slow", "failing", "best", "unpaid", "unknown")
+    ]
+
+    assert ProviderStatsScore(provider_stats)(proposals_data) == [
+        pytest.approx(0.25),
+        pytest.approx(0.25),
+        1.0,
+        None,
+        None,
+    ]
+    assert (
+        ProviderStatsScore(provider_stats, min_works_count=3, unknown_score=0.5)(proposals_data)
+        == [0.5] * 5
+    )
+
+
+async def test_provider_stats_manager_keeps_changes_until_saved(mocker, golem, tmp_path):
+    store = SqliteProviderStatsStore(tmp_path / "stats.db")
+    manager = ProviderStatsManager(golem, store)
+    await manager.start()
+    try:
+        store_add = mocker.patch.object(store, "add", side_effect=[RuntimeError("locked"), None])
+
+        manager.record_cost("provider", Decimal("0.1"))
+        await manager._flush()
+
+        manager.record_cost("provider", Decimal("0.2"))
+        await manager._flush()
+
+        assert store_add.call_count == 2
+        [stats_change] = store_add.call_args.args[0]
+        assert stats_change.provider_id == "provider"
+        assert stats_change.cost == pytest.approx(0.3)
+        assert not manager._stats_changes
+    finally:
+        await manager.stop()
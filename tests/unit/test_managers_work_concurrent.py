@@ -0,0 +1,77 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from golem.managers import ConcurrentWorkManager
+
+
+def create_work(delay, value):
+    async def work(context):
+        await asyncio.sleep(delay)
+        return value
+
+    return work
+
+
+def create_work_manager(size):
+    return ConcurrentWorkManager(MagicMock(), AsyncMock(return_value=AsyncMock()), size=size)
+
+
+async def test_concurrent_work_manager_do_work_list_keeps_order():
+    work_manager = create_work_manager(size=3)
+    works = [create_work(delay, value) for value, delay in enumerate([0.03, 0.01, 0.02])]
+
+    results = await work_manager.do_work_list(works)
+    assert [result.result for result in results] == [0, 1, 2]
+
+    #   Results of previous calls are not returned again
+    results = await work_manager.do_work_list(works[:1])
+    assert [result.result for result in results] == [0]
+
+
+@pytest.mark.parametrize("ordered, expected_values", ((False, [1, 2, 0]), (True, [0, 1, 2])))
+async def test_concurrent_work_manager_do_work_iter(ordered, expected_values):
+    work_manager = create_work_manager(size=3)
+    works = [create_work(delay, value) for value, delay in enumerate([0.03, 0.01, 0.02])]
+
+    async def generate_works():
+        for work in works:
+            yield work
+
+    values = [
+        result.result async for result in work_manager.do_work_iter(generate_works(), ordered)
+    ]
+    assert values == expected_values
+
+
+async def test_concurrent_work_manager_do_work_iter_pulls_works_lazily():
+    work_manager = create_work_manager(size=2)
+    pulled_count = 0
+
+    async def generate_works():
+        nonlocal pulled_count
+
+        for value in range(100):
+            pulled_count += 1
+            yield create_work(0, value)
+
+    results = work_manager.do_work_iter(generate_works(), max_pending_count=4)
+    values = [(await results.__anext__()).result for _ in range(3)]
+    await asyncio.sleep(0.01)
+
+    assert sorted(values) == [0, 1, 2]
+    #   Only consumed results and ones that fit into pending limit are pulled
+    assert pulled_count == 3 + 4
+
+    await results.aclose()
+
+
+async def test_concurrent_work_manager_do_work_iter_reports_errors():
+    work_manager = create_work_manager(size=2)
+
+    async def failing_work(context):
+        raise RuntimeError("failed")
+
+    results = [result async for result in work_manager.do_work_iter([failing_work])]
+    assert isinstance(results[0].exception, RuntimeError)
@@ -0,0 +1,184 @@
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from golem.managers.base import ManagerException
+from golem.managers.work.packing import PackedWorkContext, _ScriptPacker
+from golem.resources import BatchError, BatchTimeoutError, CommandCancelled, CommandFailed
+from golem.resources.activity import commands
+
+
+def create_activity(*script_handlers):
+    executed_scripts = []
+    handlers = iter(script_handlers)
+
+    async def execute_script(script):
+        executed_scripts.append(list(script.commands))
+        next(handlers)(script.futures)
+
+        batch = MagicMock()
+        batch.wait = AsyncMock()
+        return batch
+
+    activity = MagicMock()
+    activity.execute_script = execute_script
+    return activity, executed_scripts
+
+
+def succeed_all(futures):
+    for future in futures:
+        future.set_result(MagicMock())
+
+
+def create_failed_batch():
+    return MagicMock(events=[MagicMock(index=0, message="failed")])
+
+
+async def test_script_packer_flushes_when_all_works_are_blocked():
+    activity, executed_scripts = create_activity(succeed_all)
+    packer = _ScriptPacker(activity, 2, timedelta(hours=1))
+    packer_task = asyncio.create_task(packer.run())
+
+    first = packer.add_command(commands.Run("echo 1"), "first")
+    packer.set_work_blocked(True)
+    await asyncio.sleep(0.01)
+
+    #   Second work is still running, so commands are not executed yet
+    assert not executed_scripts
+
+    second = packer.add_command(commands.Run("echo 2"), "second")
+    packer.set_work_blocked(True)
+    await asyncio.wait_for(asyncio.gather(first, second), timeout=1)
+
+    assert len(executed_scripts) == 1
+    assert len(executed_scripts[0]) == 2
+
+    packer.set_work_finished()
+    packer.set_work_finished()
+    await asyncio.wait_for(packer_task, timeout=1)
+
+
+async def test_script_packer_flushes_after_delay():
+    activity, executed_scripts = create_activity(succeed_all)
+    packer = _ScriptPacker(activity, 2, timedelta(milliseconds=100))
+    packer_task = asyncio.create_task(packer.run())
+
+    future = packer.add_command(commands.Run("echo 1"), "work")
+    await asyncio.sleep(0.05)
+
+    assert not executed_scripts
+
+    await asyncio.wait_for(future, timeout=1)
+
+    assert len(executed_scripts) == 1
+
+    packer.set_work_finished()
+    packer.set_work_finished()
+    await asyncio.wait_for(packer_task, timeout=1)
+
+
+async def test_script_packer_requeues_cancelled_commands():
+    batch = create_failed_batch()
+
+    def fail_first(futures):
+        futures[0].set_exception(CommandFailed(batch))
+        futures[1].set_exception(CommandCancelled(batch))
+
+    activity, executed_scripts = create_activity(fail_first, succeed_all)
+    packer = _ScriptPacker(activity, 2, timedelta(hours=1))
+    packer_task = asyncio.create_task(packer.run())
+
+    failed = packer.add_command(commands.Run("false"), "failed")
+    cancelled = packer.add_command(commands.Run("echo 2"), "cancelled")
+    packer.set_work_blocked(True)
+    packer.set_work_blocked(True)
+
+    with pytest.raises(CommandFailed):
+        await asyncio.wait_for(failed, timeout=1)
+
+    await asyncio.wait_for(cancelled, timeout=1)
+
+    assert len(executed_scripts) == 2
+    assert executed_scripts[1] == executed_scripts[0][1:]
+
+    packer.set_work_finished()
+    packer.set_work_finished()
+    await asyncio.wait_for(packer_task, timeout=1)
+
+
+async def test_script_packer_fails_commands_after_failed_command_of_the_same_work():
+    batch = create_failed_batch()
+
+    def fail_first(futures):
+        futures[0].set_exception(CommandFailed(batch))
+        for future in futures[1:]:
+            future.set_exception(CommandCancelled(batch))
+
+    activity, executed_scripts = create_activity(fail_first, succeed_all)
+    packer = _ScriptPacker(activity, 2, timedelta(hours=1))
+    packer_task = asyncio.create_task(packer.run())
+
+    failed = packer.add_command(commands.Run("false"), "failed")
+    cancelled = packer.add_command(commands.Run("echo 2"), "cancelled")
+    failed_next = packer.add_command(commands.Run("echo 3"), "failed")
+    packer.set_work_blocked(True)
+    packer.set_work_blocked(True)
+
+    with pytest.raises(CommandFailed):
+        await asyncio.wait_for(failed, timeout=1)
+
+    with pytest.raises(CommandCancelled):
+        await asyncio.wait_for(failed_next, timeout=1)
+
+    await asyncio.wait_for(cancelled, timeout=1)
+
+    #   Only command of the other work is executed again
+    assert len(executed_scripts) == 2
+    assert executed_scripts[1] == executed_scripts[0][1:2]
+
+    packer.set_work_finished()
+    packer.set_work_finished()
+    await asyncio.wait_for(packer_task, timeout=1)
+
+
+async def test_packed_command_batch_raises_batch_timeout_error():
+    async def wait(ignore_errors):
+        await asyncio.Event().wait()
+
+    activity = MagicMock()
+    activity.execute_script = AsyncMock(return_value=MagicMock(wait=wait))
+    packer = _ScriptPacker(activity, 1, timedelta(hours=1))
+    packer_task = asyncio.create_task(packer.run())
+    context = PackedWorkContext(activity, packer)
+
+    batch = await context.run("sleep 10")
+
+    with pytest.raises(BatchTimeoutError):
+        await batch.wait(timeout=0.01)
+
+    packer_task.cancel()
+
+
+async def test_packed_work_context_ignores_batch_errors():
+    def fail_all(futures):
+        for future in futures:
+            future.set_exception(BatchError(create_failed_batch()))
+
+    activity, _ = create_activity(fail_all)
+    packer = _ScriptPacker(activity, 1, timedelta(hours=1))
+    packer_task = asyncio.create_task(packer.run())
+    context = PackedWorkContext(activity, packer)
+
+    batch = await context.run("echo 1")
+    assert await asyncio.wait_for(batch.wait(ignore_errors=True), timeout=1) == []
+
+    with pytest.raises(ManagerException):
+        await context.run("echo 2", timeout=1)
+
+    with pytest.raises(ManagerException):
+        await context.terminate()
+
+    packer.set_work_finished()
+    await asyncio.wait_for(packer_task, timeout=1)
@@ -0,0 +1,76 @@
+import asyncio
+from typing import List
+
+from golem.managers import WorkResult, speculative_execution
+
+
+async def test_speculative_execution_starts_copy_of_straggler():
+    delays = [0.01] * 4 + [1.0, 0.01]
+    calls: List[float] = []
+
+    async def do_work(work) -> WorkResult:
+        delay = delays[len(calls)]
+        calls.append(delay)
+        await asyncio.sleep(delay)
+        return WorkResult(result=delay)
+
+    do_work_speculative = speculative_execution(quantile=0.5, min_samples=4)(do_work)
+
+    for _ in range(4):
+        work_result = await do_work_speculative(None)
+        assert not work_result.extras["speculative_execution"]["speculated"]
+
+    #   Slow work is overtaken by its copy, whose result is returned
+    work_result = await asyncio.wait_for(do_work_speculative(None), timeout=0.5)
+    assert work_result.result == 0.01
+    assert work_result.extras["speculative_execution"]["speculated"]
+    assert calls == delays
+
+
+async def test_speculative_execution_ignores_failed_copy():
+    results = [WorkResult(result="ok")] * 2 + [
+        WorkResult(result="slow"),
+        WorkResult(exception=RuntimeError("failed")),
+    ]
+    delays = [0.01, 0.01, 0.1, 0.01]
+    calls_count = 0
+
+    async def do_work(work) -> WorkResult:
+        nonlocal calls_count
+        index = calls_count
+        calls_count += 1
+        await asyncio.sleep(delays[index])
+        return results[index]
+
+    do_work_speculative = speculative_execution(min_samples=2)(do_work)
+
+    for _ in range(2):
+        await do_work_speculative(None)
+
+    work_result = await do_work_speculative(None)
+    assert work_result.result == "slow"
+    assert work_result.extras["speculative_execution"]["speculated"]
+
+
+async def test_speculative_execution_measures_overtaken_works_from_their_start():
+    delays = [0.02, 0.02, 1.0, 0.0, 0.02]
+    calls_count = 0
+
+    async def do_work(work) -> WorkResult:
+        nonlocal calls_count
+        delay = delays[calls_count]
+        calls_count += 1
+        await asyncio.sleep(delay)
+        return WorkResult(result=delay)
+
+    do_work_speculative = speculative_execution(quantile=0.5, min_samples=2, max_samples=2)(do_work)
+
+    for _ in range(2):
+        await do_work_speculative(None)
+
+    work_result = await asyncio.wait_for(do_work_speculative(None), timeout=0.5)
+    assert work_result.extras["speculative_execution"]["speculated"]
+
+    #   Overtaken work took at least the threshold, not just as long as its fast copy
+    work_result = await do_work_speculative(None)
+    assert 0.01 < work_result.extras["speculative_execution"]["threshold"]
@@ -7,6 +7,7 @@ from golem.payload import (
     PayloadSyntaxParser,
     SyntaxException,
 )
+from golem.payload.parser import _ConstraintsFastParser, _FastParserError
 
 
 @pytest.fixture(scope="module")
@@ -138,3 +139,50 @@ def test_constraint_groups_nested(demand_offer_parser, input_string, output):
     result = demand_offer_parser.parse_constraints(input_string)
 
     assert result == output
+
+
+@pytest.mark.parametrize(
+    "input_string",
+    (
+        "(foo=1)",
+        "(!foo=1)",
+        "(foo=1 )",
+        "( & (foo= 1)\n\t(bar<=2) )",
+        "(&(foo=1)(bar=2))",
+        "(foo=[1,[2, 3]])",
+        "(foo=[])",
+        r"(foo=escaped\2Acharacters)",
+        "(| (& (foo=1) (bar=2)) (! (bat=3)))",
+        "(&\n  (golem.srv.comp.expiration>1792364847609)\n  (golem.node.debug.subnet=public)\n)",
+    ),
+)
+def test_fast_parser_matches_textx(demand_offer_parser, input_string):
+    result = _ConstraintsFastParser(input_string).parse()
+
+    assert result == demand_offer_parser._parse_with_textx(input_string)
+
+
+@pytest.mark.parametrize(
+    "input_string",
+    ("NOT VALID SYNTAX", "(foo=a=b)", '(foo="bar")', "(foo=1)(bar=2)", "(foo.=1)", "(foo=[1,])"),
+)
+def test_fast_parser_rejects_invalid_syntax(input_string):
+    with pytest.raises(_FastParserError):
+        _ConstraintsFastParser(input_string).parse()
+
+
+def test_parse_constraints_cached_results_are_independent():
+    parser = PayloadSyntaxParser()
+    syntax = "(& (foo=[1, 2]) (bar=1))"
+
+    first_result = parser.parse_constraints(syntax)
+    first_constraint = first_result.items[0]
+    assert isinstance(first_constraint, Constraint)
+    first_constraint.value.append("3")
+    first_result.items.append(Constraint("baz", "=", "1"))
+    second_result = parser.parse_constraints(syntax)
+
+    assert second_result == ConstraintGroup(
+        [Constraint("foo", "=", ["1", "2"]), Constraint("bar", "=", "1")]
+    )
+    assert parser._parse_cached.cache_info().hits == 1
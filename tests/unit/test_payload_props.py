@@ -1,3 +1,5 @@
+import pickle
+from copy import deepcopy
 from datetime import datetime, timezone
 from enum import Enum
 
@@ -60,3 +62,77 @@ def test_property_serialize():
             "BAR",
         ],
     }
+
+
+def test_property_copies_are_independent():
+    original_dict = {"foo": "bar", "list_field": [1, [2, 3]], "dict_field": {"a": 1}}
+    props = Properties(original_dict)
+    props_deep_copy = deepcopy(props)
+    props_copy = Properties(props)
+
+    props["list_field"][1].append(4)
+    props_deep_copy["dict_field"]["b"] = 2
+    props_copy.update(foo="123")
+
+    assert original_dict == {"foo": "bar", "list_field": [1, [2, 3]], "dict_field": {"a": 1}}
+    assert props == {"foo": "bar", "list_field": [1, [2, 3, 4]], "dict_field": {"a": 1}}
+    assert props_deep_copy == {
+        "foo": "bar",
+        "list_field": [1, [2, 3]],
+        "dict_field": {"a": 1, "b": 2},
+    }
+    assert props_copy == {"foo": "123", "list_field": [1, [2, 3]], "dict_field": {"a": 1}}
+
+    props_copy_of_copy = props_copy.copy()
+    for _, value in props_copy.items():
+        if isinstance(value, list):
+            value.append(5)
+
+    assert props_copy["list_field"] == [1, [2, 3], 5]
+    assert props_copy_of_copy["list_field"] == [1, [2, 3]]
+    assert pickle.loads(pickle.dumps(props_copy)) == props_copy
+
+
+def test_property_update_from_properties_shares_values():
+    source_props = Properties({"list_field": [1, 2]})
+    source_props["list_field"].append(3)
+    props = Properties()
+    props.update(source_props)
+
+    props["list_field"].append(4)
+    source_props.get("list_field").append(5)
+
+    assert props["list_field"] == [1, 2, 3, 4]
+    assert source_props["list_field"] == [1, 2, 3, 5]
+
+
+def test_property_copy_is_isolated_from_escaped_value():
+    props = Properties({"list_field": [1, 2], "dict_field": {"a": 1}})
+    list_field = props["list_field"]
+    props_copy = props.copy()
+    props_deep_copy = deepcopy(props)
+
+    list_field.append(3)
+    dict(props)["dict_field"]["b"] = 2
+
+    assert props["list_field"] == [1, 2, 3]
+    assert props_copy["list_field"] == [1, 2]
+    assert props_deep_copy["list_field"] == [1, 2]
+    assert props_copy["dict_field"] == {"a": 1}
+    assert props_deep_copy["dict_field"] == {"a": 1}
+
+
+def test_property_mutated_copy_leaves_original_intact():
+    props = Properties({"list_field": [1, 2]})
+    props_copy = props.copy()
+    merged_props = props | {"foo": "bar"}
+
+    props_copy["list_field"].append(3)
+    merged_props["list_field"].append(4)
+    del props_copy["list_field"]
+    props_copy["list_field"] = [5]
+
+    assert isinstance(merged_props, Properties)
+    assert props == {"list_field": [1, 2]}
+    assert merged_props == {"list_field": [1, 2, 4], "foo": "bar"}
+    assert props_copy == {"list_field": [5]}
@@ -0,0 +1,249 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from ya_payment import ApiException
+
+from golem.managers import (
+    DefaultAgreementManager,
+    DefaultPaymentManager,
+    DefaultProposalManager,
+    MidAgreementPaymentsNegotiator,
+    NegotiatingPlugin,
+    PackingWorkManager,
+    PaymentPlatformNegotiator,
+    RecyclingActivityManager,
+    RefreshingDemandManager,
+    SequentialWorkManager,
+    SingleUseActivityManager,
+    WorkContext,
+)
+from golem.payload import VmPayload
+from golem.resources import CommandFailed, Proposal
+from golem.resources.proposal.exceptions import ProposalRejected
+from tests.simulator import SimulatorConfig, YagnaSimulator, generate_providers
+
+PAYLOAD = VmPayload(package_url="hash:sha3:0123456789abcdef:http://127.0.0.1/image.gvmi")
+
+
+async def _first_initial_proposal(golem, allocation) -> Proposal:
+    demand = await golem.create_demand(PAYLOAD, allocations=[allocation])
+    return await demand.initial_proposals().__anext__()
+
+
+async def test_simulator_managers_stack():
+    config = SimulatorConfig(
+        providers=generate_providers(20, seed=1, command_time=timedelta(milliseconds=100)),
+        debit_note_interval=timedelta(milliseconds=50),
+        seed=1,
+    )
+
+    async def work(context: WorkContext) -> str:
+        batch = await context.run("echo 'hello golem'")
+        await batch.wait()
+        return batch.events[-1].stdout
+
+    async with YagnaSimulator(config) as yagna:
+        golem = yagna.create_node()
+        payment_manager = DefaultPaymentManager(
+            golem, budget=1.0, shutdown_timeout=timedelta(seconds=5)
+        )
+        demand_manager = RefreshingDemandManager(golem, payment_manager.get_allocation, [PAYLOAD])
+        proposal_manager = DefaultProposalManager(
+            golem,
+            demand_manager.get_initial_proposal,
+            plugins=[
+                NegotiatingPlugin(
+                    proposal_negotiators=[
+                        PaymentPlatformNegotiator(),
+                        MidAgreementPaymentsNegotiator(),
+                    ]
+                )
+            ],
+        )
+        agreement_manager = DefaultAgreementManager(golem, proposal_manager.get_draft_proposal)
+        activity_manager = SingleUseActivityManager(golem, agreement_manager.get_agreement)
+        work_manager = SequentialWorkManager(golem, activity_manager.get_activity)
+
+        async with golem:
+            async with payment_manager, demand_manager, proposal_manager, agreement_manager:
+                results = await work_manager.do_work_list([work, work])
+
+        assert [result.result for result in results] == ["hello golem\n", "hello golem\n"]
+        assert yagna.stats.approved_agreements == 2
+        assert yagna.stats.terminated_agreements == 2
+        assert yagna.stats.accepted_invoices == 2
+        assert yagna.stats.debit_notes > 0
+        assert yagna.stats.accepted_debit_notes == yagna.stats.debit_notes
+
+
+@pytest.mark.parametrize(
+    "multi_activity, max_activities_per_agreement, expected_agreements",
+    ((True, None, 1), (True, 2, 2), (False, None, 3)),
+)
+async def test_simulator_recycling_activity_manager(
+    multi_activity, max_activities_per_agreement, expected_agreements
+):
+    providers = generate_providers(1, seed=1)
+    providers[0].multi_activity = multi_activity
+    config = SimulatorConfig(providers=providers, offers_per_provider=3, seed=1)
+
+    async def work(context: WorkContext) -> str:
+        batch = await context.run("echo 'hello golem'")
+        await batch.wait()
+        return batch.events[-1].stdout
+
+    async with YagnaSimulator(config) as yagna:
+        golem = yagna.create_node()
+        payment_manager = DefaultPaymentManager(
+            golem, budget=1.0, shutdown_timeout=timedelta(seconds=5)
+        )
+        demand_manager = RefreshingDemandManager(golem, payment_manager.get_allocation, [PAYLOAD])
+        proposal_manager = DefaultProposalManager(
+            golem,
+            demand_manager.get_initial_proposal,
+            plugins=[NegotiatingPlugin(proposal_negotiators=[PaymentPlatformNegotiator()])],
+        )
+        agreement_manager = DefaultAgreementManager(
+            golem, proposal_manager.get_draft_proposal, terminate_on_activity_closed=False
+        )
+        activity_manager = RecyclingActivityManager(
+            golem,
+            agreement_manager.get_agreement,
+            max_activities_per_agreement=max_activities_per_agreement,
+            agreement_manager=agreement_manager,
+        )
+        work_manager = SequentialWorkManager(golem, activity_manager.get_activity)
+
+        async with golem:
+            async with payment_manager, demand_manager, proposal_manager, agreement_manager:
+                async with activity_manager:
+                    results = await work_manager.do_work_list([work, work, work])
+
+        assert [result.result for result in results] == ["hello golem\n"] * 3
+        assert yagna.stats.activities == 3
+        assert yagna.stats.approved_agreements == expected_agreements
+        assert yagna.stats.terminated_agreements == expected_agreements
+
+
+@pytest.mark.parametrize("command_failure_rate", (0.0, 0.3))
+async def test_simulator_packing_work_manager(command_failure_rate):
+    config = SimulatorConfig(
+        providers=generate_providers(5, seed=1), command_failure_rate=command_failure_rate, seed=3
+    )
+
+    def create_work(text):
+        async def work(context: WorkContext) -> str:
+            batch = await context.run(f"echo '{text}'")
+            await batch.wait()
+            return batch.events[-1].stdout
+
+        return work
+
+    async with YagnaSimulator(config) as yagna:
+        golem = yagna.create_node()
+        payment_manager = DefaultPaymentManager(
+            golem, budget=1.0, shutdown_timeout=timedelta(seconds=5)
+        )
+        demand_manager = RefreshingDemandManager(golem, payment_manager.get_allocation, [PAYLOAD])
+        proposal_manager = DefaultProposalManager(
+            golem,
+            demand_manager.get_initial_proposal,
+            plugins=[NegotiatingPlugin(proposal_negotiators=[PaymentPlatformNegotiator()])],
+        )
+        agreement_manager = DefaultAgreementManager(golem, proposal_manager.get_draft_proposal)
+        activity_manager = SingleUseActivityManager(golem, agreement_manager.get_agreement)
+        work_manager = PackingWorkManager(golem, activity_manager.get_activity, max_pack_size=3)
+
+        async with golem:
+            async with payment_manager, demand_manager, proposal_manager, agreement_manager:
+                async with work_manager:
+                    results = await work_manager.do_work_list(
+                        [create_work(f"hello {i}") for i in range(12)]
+                    )
+
+        if command_failure_rate:
+            #   Commands cancelled by failure of other work are executed again
+            failed_results = [result for result in results if result.exception is not None]
+            assert len(failed_results) == yagna.stats.failed_commands > 0
+            assert all(isinstance(r.exception, CommandFailed) for r in failed_results)
+            return
+
+        assert [result.result for result in results] == [f"hello {i}\n" for i in range(12)]
+        assert yagna.stats.activities == 4
+        #   Single deploy and start batch, and single batch with packed commands per activity
+        assert yagna.stats.batches == 2 * 4
+        assert yagna.stats.commands == 2 * 4 + 12
+
+
+async def test_simulator_offer_volume():
+    config = SimulatorConfig(providers=generate_providers(50, seed=2), offers_per_provider=2)
+
+    async with YagnaSimulator(config) as yagna:
+        async with yagna.create_node() as golem:
+            allocation = await golem.create_allocation(1)
+            demand = await golem.create_demand(PAYLOAD, allocations=[allocation])
+
+            proposals = []
+            async for proposal in demand.initial_proposals():
+                proposals.append(proposal)
+                if len(proposals) == 100:
+                    break
+
+    assert len({await proposal.get_provider_id() for proposal in proposals}) == 50
+    assert yagna.stats.offers == 100
+
+
+async def test_simulator_proposal_rejection():
+    config = SimulatorConfig(providers=generate_providers(1), proposal_rejection_rate=1)
+
+    async with YagnaSimulator(config) as yagna:
+        async with yagna.create_node() as golem:
+            allocation = await golem.create_allocation(1)
+            proposal = await _first_initial_proposal(golem, allocation)
+            our_response = await proposal.respond()
+
+            with pytest.raises(ProposalRejected):
+                await our_response.responses().__anext__()
+
+    assert yagna.stats.rejected_proposals == 1
+
+
+@pytest.mark.parametrize("rejection_rate, approved", ((0, True), (1, False)))
+async def test_simulator_agreement_approval(rejection_rate, approved):
+    config = SimulatorConfig(
+        providers=generate_providers(1),
+        agreement_rejection_rate=rejection_rate,
+        agreement_approval_delay=timedelta(milliseconds=50),
+    )
+
+    async with YagnaSimulator(config) as yagna:
+        async with yagna.create_node() as golem:
+            allocation = await golem.create_allocation(1)
+            proposal = await _first_initial_proposal(golem, allocation)
+            our_response = await proposal.respond()
+            draft = await our_response.responses().__anext__()
+
+            agreement = await draft.create_agreement()
+            await agreement.confirm()
+
+            assert await agreement.wait_for_approval() is approved
+
+
+async def test_simulator_latency_and_api_errors():
+    config = SimulatorConfig(
+        providers=generate_providers(1),
+        latency=timedelta(milliseconds=100),
+        api_error_rate=1,
+    )
+
+    async with YagnaSimulator(config) as yagna:
+        async with yagna.create_node() as golem:
+            start = asyncio.get_running_loop().time()
+            with pytest.raises(ApiException) as exc_info:
+                await golem.create_allocation(1)
+
+            assert asyncio.get_running_loop().time() - start >= 0.1
+            assert exc_info.value.status == 504
+
+        assert yagna.stats.injected_errors >= 1
@@ -4,7 +4,13 @@ from datetime import timedelta
 import pytest
 
 from golem.managers.proposal.plugins.buffer import ProposalBuffer
-from golem.utils.asyncio.buffer import BackgroundFillBuffer, Buffer, ExpirableBuffer, SimpleBuffer
+from golem.utils.asyncio.buffer import (
+    BackgroundFillBuffer,
+    Buffer,
+    ExpirableBuffer,
+    HeapBuffer,
+    SimpleBuffer,
+)
 
 
 @pytest.fixture
@@ -232,6 +238,97 @@ async def test_simple_buffer_wait_for_any_items():
     assert wait_task.done()
 
 
+async def test_simple_buffer_duplicates():
+    item = object()
+    buffer = SimpleBuffer(["a", item, "b", item, "a"])
+
+    await buffer.remove("a")
+    await buffer.remove(item)
+    assert await buffer.get() == "b"
+    await buffer.put("b")
+
+    assert await buffer.get_all() == [item, "a", "b"]
+
+    with pytest.raises(ValueError):
+        await buffer.remove(item)
+
+
+async def test_simple_buffer_unhashable_items():
+    buffer = SimpleBuffer([["a"], "b", ["c"], ["a"]])
+
+    await buffer.remove(["a"])
+    assert await buffer.get() == "b"
+
+    with pytest.raises(ValueError):
+        await buffer.remove(["b"])
+
+    assert await buffer.get_all() == [["c"], ["a"]]
+
+
+async def test_heap_buffer_keeps_items_ordered_by_key():
+    buffer = HeapBuffer(key=len, items=["ccc", "a"])
+    assert buffer.size() == 2
+
+    await buffer.put("bb")
+    await buffer.put("dd")
+
+    assert await buffer.get() == "a"
+    assert await buffer.get_all() == ["bb", "dd", "ccc"]
+    assert buffer.size() == 0
+
+    await buffer.put_all(["eee", "f"])
+
+    assert await buffer.get() == "f"
+    assert await buffer.get() == "eee"
+
+
+async def test_heap_buffer_remove():
+    buffer = HeapBuffer(key=int, items=["3", "1", "2", "4"])
+
+    await buffer.remove("1")
+    await buffer.remove("4")
+
+    with pytest.raises(ValueError):
+        await buffer.remove("1")
+
+    assert await buffer.get_all() == ["2", "3"]
+
+
+async def test_heap_buffer_skips_removed_items():
+    buffer = HeapBuffer(key=lambda item: item[0], items=[(i, str(i)) for i in range(10)])
+    buffer_with_unhashable = HeapBuffer(key=len, items=[["a"], ["b", "c"], ["a"]])
+
+    for i in range(0, 10, 2):
+        await buffer.remove((i, str(i)))
+    await buffer_with_unhashable.remove(["a"])
+
+    assert buffer.size() == 5
+    assert await buffer.get() == (1, "1")
+    await buffer.put((0, "0"))
+    assert [await buffer.get() for _ in range(3)] == [(0, "0"), (3, "3"), (5, "5")]
+    assert await buffer.get_all() == [(7, "7"), (9, "9")]
+
+    assert buffer_with_unhashable.size() == 2
+    assert await buffer_with_unhashable.get_all() == [["a"], ["b", "c"]]
+
+
+async def test_heap_buffer_get_waits_for_items():
+    buffer = HeapBuffer(key=len)
+
+    get_task = asyncio.create_task(buffer.get())
+    await asyncio.sleep(0.01)
+    assert not get_task.done()
+
+    await buffer.put("a")
+
+    assert await asyncio.wait_for(get_task, timeout=1) == "a"
+
+    await buffer.set_exception(ZeroDivisionError())
+
+    with pytest.raises(ZeroDivisionError):
+        await buffer.get()
+
+
 async def test_expirable_buffer_is_not_expiring_initial_items(mocked_buffer):
     expire_after = timedelta(seconds=0.1)
     ExpirableBuffer(
@@ -345,6 +442,54 @@ async def test_expirable_buffer_can_expire_items_with_put_all_get_all(mocked_buf
     assert mocker.call(items_put_all[2]) in on_expire.mock_calls
 
 
+async def test_expirable_buffer_expires_items_without_task_per_item(mocker):
+    on_expire = mocker.AsyncMock()
+    buffer = ExpirableBuffer(
+        SimpleBuffer(),
+        lambda i: timedelta(seconds=0.05 * i),
+        on_expire,
+    )
+    tasks_count = len(asyncio.all_tasks())
+
+    for item in (3, 1, 2, 100):
+        await buffer.put(item)
+
+    assert len(asyncio.all_tasks()) == tasks_count
+
+    await buffer.remove(2)
+    await asyncio.sleep(0.2)
+
+    assert on_expire.mock_calls == [mocker.call(1), mocker.call(3)]
+    assert await buffer.get_all() == [100]
+
+
+async def test_expirable_buffer_expires_duplicates_separately(mocker):
+    on_expire = mocker.AsyncMock()
+    buffer = ExpirableBuffer(SimpleBuffer(), lambda i: timedelta(seconds=0.1), on_expire)
+    item = object()
+
+    await buffer.put(item)
+    await buffer.put(item)
+    assert await buffer.get() is item
+
+    await asyncio.sleep(0.2)
+
+    on_expire.assert_called_once_with(item)
+    assert buffer.size() == 0
+
+
+async def test_expirable_buffer_expiration_handler_failure(mocker, caplog):
+    on_expire = mocker.Mock(side_effect=[ZeroDivisionError(), None])
+    buffer = ExpirableBuffer(SimpleBuffer(), lambda i: timedelta(), on_expire)
+
+    await buffer.put_all(["a", "b"])
+    await asyncio.sleep(0.01)
+
+    assert on_expire.mock_calls == [mocker.call("a"), mocker.call("b")]
+    assert "Handling expiration of `'a'` failed!" in caplog.text
+    assert buffer.size() == 0
+
+
 async def test_background_fill_buffer_start_stop(mocked_buffer, mocker):
     fill_func = mocker.AsyncMock()
     buffer = BackgroundFillBuffer(
@@ -0,0 +1,106 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Union
+
+from golem.managers import (
+    DefaultAgreementManager,
+    DefaultPaymentManager,
+    DefaultProposalManager,
+    NegotiatingPlugin,
+    PaymentPlatformNegotiator,
+    RefreshingDemandManager,
+    SequentialWorkManager,
+    SingleUseActivityManager,
+    WorkContext,
+)
+from golem.payload import VmPayload
+from golem.utils.asyncio import run_in_virtual_time
+from golem.utils.clock import SystemClock, get_clock, utc_now
+from tests.simulator import SimulatorConfig, YagnaSimulator, generate_providers
+
+PAYLOAD = VmPayload(package_url="hash:sha3:0123456789abcdef:http://127.0.0.1/image.gvmi")
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def test_virtual_time_sleep_and_clock():
+    async def main():
+        loop = asyncio.get_running_loop()
+        assert utc_now() == START
+
+        await asyncio.gather(asyncio.sleep(3600), asyncio.sleep(24 * 3600))
+
+        assert loop.time() == 24 * 3600
+        assert utc_now() == START + timedelta(days=1)
+
+        return "done"
+
+    wall_start = time.monotonic()
+    assert run_in_virtual_time(main(), start=START) == "done"
+    assert time.monotonic() - wall_start < 1
+    assert isinstance(get_clock(), SystemClock)
+
+
+def test_virtual_time_timeouts_order():
+    async def main():
+        events: List[Union[int, timedelta]] = []
+
+        async def _append_after(value: int, delay: float):
+            await asyncio.sleep(delay)
+            events.append(value)
+
+        await asyncio.gather(*(_append_after(value, 60 * value) for value in (3, 1, 2)))
+
+        try:
+            await asyncio.wait_for(asyncio.sleep(3600), timeout=30)
+        except asyncio.TimeoutError:
+            events.append(utc_now() - START)
+
+        return events
+
+    assert run_in_virtual_time(main(), start=START) == [1, 2, 3, timedelta(minutes=3, seconds=30)]
+
+
+def test_virtual_time_managers_stack():
+    config = SimulatorConfig(
+        providers=generate_providers(5, seed=1, command_time=timedelta(minutes=10)), seed=1
+    )
+
+    async def work(context: WorkContext) -> str:
+        batch = await context.run("echo 'hello golem'")
+        await batch.wait()
+        return batch.events[-1].stdout
+
+    async def main():
+        results = []
+
+        async with YagnaSimulator(config) as yagna:
+            golem = yagna.create_node()
+            payment_manager = DefaultPaymentManager(golem, budget=10.0)
+            demand_manager = RefreshingDemandManager(
+                golem, payment_manager.get_allocation, [PAYLOAD]
+            )
+            proposal_manager = DefaultProposalManager(
+                golem,
+                demand_manager.get_initial_proposal,
+                plugins=[NegotiatingPlugin(proposal_negotiators=[PaymentPlatformNegotiator()])],
+            )
+            agreement_manager = DefaultAgreementManager(golem, proposal_manager.get_draft_proposal)
+            activity_manager = SingleUseActivityManager(golem, agreement_manager.get_agreement)
+            work_manager = SequentialWorkManager(golem, activity_manager.get_activity)
+
+            async with golem:
+                async with payment_manager, demand_manager, proposal_manager, agreement_manager:
+                    while utc_now() - START < timedelta(hours=2):
+                        results.append(await work_manager.do_work(work))
+                        await asyncio.sleep(20 * 60)
+
+            return results, yagna.stats
+
+    results, stats = run_in_virtual_time(main(), start=START)
+
+    assert len(results) == 4
+    assert all(result.result == "hello golem\n" for result in results)
+    #   Demands expire after an hour, so they had to be refreshed
+    assert 2 <= stats.demands
+    assert stats.accepted_invoices == 4